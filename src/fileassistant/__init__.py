@@ -13,12 +13,19 @@ from .config import get_config
 from .database import get_database
 from .utils.logging import get_logger
 
-# Phase 1 components
-from .analyzer import AnalysisResult, FileAnalyzer
-from .classifier import ClassificationResult, FileClassifier
-from .core import FileProcessor, ProcessingResult
-from .mover import FileMover, MoveResult
-from .watcher import FileWatcher
+# Phase 1 components are resolved lazily by __getattr__ below (PEP 562), so
+# importing the package (e.g. for CLI --help) doesn't load the pipeline stack.
+_LAZY_COMPONENTS = {
+    "FileAnalyzer": ".analyzer",
+    "AnalysisResult": ".analyzer",
+    "FileClassifier": ".classifier",
+    "ClassificationResult": ".classifier",
+    "FileMover": ".mover",
+    "MoveResult": ".mover",
+    "FileProcessor": ".core",
+    "ProcessingResult": ".core",
+    "FileWatcher": ".watcher",
+}
 
 __all__ = [
     "get_config",
@@ -39,3 +46,14 @@ __all__ = [
     "FileProcessor",
     "ProcessingResult",
 ]
+
+
+def __getattr__(name: str):
+    """Import Phase 1 components on first access."""
+    module_name = _LAZY_COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    return getattr(importlib.import_module(module_name, __name__), name)
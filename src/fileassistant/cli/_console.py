@@ -0,0 +1,16 @@
+"""Lazily created Rich console shared by the CLI commands."""
+
+from functools import cache
+
+from rich.console import Console
+
+
+@cache
+def console() -> Console:
+    """
+    Get the CLI console, creating it on first use.
+
+    Console() probes the terminal (isatty, encoding, color system), so it is
+    deferred until a command actually prints instead of running on import.
+    """
+    return Console()
@@ -2,10 +2,11 @@
 
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -14,17 +15,21 @@ from rich.progress import (
     TextColumn,
     TimeElapsedColumn,
 )
+from sqlalchemy import select
 
 from ..analyzer import FileAnalyzer, get_supported_extensions
 from ..config import get_config_manager
 from ..database import File, FileStatus, get_database
 from ..embeddings import EmbeddingGenerator
-from ..search import IndexManager
+from ..search import IndexManager, IndexRecord
 from ..utils.logging import get_logger
+from ._console import console
 
-console = Console()
 logger = get_logger(__name__)
 
+# Files embedded and upserted together; large enough to fill the model's batches
+_INDEX_BATCH_SIZE = 128
+
 # Additional extensions for code/config files that can be indexed
 # These are plain text files that the PlainTextExtractor could handle
 INDEXABLE_EXTENSIONS = {
@@ -199,7 +204,7 @@ def index_command(
         fileassistant index ~/Projects --force
         fileassistant index ./folder --no-recursive --dry-run
     """
-    console.print("\n[bold cyan]FileAssistant File Indexer[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant File Indexer[/bold cyan]\n")
 
     start_time = time.time()
 
@@ -210,40 +215,40 @@ def index_command(
 
         # Get supported extensions
         extensions = get_indexable_extensions()
-        console.print(f"[cyan]Scanning:[/cyan] {path}")
-        console.print(f"[cyan]Recursive:[/cyan] {'Yes' if recursive else 'No'}")
-        console.print(f"[cyan]Max file size:[/cyan] {max_size} MB")
-        console.print(f"[cyan]Force re-index:[/cyan] {'Yes' if force else 'No'}")
+        console().print(f"[cyan]Scanning:[/cyan] {path}")
+        console().print(f"[cyan]Recursive:[/cyan] {'Yes' if recursive else 'No'}")
+        console().print(f"[cyan]Max file size:[/cyan] {max_size} MB")
+        console().print(f"[cyan]Force re-index:[/cyan] {'Yes' if force else 'No'}")
         if dry_run:
-            console.print("[yellow]DRY RUN - no files will be indexed[/yellow]")
-        console.print()
+            console().print("[yellow]DRY RUN - no files will be indexed[/yellow]")
+        console().print()
 
         # Collect files
-        console.print("[cyan]Scanning for files...[/cyan]")
+        console().print("[cyan]Scanning for files...[/cyan]")
         files = collect_files(path, recursive, max_size, extensions)
 
         if not files:
-            console.print("[yellow]No supported files found.[/yellow]")
-            console.print(f"\n[dim]Supported extensions: {', '.join(sorted(extensions))}[/dim]")
+            console().print("[yellow]No supported files found.[/yellow]")
+            console().print(f"\n[dim]Supported extensions: {', '.join(sorted(extensions))}[/dim]")
             return
 
-        console.print(f"[green]Found {len(files)} file(s)[/green]\n")
+        console().print(f"[green]Found {len(files)} file(s)[/green]\n")
 
         if dry_run:
             # Show what would be indexed
-            console.print("[bold]Files that would be indexed:[/bold]")
+            console().print("[bold]Files that would be indexed:[/bold]")
             for f in files[:50]:  # Show first 50
-                console.print(f"  • {f.relative_to(path) if f.is_relative_to(path) else f}")
+                console().print(f"  • {f.relative_to(path) if f.is_relative_to(path) else f}")
             if len(files) > 50:
-                console.print(f"  ... and {len(files) - 50} more files")
+                console().print(f"  ... and {len(files) - 50} more files")
 
             elapsed = time.time() - start_time
-            console.print(f"\n[green]Dry run complete.[/green] {len(files)} files would be indexed.")
-            console.print(f"[dim]Elapsed: {elapsed:.1f}s[/dim]")
+            console().print(f"\n[green]Dry run complete.[/green] {len(files)} files would be indexed.")
+            console().print(f"[dim]Elapsed: {elapsed:.1f}s[/dim]")
             return
 
         # Initialize components
-        console.print("[cyan]Initializing...[/cyan]")
+        console().print("[cyan]Initializing...[/cyan]")
 
         # Initialize database
         db = get_database(config.database.path)
@@ -263,7 +268,7 @@ def index_command(
         # Initialize index manager
         index_manager = IndexManager(persist_directory=config.database.vector_store_path)
 
-        console.print("[green]✓ Components initialized[/green]\n")
+        console().print("[green]✓ Components initialized[/green]\n")
 
         # Stats
         stats = {
@@ -281,52 +286,66 @@ def index_command(
             BarColumn(),
             MofNCompleteColumn(),
             TimeElapsedColumn(),
-            console=console,
+            console=console(),
         ) as progress:
             task = progress.add_task("[cyan]Indexing files...", total=len(files))
 
-            for file_path in files:
-                try:
-                    # Generate file ID
-                    file_id = f"file_{hash(str(file_path.resolve())) & 0xffffffff:08x}"
-
-                    # Check if already indexed (unless force)
-                    if not force:
-                        # Read file to compute hash for change detection
-                        text, error = extract_text_for_indexing(file_path, analyzer)
-                        if text:
-                            content_hash = IndexManager.compute_content_hash(text)
-                            if index_manager.is_indexed(file_id, content_hash):
-                                stats["already_indexed"] += 1
-                                progress.advance(task)
-                                continue
+            # Files whose text is extracted, waiting to be embedded and stored
+            pending: list[tuple[Path, str, str, str]] = []
+            # The batch being embedded on the worker thread, at most one
+            in_flight: list[tuple[list, dict, list, Future]] = []
+
+            # Start embedding the pending batch, then store the previous one
+            def submit_pending():
+                if not pending:
+                    return
+                batch = pending[:]
+                pending.clear()
+
+                # Reuse embeddings of content indexed under another path (moved or
+                # copied files); --force always runs the model again
+                cached = (
+                    {}
+                    if force
+                    else index_manager.lookup_cached_embeddings([item[3] for item in batch])
+                )
+                to_embed = [item for item in batch if item[3] not in cached]
+                future = embedder.submit(
+                    embedding_generator.generate_batch, [item[2] for item in to_embed]
+                )
+
+                # The model works on this batch while the previous one is stored and
+                # the next one extracted; index and session stay on this thread
+                store_in_flight()
+                in_flight.append((batch, cached, to_embed, future))
+
+            def store_in_flight():
+                if not in_flight:
+                    return
+                batch, cached, to_embed, future = in_flight.pop()
+                embedding_results = {
+                    item[3]: result
+                    for item, result in zip(to_embed, future.result(), strict=True)
+                }
+
+                records = []
+                for file_path, file_id, text, content_hash in batch:
+                    if content_hash in cached:
+                        embedding = cached[content_hash]
                     else:
-                        text, error = extract_text_for_indexing(file_path, analyzer)
-
-                    if error or not text:
-                        stats["errors"] += 1
-                        errors.append((file_path, error or "Empty content"))
-                        progress.advance(task)
-                        continue
-
-                    if not text.strip():
-                        stats["skipped"] += 1
-                        progress.advance(task)
-                        continue
-
-                    # Generate embedding
-                    embedding_result = embedding_generator.generate(text)
-                    if not embedding_result.success:
-                        stats["errors"] += 1
-                        errors.append((file_path, f"Embedding failed: {embedding_result.error_message}"))
-                        progress.advance(task)
-                        continue
+                        embedding_result = embedding_results[content_hash]
+                        if not embedding_result.success:
+                            stats["errors"] += 1
+                            errors.append(
+                                (file_path, f"Embedding failed: {embedding_result.error_message}")
+                            )
+                            continue
+                        embedding = embedding_result.embedding
 
                     # Get file stats
                     try:
                         file_stat = file_path.stat()
                         size_bytes = file_stat.st_size
-                        from datetime import datetime
                         created_at = datetime.fromtimestamp(file_stat.st_ctime)
                         modified_at = datetime.fromtimestamp(file_stat.st_mtime)
                     except OSError:
@@ -334,94 +353,143 @@ def index_command(
                         created_at = None
                         modified_at = None
 
-                    # Index the file
-                    success = index_manager.index_file(
-                        file_id=file_id,
-                        file_path=file_path,
-                        text=text,
-                        embedding=embedding_result.embedding,
-                        content_summary=text[:500],
-                        file_type="document",
-                        created_at=created_at,
-                        modified_at=modified_at,
-                        size_bytes=size_bytes,
+                    records.append(
+                        IndexRecord(
+                            file_id=file_id,
+                            file_path=file_path,
+                            text=text,
+                            embedding=embedding,
+                            content_summary=text[:500],
+                            file_type="document",
+                            created_at=created_at,
+                            modified_at=modified_at,
+                            size_bytes=size_bytes,
+                            content_hash=content_hash,
+                        )
                     )
 
-                    if not success:
-                        stats["errors"] += 1
-                        errors.append((file_path, "Failed to store in index"))
-                        progress.advance(task)
-                        continue
-
-                    # Register in SQLite files table if not exists
-                    existing_file = (
-                        session.query(File)
-                        .filter(File.path == str(file_path.resolve()))
-                        .first()
+                # Index the files with one upsert
+                if records and not index_manager.index_files(records):
+                    stats["errors"] += len(records)
+                    errors.extend(
+                        (record.file_path, "Failed to store in index") for record in records
                     )
-                    if not existing_file:
-                        new_file = File(
-                            path=str(file_path.resolve()),
-                            filename=file_path.name,
-                            extension=file_path.suffix.lower(),
-                            status=FileStatus.PROCESSED.value,
-                            embedding_id=file_id,
+                    records = []
+
+                # Register in SQLite files table if not exists
+                try:
+                    paths = [str(record.file_path.resolve()) for record in records]
+                    existing = set(session.scalars(select(File.path).where(File.path.in_(paths))))
+                    for record, resolved in zip(records, paths, strict=True):
+                        if resolved in existing:
+                            continue
+                        existing.add(resolved)
+                        session.add(
+                            File(
+                                path=resolved,
+                                filename=record.file_path.name,
+                                extension=record.file_path.suffix.lower(),
+                                status=FileStatus.PROCESSED,
+                                embedding_id=record.file_id,
+                            )
                         )
-                        session.add(new_file)
+                    stats["indexed"] += len(records)
+                except Exception as e:
+                    logger.exception(f"Error registering {len(records)} indexed file(s)")
+                    stats["errors"] += len(records)
+                    errors.extend((record.file_path, str(e)) for record in records)
 
-                    stats["indexed"] += 1
-                    progress.advance(task)
+                progress.advance(task, len(batch))
 
-                except Exception as e:
-                    stats["errors"] += 1
-                    errors.append((file_path, str(e)))
-                    logger.exception(f"Error indexing {file_path}")
-                    progress.advance(task)
+            embedder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+            try:
+                for file_path in files:
+                    try:
+                        # Generate file ID
+                        file_id = f"file_{hash(str(file_path.resolve())) & 0xffffffff:08x}"
+
+                        # Read file and hash it for change detection
+                        text, error = extract_text_for_indexing(file_path, analyzer)
+                        content_hash = IndexManager.compute_content_hash(text) if text else ""
+
+                        # Check if already indexed (unless force)
+                        if not force and text and index_manager.is_indexed(file_id, content_hash):
+                            stats["already_indexed"] += 1
+                            progress.advance(task)
+                            continue
+
+                        if error or not text:
+                            stats["errors"] += 1
+                            errors.append((file_path, error or "Empty content"))
+                            progress.advance(task)
+                            continue
+
+                        if not text.strip():
+                            stats["skipped"] += 1
+                            progress.advance(task)
+                            continue
+
+                        # Embed and store files in batches
+                        pending.append((file_path, file_id, text, content_hash))
+
+                    except Exception as e:
+                        stats["errors"] += 1
+                        errors.append((file_path, str(e)))
+                        logger.exception(f"Error indexing {file_path}")
+                        progress.advance(task)
+
+                    if len(pending) >= _INDEX_BATCH_SIZE:
+                        submit_pending()
+
+                submit_pending()
+                store_in_flight()
+            finally:
+                embedder.shutdown(cancel_futures=True)
 
             # Commit database changes
             session.commit()
 
         # Summary
         elapsed = time.time() - start_time
-        console.print()
-        console.print("[bold cyan]Indexing Summary[/bold cyan]")
-        console.print(f"  [green]Indexed:[/green]        {stats['indexed']}")
-        console.print(f"  [yellow]Already indexed:[/yellow] {stats['already_indexed']}")
-        console.print(f"  [dim]Skipped (empty):[/dim] {stats['skipped']}")
-        console.print(f"  [red]Errors:[/red]          {stats['errors']}")
-        console.print(f"  [dim]Time elapsed:[/dim]    {elapsed:.1f}s")
+        console().print()
+        console().print("[bold cyan]Indexing Summary[/bold cyan]")
+        console().print(f"  [green]Indexed:[/green]        {stats['indexed']}")
+        console().print(f"  [yellow]Already indexed:[/yellow] {stats['already_indexed']}")
+        console().print(f"  [dim]Skipped (empty):[/dim] {stats['skipped']}")
+        console().print(f"  [red]Errors:[/red]          {stats['errors']}")
+        console().print(f"  [dim]Time elapsed:[/dim]    {elapsed:.1f}s")
 
         # Show errors if any
         if errors and len(errors) <= 10:
-            console.print("\n[red]Errors:[/red]")
+            console().print("\n[red]Errors:[/red]")
             for file_path, error in errors:
-                console.print(f"  • {file_path.name}: {error[:60]}")
+                console().print(f"  • {file_path.name}: {error[:60]}")
         elif errors:
-            console.print(f"\n[red]{len(errors)} errors occurred. Check logs for details.[/red]")
+            console().print(f"\n[red]{len(errors)} errors occurred. Check logs for details.[/red]")
 
         # Get total indexed count
         total_indexed = index_manager.get_indexed_count()
-        console.print(f"\n[bold]Total files in index:[/bold] {total_indexed}")
+        console().print(f"\n[bold]Total files in index:[/bold] {total_indexed}")
 
         # Suggest search if files were indexed
         if stats["indexed"] > 0 or total_indexed > 0:
-            console.print(
+            console().print(
                 "\n[green]✓ Indexing complete![/green] "
                 'Try: [cyan]fileassistant search "your query"[/cyan]'
             )
         else:
-            console.print("\n[yellow]No files were indexed.[/yellow]")
+            console().print("\n[yellow]No files were indexed.[/yellow]")
 
         # Cleanup
         index_manager.close()
         session.close()
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Index command error")
         sys.exit(1)
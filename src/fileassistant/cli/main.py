@@ -7,14 +7,13 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.table import Table
 
 from ..config import get_config_manager
 from ..database import get_database, initialize_migrations
 from ..utils.logging import get_logger, setup_logging
+from ._console import console
 
-console = Console()
 logger = get_logger(__name__)
 
 
@@ -51,7 +50,7 @@ def init(ctx, db_path: Path | None):
     This command sets up the database schema and creates a default configuration
     file if one doesn't exist.
     """
-    console.print("\n[bold cyan]FileAssistant Initialization[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant Initialization[/bold cyan]\n")
 
     try:
         # Load or create config
@@ -62,9 +61,9 @@ def init(ctx, db_path: Path | None):
         if config_manager.config_path is None:
             default_config_path = Path("config/default_config.yaml")
             config_manager.save(config, default_config_path)
-            console.print(f"✓ Created default configuration: [green]{default_config_path}[/green]")
+            console().print(f"✓ Created default configuration: [green]{default_config_path}[/green]")
         else:
-            console.print(
+            console().print(
                 f"✓ Loaded configuration from: [green]{config_manager.config_path}[/green]"
             )
 
@@ -80,31 +79,31 @@ def init(ctx, db_path: Path | None):
 
         # Initialize database
         final_db_path = db_path or config.database.path
-        console.print(f"\n[cyan]Initializing database:[/cyan] {final_db_path}")
+        console().print(f"\n[cyan]Initializing database:[/cyan] {final_db_path}")
 
         db = get_database(final_db_path)
         db.create_all_tables()
-        console.print("✓ Created database tables")
+        console().print("✓ Created database tables")
 
         # Run migrations
         migration_manager = initialize_migrations(db)
         migration_manager.apply_migrations()
-        console.print("✓ Applied database migrations")
+        console().print("✓ Applied database migrations")
 
         # Create necessary directories
         config.database.path.parent.mkdir(parents=True, exist_ok=True)
         config.database.vector_store_path.mkdir(parents=True, exist_ok=True)
         config.logging.log_dir.mkdir(parents=True, exist_ok=True)
-        console.print("✓ Created data directories")
+        console().print("✓ Created data directories")
 
-        console.print("\n[bold green]✓ Initialization complete![/bold green]")
-        console.print("\n[cyan]Next steps:[/cyan]")
-        console.print("  1. Review configuration: [yellow]fileassistant config show[/yellow]")
-        console.print("  2. Edit if needed: [yellow]fileassistant config edit[/yellow]")
-        console.print("  3. Check status: [yellow]fileassistant status[/yellow]")
+        console().print("\n[bold green]✓ Initialization complete![/bold green]")
+        console().print("\n[cyan]Next steps:[/cyan]")
+        console().print("  1. Review configuration: [yellow]fileassistant config show[/yellow]")
+        console().print("  2. Edit if needed: [yellow]fileassistant config edit[/yellow]")
+        console().print("  3. Check status: [yellow]fileassistant status[/yellow]")
 
     except Exception as e:
-        console.print(f"\n[bold red]✗ Initialization failed:[/bold red] {e}")
+        console().print(f"\n[bold red]✗ Initialization failed:[/bold red] {e}")
         logger.exception("Initialization error")
         sys.exit(1)
 
@@ -117,7 +116,7 @@ def status(ctx):
 
     Displays information about processed files, pending items, and system state.
     """
-    console.print("\n[bold cyan]FileAssistant Status[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant Status[/bold cyan]\n")
 
     try:
         # Load config
@@ -170,29 +169,31 @@ def status(ctx):
         table.add_row("  └─ Pending Review", str(pending_classifications))
         table.add_row("Total Actions", str(total_actions))
 
-        console.print(table)
+        console().print(table)
 
         # Configuration info
-        console.print(f"\n[cyan]Database:[/cyan] {config.database.path}")
-        console.print(f"[cyan]Config:[/cyan] {config_manager.config_path}")
-        console.print(
+        console().print(f"\n[cyan]Database:[/cyan] {config.database.path}")
+        console().print(f"[cyan]Config:[/cyan] {config_manager.config_path}")
+        console().print(
             f"[cyan]Auto-processing:[/cyan] {'[green]Enabled[/green]' if config.auto_process_enabled else '[yellow]Disabled[/yellow]'}"
         )
 
         # Inbox folders
-        console.print("\n[cyan]Monitored Folders:[/cyan]")
+        console().print("\n[cyan]Monitored Folders:[/cyan]")
+        folder_lines = []
         for folder in config.inbox_folders:
-            exists = "✓" if folder.exists() else "✗"
-            color = "green" if folder.exists() else "red"
-            console.print(f"  [{color}]{exists}[/{color}] {folder}")
+            exists = folder.exists()
+            color = "green" if exists else "red"
+            folder_lines.append(f"  [{color}]{'✓' if exists else '✗'}[/{color}] {folder}")
+        console().print("\n".join(folder_lines))
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Status command error")
         sys.exit(1)
 
@@ -207,58 +208,57 @@ def config_group():
 @click.pass_context
 def config_show(ctx):
     """Display current configuration."""
-    console.print("\n[bold cyan]FileAssistant Configuration[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant Configuration[/bold cyan]\n")
 
     try:
         config_manager = get_config_manager(ctx.obj.get("config_path"))
         config = config_manager.load()
 
         # Display config sections
-        console.print("[bold]Inbox Folders:[/bold]")
-        for folder in config.inbox_folders:
-            console.print(f"  • {folder}")
-
-        console.print("\n[bold]Organized Files:[/bold]")
-        console.print(f"  Base Path: {config.organized_base_path}")
-
-        console.print("\n[bold]Confidence Thresholds:[/bold]")
-        console.print(f"  High:   {config.confidence_thresholds.high}")
-        console.print(f"  Medium: {config.confidence_thresholds.medium}")
-        console.print(f"  Low:    {config.confidence_thresholds.low}")
-
-        console.print("\n[bold]Processing Settings:[/bold]")
-        console.print(f"  Idle Only: {config.processing.idle_only}")
-        console.print(f"  Debounce: {config.processing.debounce_seconds}s")
-        console.print(f"  Max File Size: {config.processing.max_file_size_mb}MB")
-        console.print(f"  Batch Size: {config.processing.batch_size}")
-
-        console.print("\n[bold]AI Settings:[/bold]")
-        console.print(f"  Model: {config.ai_settings.model_name}")
-        console.print(f"  Embedding Model: {config.ai_settings.embedding_model}")
-        console.print(f"  Temperature: {config.ai_settings.temperature}")
-        console.print(f"  Ollama URL: {config.ai_settings.ollama_base_url}")
-
-        console.print("\n[bold]Database:[/bold]")
-        console.print(f"  Path: {config.database.path}")
-        console.print(f"  Vector Store: {config.database.vector_store_path}")
-
-        console.print("\n[bold]Feature Flags:[/bold]")
-        console.print(
+        console().print("[bold]Inbox Folders:[/bold]")
+        console().print("\n".join(f"  • {folder}" for folder in config.inbox_folders))
+
+        console().print("\n[bold]Organized Files:[/bold]")
+        console().print(f"  Base Path: {config.organized_base_path}")
+
+        console().print("\n[bold]Confidence Thresholds:[/bold]")
+        console().print(f"  High:   {config.confidence_thresholds.high}")
+        console().print(f"  Medium: {config.confidence_thresholds.medium}")
+        console().print(f"  Low:    {config.confidence_thresholds.low}")
+
+        console().print("\n[bold]Processing Settings:[/bold]")
+        console().print(f"  Idle Only: {config.processing.idle_only}")
+        console().print(f"  Debounce: {config.processing.debounce_seconds}s")
+        console().print(f"  Max File Size: {config.processing.max_file_size_mb}MB")
+        console().print(f"  Batch Size: {config.processing.batch_size}")
+
+        console().print("\n[bold]AI Settings:[/bold]")
+        console().print(f"  Model: {config.ai_settings.model_name}")
+        console().print(f"  Embedding Model: {config.ai_settings.embedding_model}")
+        console().print(f"  Temperature: {config.ai_settings.temperature}")
+        console().print(f"  Ollama URL: {config.ai_settings.ollama_base_url}")
+
+        console().print("\n[bold]Database:[/bold]")
+        console().print(f"  Path: {config.database.path}")
+        console().print(f"  Vector Store: {config.database.vector_store_path}")
+
+        console().print("\n[bold]Feature Flags:[/bold]")
+        console().print(
             f"  Auto-processing: {'[green]Enabled[/green]' if config.auto_process_enabled else '[yellow]Disabled[/yellow]'}"
         )
-        console.print(
+        console().print(
             f"  Learning: {'[green]Enabled[/green]' if config.learning_enabled else '[yellow]Disabled[/yellow]'}"
         )
 
-        console.print(f"\n[dim]Config file: {config_manager.config_path}[/dim]")
+        console().print(f"\n[dim]Config file: {config_manager.config_path}[/dim]")
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Config show error")
         sys.exit(1)
 
@@ -276,15 +276,15 @@ def config_edit(ctx):
             config_path = config_manager.config_path
         except FileNotFoundError:
             # Create default config
-            console.print("[yellow]No config found. Creating default...[/yellow]")
+            console().print("[yellow]No config found. Creating default...[/yellow]")
             default_path = Path("config/default_config.yaml")
             config = config_manager.load(create_if_missing=True)
             config_manager.save(config, default_path)
             config_path = default_path
-            console.print(f"[green]✓ Created:[/green] {config_path}")
+            console().print(f"[green]✓ Created:[/green] {config_path}")
 
         # Open in editor
-        console.print(f"[cyan]Opening config file:[/cyan] {config_path}")
+        console().print(f"[cyan]Opening config file:[/cyan] {config_path}")
 
         # Determine editor based on platform
         if platform.system() == "Windows":
@@ -295,10 +295,10 @@ def config_edit(ctx):
             editor = os.environ.get("EDITOR", "nano")
             subprocess.run([editor, config_path])
 
-        console.print("[green]✓ Config file opened[/green]")
+        console().print("[green]✓ Config file opened[/green]")
 
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Config edit error")
         sys.exit(1)
 
@@ -325,7 +325,7 @@ def watch(ctx, folder: tuple[Path, ...]):
     """
     from ..watcher import FileWatcher, SUPPORTED_EXTENSIONS
 
-    console.print("\n[bold cyan]FileAssistant File Watcher[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant File Watcher[/bold cyan]\n")
 
     try:
         config_manager = get_config_manager(ctx.obj.get("config_path"))
@@ -335,15 +335,15 @@ def watch(ctx, folder: tuple[Path, ...]):
         if folder:
             config.inbox_folders = list(folder)
 
-        console.print(f"[cyan]Supported extensions:[/cyan] {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
-        console.print(f"[cyan]Debounce delay:[/cyan] {config.processing.debounce_seconds}s\n")
+        console().print(f"[cyan]Supported extensions:[/cyan] {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
+        console().print(f"[cyan]Debounce delay:[/cyan] {config.processing.debounce_seconds}s\n")
 
-        console.print("[cyan]Watching folders:[/cyan]")
+        console().print("[cyan]Watching folders:[/cyan]")
         for f in config.inbox_folders:
             exists = "✓" if f.exists() else "✗ (will create)"
-            console.print(f"  • {f} {exists}")
+            console().print(f"  • {f} {exists}")
 
-        console.print("\n[yellow]Press Ctrl+C to stop watching[/yellow]\n")
+        console().print("\n[yellow]Press Ctrl+C to stop watching[/yellow]\n")
 
         # Counter for files detected
         file_count = [0]
@@ -351,7 +351,7 @@ def watch(ctx, folder: tuple[Path, ...]):
         def on_file_ready(file_path: Path):
             """Callback when a file is ready for processing."""
             file_count[0] += 1
-            console.print(
+            console().print(
                 f"[green]File ready:[/green] {file_path.name} "
                 f"[dim]({file_path.stat().st_size / 1024:.1f} KB)[/dim]"
             )
@@ -361,31 +361,31 @@ def watch(ctx, folder: tuple[Path, ...]):
         # Scan for existing files first
         existing = watcher.scan_existing()
         if existing:
-            console.print(f"[cyan]Found {len(existing)} existing file(s):[/cyan]")
+            console().print(f"[cyan]Found {len(existing)} existing file(s):[/cyan]")
             for f in existing[:10]:  # Show first 10
-                console.print(f"  • {f.name}")
+                console().print(f"  • {f.name}")
             if len(existing) > 10:
-                console.print(f"  ... and {len(existing) - 10} more")
-            console.print()
+                console().print(f"  ... and {len(existing) - 10} more")
+            console().print()
 
         with watcher:
-            console.print("[green]Watcher started. Waiting for files...[/green]\n")
+            console().print("[green]Watcher started. Waiting for files...[/green]\n")
             try:
                 import time
                 while True:
                     time.sleep(1)
             except KeyboardInterrupt:
-                console.print("\n[yellow]Stopping watcher...[/yellow]")
+                console().print("\n[yellow]Stopping watcher...[/yellow]")
 
-        console.print(f"\n[green]✓ Watcher stopped. Detected {file_count[0]} new file(s).[/green]")
+        console().print(f"\n[green]✓ Watcher stopped. Detected {file_count[0]} new file(s).[/green]")
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Watch command error")
         sys.exit(1)
 
@@ -402,11 +402,11 @@ def analyze(file_path: Path, show_content: bool, preview_length: int):
     """
     from ..analyzer import FileAnalyzer, get_supported_extensions
 
-    console.print("\n[bold cyan]FileAssistant File Analyzer[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant File Analyzer[/bold cyan]\n")
 
     supported = get_supported_extensions()
     if file_path.suffix.lower() not in supported:
-        console.print(
+        console().print(
             f"[yellow]⚠ Unsupported file type:[/yellow] {file_path.suffix}\n"
             f"[dim]Supported: {', '.join(sorted(supported))}[/dim]"
         )
@@ -416,12 +416,12 @@ def analyze(file_path: Path, show_content: bool, preview_length: int):
     result = analyzer.analyze(file_path)
 
     if not result.success:
-        console.print(f"[bold red]✗ Analysis failed:[/bold red] {result.error_message}")
+        console().print(f"[bold red]✗ Analysis failed:[/bold red] {result.error_message}")
         sys.exit(1)
 
     # Display results
-    console.print(f"[bold]File:[/bold] {result.file_path.name}")
-    console.print(f"[bold]Path:[/bold] {result.file_path}")
+    console().print(f"[bold]File:[/bold] {result.file_path.name}")
+    console().print(f"[bold]Path:[/bold] {result.file_path}")
 
     # Metadata table
     table = Table(title="Metadata", show_header=True, header_style="bold cyan")
@@ -434,26 +434,26 @@ def analyze(file_path: Path, show_content: bool, preview_length: int):
     table.add_row("Modified", result.metadata.modified_at.strftime("%Y-%m-%d %H:%M:%S"))
     table.add_row("MD5 Hash", result.metadata.hash_md5)
 
-    console.print()
-    console.print(table)
+    console().print()
+    console().print(table)
 
     # Content stats
-    console.print(f"\n[bold]Content Stats:[/bold]")
-    console.print(f"  Words: {result.word_count:,}")
-    console.print(f"  Lines: {result.line_count:,}")
-    console.print(f"  Characters: {len(result.content):,}")
+    console().print(f"\n[bold]Content Stats:[/bold]")
+    console().print(f"  Words: {result.word_count:,}")
+    console().print(f"  Lines: {result.line_count:,}")
+    console().print(f"  Characters: {len(result.content):,}")
 
     # Content preview
     if show_content or preview_length > 0:
-        console.print(f"\n[bold]Content Preview:[/bold]")
+        console().print(f"\n[bold]Content Preview:[/bold]")
         preview = result.content[:preview_length]
         if len(result.content) > preview_length:
             preview += "\n[dim]... (truncated)[/dim]"
-        console.print(f"[dim]{'-' * 60}[/dim]")
-        console.print(preview)
-        console.print(f"[dim]{'-' * 60}[/dim]")
+        console().print(f"[dim]{'-' * 60}[/dim]")
+        console().print(preview)
+        console().print(f"[dim]{'-' * 60}[/dim]")
 
-    console.print("\n[green]✓ Analysis complete[/green]")
+    console().print("\n[green]✓ Analysis complete[/green]")
 
 
 @cli.command()
@@ -471,12 +471,12 @@ def scan(folder: Path, recursive: bool):
     """
     from ..analyzer import FileAnalyzer, get_supported_extensions
 
-    console.print("\n[bold cyan]FileAssistant Folder Scanner[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant Folder Scanner[/bold cyan]\n")
 
     supported = get_supported_extensions()
-    console.print(f"[cyan]Scanning:[/cyan] {folder}")
-    console.print(f"[cyan]Supported:[/cyan] {', '.join(sorted(supported))}")
-    console.print(f"[cyan]Recursive:[/cyan] {'Yes' if recursive else 'No'}\n")
+    console().print(f"[cyan]Scanning:[/cyan] {folder}")
+    console().print(f"[cyan]Supported:[/cyan] {', '.join(sorted(supported))}")
+    console().print(f"[cyan]Recursive:[/cyan] {'Yes' if recursive else 'No'}\n")
 
     # Find all supported files
     files: list[Path] = []
@@ -492,10 +492,10 @@ def scan(folder: Path, recursive: bool):
     files = [f for f in files if not f.name.startswith(".")]
 
     if not files:
-        console.print("[yellow]No supported files found.[/yellow]")
+        console().print("[yellow]No supported files found.[/yellow]")
         return
 
-    console.print(f"[green]Found {len(files)} file(s)[/green]\n")
+    console().print(f"[green]Found {len(files)} file(s)[/green]\n")
 
     # Analyze each file
     analyzer = FileAnalyzer()
@@ -534,8 +534,8 @@ def scan(folder: Path, recursive: bool):
                 f"[red]✗[/red] {result.error_message[:20]}...",
             )
 
-    console.print(table)
-    console.print(f"\n[green]✓ Scan complete:[/green] {success_count} succeeded, {error_count} failed")
+    console().print(table)
+    console().print(f"\n[green]✓ Scan complete:[/green] {success_count} succeeded, {error_count} failed")
 
 
 # =============================================================================
@@ -559,12 +559,12 @@ def process(ctx, file_path: Path):
     from ..core import FileProcessor
     from ..database import get_database
 
-    console.print("\n[bold cyan]FileAssistant File Processor[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant File Processor[/bold cyan]\n")
 
     # Check file type
     supported = get_supported_extensions()
     if file_path.suffix.lower() not in supported:
-        console.print(
+        console().print(
             f"[yellow]⚠ Unsupported file type:[/yellow] {file_path.suffix}\n"
             f"[dim]Supported: {', '.join(sorted(supported))}[/dim]"
         )
@@ -585,35 +585,36 @@ def process(ctx, file_path: Path):
         # Check system readiness
         is_ready, issues = processor.check_system_ready()
         if not is_ready:
-            console.print("[bold red]System not ready:[/bold red]")
+            console().print("[bold red]System not ready:[/bold red]")
             for issue in issues:
-                console.print(f"  • {issue}")
-            console.print("\n[yellow]Please fix the issues above and try again.[/yellow]")
+                console().print(f"  • {issue}")
+            console().print("\n[yellow]Please fix the issues above and try again.[/yellow]")
             sys.exit(1)
 
         # Process the file
         result = processor.process_file(file_path, interactive=True)
 
         # Summary
-        console.print()
+        console().print()
         if result.success:
-            console.print("[bold green]✓ File processed successfully![/bold green]")
-            console.print(f"  Final location: {result.move_result.destination_path}")
+            console().print("[bold green]✓ File processed successfully![/bold green]")
+            console().print(f"  Final location: {result.move_result.destination_path}")
         elif result.skipped:
-            console.print("[bold yellow]File skipped by user[/bold yellow]")
+            console().print("[bold yellow]File skipped by user[/bold yellow]")
         else:
-            console.print(f"[bold red]✗ Processing failed:[/bold red] {result.error_message}")
+            console().print(f"[bold red]✗ Processing failed:[/bold red] {result.error_message}")
             sys.exit(1)
 
+        processor.close()
         session.close()
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Process command error")
         sys.exit(1)
 
@@ -647,7 +648,7 @@ def run_pipeline(ctx, folder: tuple[Path, ...]):
     from ..database import get_database
     from ..watcher import FileWatcher, SUPPORTED_EXTENSIONS
 
-    console.print("\n[bold cyan]FileAssistant - Full Pipeline Mode[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant - Full Pipeline Mode[/bold cyan]\n")
 
     try:
         config_manager = get_config_manager(ctx.obj.get("config_path"))
@@ -666,26 +667,26 @@ def run_pipeline(ctx, folder: tuple[Path, ...]):
         processor = FileProcessor(config=config, db_session=session)
 
         # Check system readiness
-        console.print("[cyan]Checking system readiness...[/cyan]")
+        console().print("[cyan]Checking system readiness...[/cyan]")
         is_ready, issues = processor.check_system_ready()
         if not is_ready:
-            console.print("[bold red]System not ready:[/bold red]")
+            console().print("[bold red]System not ready:[/bold red]")
             for issue in issues:
-                console.print(f"  • {issue}")
-            console.print("\n[yellow]Please fix the issues above and try again.[/yellow]")
+                console().print(f"  • {issue}")
+            console().print("\n[yellow]Please fix the issues above and try again.[/yellow]")
             sys.exit(1)
-        console.print("[green]✓ System ready[/green]\n")
+        console().print("[green]✓ System ready[/green]\n")
 
         # Display configuration
-        console.print(f"[cyan]AI Model:[/cyan] {config.ai_settings.model_name}")
-        console.print(f"[cyan]Organized files:[/cyan] {config.organized_base_path}")
-        console.print(f"[cyan]Supported extensions:[/cyan] {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
-        console.print(f"[cyan]Debounce delay:[/cyan] {config.processing.debounce_seconds}s\n")
+        console().print(f"[cyan]AI Model:[/cyan] {config.ai_settings.model_name}")
+        console().print(f"[cyan]Organized files:[/cyan] {config.organized_base_path}")
+        console().print(f"[cyan]Supported extensions:[/cyan] {', '.join(sorted(SUPPORTED_EXTENSIONS))}")
+        console().print(f"[cyan]Debounce delay:[/cyan] {config.processing.debounce_seconds}s\n")
 
-        console.print("[cyan]Watching folders:[/cyan]")
+        console().print("[cyan]Watching folders:[/cyan]")
         for f in config.inbox_folders:
             exists = "✓" if f.exists() else "✗ (will create)"
-            console.print(f"  • {f} {exists}")
+            console().print(f"  • {f} {exists}")
 
         # File processing queue
         file_queue: queue.Queue[Path] = queue.Queue()
@@ -693,7 +694,7 @@ def run_pipeline(ctx, folder: tuple[Path, ...]):
 
         def on_file_ready(file_path: Path):
             """Callback when a file is ready for processing."""
-            console.print(f"\n[green]New file detected:[/green] {file_path.name}")
+            console().print(f"\n[green]New file detected:[/green] {file_path.name}")
             file_queue.put(file_path)
 
         # Create watcher
@@ -702,14 +703,14 @@ def run_pipeline(ctx, folder: tuple[Path, ...]):
         # Check for existing files
         existing = watcher.scan_existing()
         if existing:
-            console.print(f"\n[cyan]Found {len(existing)} existing file(s) to process[/cyan]")
+            console().print(f"\n[cyan]Found {len(existing)} existing file(s) to process[/cyan]")
             process_existing = click.confirm("Process existing files?", default=True)
             if process_existing:
                 for f in existing:
                     file_queue.put(f)
 
-        console.print("\n[yellow]Press Ctrl+C to stop[/yellow]")
-        console.print("[green]Watching for new files...[/green]\n")
+        console().print("\n[yellow]Press Ctrl+C to stop[/yellow]")
+        console().print("[green]Watching for new files...[/green]\n")
 
         # Stats
         stats = {"processed": 0, "skipped": 0, "errors": 0}
@@ -722,46 +723,47 @@ def run_pipeline(ctx, folder: tuple[Path, ...]):
                         file_path = file_queue.get(timeout=1.0)
 
                         # Process the file
-                        console.print()
-                        console.rule(f"[bold]Processing: {file_path.name}[/bold]")
+                        console().print()
+                        console().rule(f"[bold]Processing: {file_path.name}[/bold]")
 
                         result = processor.process_file(file_path, interactive=True)
 
                         if result.success:
                             stats["processed"] += 1
-                            console.print(f"[green]✓ Moved to:[/green] {result.move_result.destination_path}")
+                            console().print(f"[green]✓ Moved to:[/green] {result.move_result.destination_path}")
                         elif result.skipped:
                             stats["skipped"] += 1
                         else:
                             stats["errors"] += 1
-                            console.print(f"[red]✗ Error:[/red] {result.error_message}")
+                            console().print(f"[red]✗ Error:[/red] {result.error_message}")
 
-                        console.print()
-                        console.print("[green]Watching for more files...[/green]")
+                        console().print()
+                        console().print("[green]Watching for more files...[/green]")
 
                     except queue.Empty:
                         continue
 
             except KeyboardInterrupt:
-                console.print("\n[yellow]Stopping...[/yellow]")
+                console().print("\n[yellow]Stopping...[/yellow]")
                 stop_event.set()
 
         # Summary
-        console.print()
-        console.print("[bold cyan]Session Summary[/bold cyan]")
-        console.print(f"  Files processed: [green]{stats['processed']}[/green]")
-        console.print(f"  Files skipped:   [yellow]{stats['skipped']}[/yellow]")
-        console.print(f"  Errors:          [red]{stats['errors']}[/red]")
+        console().print()
+        console().print("[bold cyan]Session Summary[/bold cyan]")
+        console().print(f"  Files processed: [green]{stats['processed']}[/green]")
+        console().print(f"  Files skipped:   [yellow]{stats['skipped']}[/yellow]")
+        console().print(f"  Errors:          [red]{stats['errors']}[/red]")
 
+        processor.close()
         session.close()
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Run command error")
         sys.exit(1)
 
@@ -775,9 +777,10 @@ def history(ctx, limit: int):
 
     Displays recently processed files and their destinations.
     """
-    from ..database import Action, ActionType, get_database
+    from ..database import get_database
+    from ..mover import FileMover
 
-    console.print("\n[bold cyan]FileAssistant History[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant History[/bold cyan]\n")
 
     try:
         config_manager = get_config_manager(ctx.obj.get("config_path"))
@@ -787,16 +790,11 @@ def history(ctx, limit: int):
         session = db.get_session()
 
         # Get recent actions
-        actions = (
-            session.query(Action)
-            .filter(Action.action_type == ActionType.MOVE.value)
-            .order_by(Action.timestamp.desc())
-            .limit(limit)
-            .all()
-        )
+        mover = FileMover(organized_base_path=config.organized_base_path, db_session=session)
+        actions = mover.get_recent_actions(limit)
 
         if not actions:
-            console.print("[yellow]No history found.[/yellow]")
+            console().print("[yellow]No history found.[/yellow]")
             return
 
         table = Table(title="Recent Actions", show_header=True, header_style="bold cyan")
@@ -807,10 +805,8 @@ def history(ctx, limit: int):
         table.add_column("Status", style="yellow")
 
         for action in actions:
-            before = action.before_state or {}
-            after = action.after_state or {}
-            filename = before.get("filename", "?")
-            dest = after.get("path", "?")
+            filename = action.filename or "?"
+            dest = action.destination_path or "?"
 
             # Truncate long paths
             if len(dest) > 40:
@@ -819,19 +815,19 @@ def history(ctx, limit: int):
             status = "[dim]undone[/dim]" if action.undone else "[green]✓[/green]"
             time_str = action.timestamp.strftime("%Y-%m-%d %H:%M")
 
-            table.add_row(str(action.id), time_str, filename, dest, status)
+            table.add_row(str(action.action_id), time_str, filename, dest, status)
 
-        console.print(table)
+        console().print(table)
 
         session.close()
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("History command error")
         sys.exit(1)
 
@@ -860,7 +856,7 @@ def undo(ctx, action_id: int):
     from ..database import get_database
     from ..mover import FileMover
 
-    console.print("\n[bold cyan]FileAssistant Undo[/bold cyan]\n")
+    console().print("\n[bold cyan]FileAssistant Undo[/bold cyan]\n")
 
     try:
         config_manager = get_config_manager(ctx.obj.get("config_path"))
@@ -874,24 +870,24 @@ def undo(ctx, action_id: int):
             db_session=session,
         )
 
-        console.print(f"[cyan]Undoing action {action_id}...[/cyan]")
+        console().print(f"[cyan]Undoing action {action_id}...[/cyan]")
         result = mover.undo_move(action_id)
 
         if result.success:
-            console.print(f"[green]✓ File restored to:[/green] {result.destination_path}")
+            console().print(f"[green]✓ File restored to:[/green] {result.destination_path}")
         else:
-            console.print(f"[red]✗ Undo failed:[/red] {result.error_message}")
+            console().print(f"[red]✗ Undo failed:[/red] {result.error_message}")
             sys.exit(1)
 
         session.close()
 
     except FileNotFoundError:
-        console.print(
+        console().print(
             "[yellow]⚠ No configuration found. Run:[/yellow] [cyan]fileassistant init[/cyan]"
         )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        console().print(f"[bold red]✗ Error:[/bold red] {e}")
         logger.exception("Undo command error")
         sys.exit(1)
 
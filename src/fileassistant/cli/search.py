@@ -2,11 +2,11 @@
 
 import json
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -14,24 +14,18 @@ from rich.text import Text
 from ..config import get_config_manager
 from ..search import SearchEngine, SearchResult
 from ..utils.logging import get_logger
+from ._console import console
 
 logger = get_logger(__name__)
-console = Console()
 
 
 def parse_extensions(value: str) -> list[str]:
-    """Parse comma-separated extensions into a list."""
+    """Parse comma-separated extensions into a de-duplicated list."""
     if not value:
         return []
-    # Split on comma, strip whitespace, ensure dot prefix
-    extensions = []
-    for ext in value.split(","):
-        ext = ext.strip().lower()
-        if ext:
-            if not ext.startswith("."):
-                ext = f".{ext}"
-            extensions.append(ext)
-    return extensions
+    # Lowercase once, strip whitespace, ensure dot prefix, dedupe keeping first-seen order
+    parts = (e.strip() for e in value.lower().split(","))
+    return list(dict.fromkeys(e if e.startswith(".") else f".{e}" for e in parts if e))
 
 
 def parse_date(value: str) -> datetime | None:
@@ -92,7 +86,7 @@ def format_result_rich(result: SearchResult, index: int) -> Panel:
     if result.size_bytes:
         info_parts.append(f"Size: {format_file_size(result.size_bytes)}")
     if result.modified_at:
-        info_parts.append(f"Modified: {result.modified_at.strftime('%Y-%m-%d')}")
+        info_parts.append(f"Modified: {result.modified_at.date().isoformat()}")
 
     if info_parts:
         content.append(" | ".join(info_parts), style="dim")
@@ -233,7 +227,7 @@ def search_command(
     query_str = " ".join(query)
 
     if len(query_str) < 2:
-        console.print("[bold red]Error:[/bold red] Query must be at least 2 characters")
+        console().print("[bold red]Error:[/bold red] Query must be at least 2 characters")
         sys.exit(1)
 
     # Load config
@@ -245,7 +239,7 @@ def search_command(
         # Use default path if no config
         vector_store_path = None
     except Exception as e:
-        console.print(f"[bold yellow]Warning:[/bold yellow] Could not load config: {e}")
+        console().print(f"[bold yellow]Warning:[/bold yellow] Could not load config: {e}")
         vector_store_path = None
 
     # Build filters
@@ -254,20 +248,20 @@ def search_command(
     if file_type:
         extensions = parse_extensions(file_type)
         if extensions:
-            filters["extension"] = extensions if len(extensions) > 1 else extensions[0]
+            filters["extension"] = frozenset(extensions) if len(extensions) > 1 else extensions[0]
 
     if after:
         try:
             filters["after"] = parse_date(after)
         except click.BadParameter as e:
-            console.print(f"[bold red]Error:[/bold red] {e}")
+            console().print(f"[bold red]Error:[/bold red] {e}")
             sys.exit(1)
 
     if before:
         try:
             filters["before"] = parse_date(before)
         except click.BadParameter as e:
-            console.print(f"[bold red]Error:[/bold red] {e}")
+            console().print(f"[bold red]Error:[/bold red] {e}")
             sys.exit(1)
 
     if tag:
@@ -277,67 +271,79 @@ def search_command(
     try:
         engine = SearchEngine(persist_directory=vector_store_path)
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Failed to initialize search: {e}")
+        console().print(f"[bold red]Error:[/bold red] Failed to initialize search: {e}")
         logger.exception("Search engine initialization failed")
         sys.exit(1)
 
-    try:
-        # Check if index is empty
-        if engine.is_index_empty():
-            console.print(
-                Panel(
-                    "[yellow]No files have been indexed yet.[/yellow]\n\n"
-                    "Run [bold]fileassistant index <path>[/bold] to index your files first.\n\n"
-                    "Example:\n"
-                    "  fileassistant index ~/Documents --recursive",
-                    title="Empty Index",
-                    border_style="yellow",
-                )
-            )
-            sys.exit(0)
+    # Load the embedding model in the background while the index is opened and its
+    # vectors read from disk. With no index on disk there is nothing to search, so
+    # the model is not loaded at all.
+    warm_up = None
+    if engine.index_manager.persist_directory.exists():
+        warm_up = threading.Thread(target=engine.warm_up, name="search-warm-up", daemon=True)
+        warm_up.start()
+        engine.index_manager.warm_up()
 
+    try:
         # Perform search
         if not output_json:
-            console.print(f"[dim]Searching for:[/dim] [bold]{query_str}[/bold]")
+            console().print(f"[dim]Searching for:[/dim] [bold]{query_str}[/bold]")
             if filters:
                 filter_parts = []
                 if "extension" in filters:
                     ext = filters["extension"]
-                    if isinstance(ext, list):
-                        filter_parts.append(f"types: {', '.join(ext)}")
+                    if isinstance(ext, frozenset):
+                        filter_parts.append(f"types: {', '.join(sorted(ext))}")
                     else:
                         filter_parts.append(f"type: {ext}")
                 if "after" in filters:
-                    filter_parts.append(f"after: {filters['after'].strftime('%Y-%m-%d')}")
+                    filter_parts.append(f"after: {filters['after'].date().isoformat()}")
                 if "before" in filters:
-                    filter_parts.append(f"before: {filters['before'].strftime('%Y-%m-%d')}")
+                    filter_parts.append(f"before: {filters['before'].date().isoformat()}")
                 if "tag" in filters:
                     filter_parts.append(f"tag: {filters['tag']}")
-                console.print(f"[dim]Filters: {', '.join(filter_parts)}[/dim]")
-            console.print()
+                console().print(f"[dim]Filters: {', '.join(filter_parts)}[/dim]")
+            console().print()
 
         results = engine.search(query_str, filters=filters, limit=limit)
 
+        # The engine reports the index size it saw, so no separate emptiness check is needed
+        if not results and engine.last_indexed_count == 0:
+            console().print(
+                Panel(
+                    "[yellow]No files have been indexed yet.[/yellow]\n\n"
+                    "Run [bold]fileassistant index <path>[/bold] to index your files first.\n\n"
+                    "Example:\n"
+                    "  fileassistant index ~/Documents --recursive",
+                    title="Empty Index",
+                    border_style="yellow",
+                )
+            )
+            # Let a started warm-up finish rather than exit while it is still loading
+            if warm_up is not None:
+                warm_up.join()
+            sys.exit(0)
+
         # Output results
         if output_json:
             print(format_results_json(results))
         elif not results:
-            console.print("[yellow]No matching files found.[/yellow]")
-            console.print("\n[dim]Tips:[/dim]")
-            console.print("  - Try different or simpler search terms")
-            console.print("  - Remove filters to broaden the search")
-            console.print("  - Check that the files you're looking for are indexed")
+            console().print("[yellow]No matching files found.[/yellow]")
+            console().print("\n[dim]Tips:[/dim]")
+            console().print("  - Try different or simpler search terms")
+            console().print("  - Remove filters to broaden the search")
+            console().print("  - Check that the files you're looking for are indexed")
         elif compact:
-            console.print(format_results_table(results))
-            console.print(f"\n[dim]Found {len(results)} result(s)[/dim]")
+            console().print(format_results_table(results))
+            console().print(f"\n[dim]Found {len(results)} result(s)[/dim]")
         else:
             for i, result in enumerate(results, 1):
-                console.print(format_result_rich(result, i))
-                console.print()
-            console.print(f"[dim]Found {len(results)} result(s)[/dim]")
+                console().print(format_result_rich(result, i))
+                console().print()
+            console().print(f"[dim]Found {len(results)} result(s)[/dim]")
 
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Search failed: {e}")
+        console().print(f"[bold red]Error:[/bold red] Search failed: {e}")
         logger.exception("Search failed")
         sys.exit(1)
     finally:
@@ -7,15 +7,22 @@ from pydantic import ValidationError
 
 from .models import FileAssistantConfig
 
+# Resolved once at import; used for the default config locations below
+_HOME = Path.home()
+_USER_CONFIG_PATH = _HOME / ".config" / "fileassistant" / "config.yaml"
+
+# libyaml's C loader parses several times faster when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigManager:
     """Manages loading and saving configuration."""
 
-    DEFAULT_CONFIG_LOCATIONS = [
+    DEFAULT_CONFIG_LOCATIONS = (
         Path("config/default_config.yaml"),
-        Path.home() / ".config" / "fileassistant" / "config.yaml",
-        Path.home() / ".fileassistant" / "config.yaml",
-    ]
+        _USER_CONFIG_PATH,
+        _HOME / ".fileassistant" / "config.yaml",
+    )
 
     def __init__(self, config_path: Path | None = None):
         """
@@ -51,10 +58,13 @@ class ConfigManager:
             )
 
         try:
-            with open(config_file, encoding="utf-8") as f:
-                config_dict = yaml.safe_load(f) or {}
-
-            self._config = FileAssistantConfig(**config_dict)
+            if config_file.suffix == ".json":
+                # JSON is parsed and validated in a single pydantic-core pass
+                self._config = FileAssistantConfig.model_validate_json(config_file.read_bytes())
+            else:
+                with open(config_file, encoding="utf-8") as f:
+                    config_dict = yaml.load(f, Loader=_YAML_LOADER) or {}
+                self._config = FileAssistantConfig.model_validate(config_dict)
             self.config_path = config_file
             return self._config
 
@@ -78,25 +88,27 @@ class ConfigManager:
         save_path = path or self.config_path
         if save_path is None:
             # Default to user config location
-            save_path = Path.home() / ".config" / "fileassistant" / "config.yaml"
+            save_path = _USER_CONFIG_PATH
 
         # Ensure directory exists
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Convert to dict and dump to YAML
-        config_dict = config_to_save.model_dump(mode="python")
-
-        # Convert Path objects to strings for YAML serialization
-        config_dict = self._paths_to_strings(config_dict)
-
-        with open(save_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
-                config_dict,
-                f,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False,
-            )
+        # Every field is written so a new config file lists all settings for the
+        # user to edit. The format follows the extension, matching load().
+        if save_path.suffix == ".json":
+            save_path.write_text(config_to_save.model_dump_json(indent=2), encoding="utf-8")
+        else:
+            # Convert to plain JSON types (Paths become strings) in one pass
+            config_dict = config_to_save.model_dump(mode="json")
+
+            with open(save_path, "w", encoding="utf-8") as f:
+                yaml.safe_dump(
+                    config_dict,
+                    f,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    sort_keys=False,
+                )
 
         self.config_path = save_path
         self._config = config_to_save
@@ -118,18 +130,6 @@ class ConfigManager:
         self._config = default_config
         return default_config
 
-    @staticmethod
-    def _paths_to_strings(obj):
-        """Recursively convert Path objects to strings in a nested dict/list structure."""
-        if isinstance(obj, Path):
-            return str(obj)
-        elif isinstance(obj, dict):
-            return {key: ConfigManager._paths_to_strings(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [ConfigManager._paths_to_strings(item) for item in obj]
-        else:
-            return obj
-
     @property
     def config(self) -> FileAssistantConfig:
         """Get current configuration."""
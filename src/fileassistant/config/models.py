@@ -2,28 +2,39 @@
 
 from pathlib import Path
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Shared model config. defer_build postpones core-schema construction until the
+# first validation, so importing this module (e.g. for ``--help``) stays cheap.
+_MODEL_CONFIG = ConfigDict(defer_build=True, validate_assignment=True, extra="forbid")
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
 class ConfidenceThresholds(BaseModel):
     """Confidence thresholds for classification decisions."""
 
+    model_config = _MODEL_CONFIG
+
     high: float = Field(default=0.9, ge=0.0, le=1.0, description="High confidence threshold")
     medium: float = Field(default=0.6, ge=0.0, le=1.0, description="Medium confidence threshold")
     low: float = Field(default=0.0, ge=0.0, le=1.0, description="Low confidence threshold")
 
-    @field_validator("medium")
-    @classmethod
-    def medium_less_than_high(cls, v: float, info) -> float:
-        """Ensure medium threshold is less than high threshold."""
-        if "high" in info.data and v >= info.data["high"]:
+    @model_validator(mode="after")
+    def check_threshold_order(self) -> "ConfidenceThresholds":
+        """Ensure low <= medium < high."""
+        if self.medium >= self.high:
             raise ValueError("medium threshold must be less than high threshold")
-        return v
+        if self.low > self.medium:
+            raise ValueError("low threshold must not be greater than medium threshold")
+        return self
 
 
 class ProcessingSettings(BaseModel):
     """Settings for file processing behavior."""
 
+    model_config = _MODEL_CONFIG
+
     idle_only: bool = Field(default=True, description="Only process files when system is idle")
     debounce_seconds: int = Field(
         default=2, ge=0, description="Wait time after file changes before processing"
@@ -37,6 +48,8 @@ class ProcessingSettings(BaseModel):
 class AISettings(BaseModel):
     """AI model configuration."""
 
+    model_config = _MODEL_CONFIG
+
     model_name: str = Field(
         default="qwen2.5:latest", description="Ollama model name for classification"
     )
@@ -55,6 +68,8 @@ class AISettings(BaseModel):
 class SearchSettings(BaseModel):
     """Search and indexing configuration."""
 
+    model_config = _MODEL_CONFIG
+
     enabled: bool = Field(default=True, description="Enable search functionality")
     chunk_size: int = Field(
         default=512, ge=100, le=2048, description="Token size for text chunking"
@@ -76,6 +91,8 @@ class SearchSettings(BaseModel):
 class LoggingSettings(BaseModel):
     """Logging configuration."""
 
+    model_config = _MODEL_CONFIG
+
     level: str = Field(
         default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
@@ -91,16 +108,17 @@ class LoggingSettings(BaseModel):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Ensure log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
+        if v_upper not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {v}. Must be one of {sorted(_VALID_LOG_LEVELS)}")
         return v_upper
 
 
 class DatabaseSettings(BaseModel):
     """Database configuration."""
 
+    model_config = _MODEL_CONFIG
+
     path: Path = Field(
         default=Path("data/fileassistant.db"), description="Path to SQLite database file"
     )
@@ -116,6 +134,8 @@ class DatabaseSettings(BaseModel):
 class FileAssistantConfig(BaseModel):
     """Main configuration for FileAssistant."""
 
+    model_config = _MODEL_CONFIG
+
     # Core settings
     inbox_folders: list[Path] = Field(
         default_factory=lambda: [
@@ -126,7 +146,9 @@ class FileAssistantConfig(BaseModel):
     )
 
     organized_base_path: Path | None = Field(
-        default=None, description="Base path for organized files (defaults to user's Documents)"
+        default=None,
+        validate_default=True,
+        description="Base path for organized files (defaults to user's Documents)",
     )
 
     # Component settings
@@ -165,6 +187,12 @@ class FileAssistantConfig(BaseModel):
         description="Maximum depth to scan folders for context",
     )
 
+    max_context_folders: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum number of folders to collect when scanning for context",
+    )
+
     # Feature flags
     auto_process_enabled: bool = Field(
         default=False, description="Enable automatic file processing (vs. manual approval)"
@@ -174,12 +202,12 @@ class FileAssistantConfig(BaseModel):
         default=True, description="Learn from user corrections to improve classification"
     )
 
-    def get_context_folders(self) -> list[Path]:
-        """Get the list of folders to scan for classification context."""
+    def get_context_folders(self) -> tuple[Path, ...]:
+        """Get the folders to scan for classification context."""
         if self.scan_folders_for_context:
-            return self.scan_folders_for_context
+            return tuple(self.scan_folders_for_context)
         # Default to organized_base_path
-        return [self.organized_base_path]
+        return (self.organized_base_path,)
 
     @field_validator("organized_base_path")
     @classmethod
@@ -196,9 +224,3 @@ class FileAssistantConfig(BaseModel):
         if not v:
             raise ValueError("At least one inbox folder must be specified")
         return v
-
-    class Config:
-        """Pydantic config."""
-
-        validate_assignment = True
-        extra = "forbid"  # Raise error on unknown fields
@@ -1,9 +1,16 @@
 """Core module containing the main processing orchestrator."""
 
-from .processor import FileProcessor, ProcessingResult, UserDecision
-
 __all__ = [
     "FileProcessor",
     "ProcessingResult",
     "UserDecision",
 ]
+
+
+def __getattr__(name: str):
+    """Import the processor lazily so importing this package stays cheap (PEP 562)."""
+    if name in __all__:
+        from . import processor
+
+        return getattr(processor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,24 +1,46 @@
 """Processing loop orchestrator for the full file pipeline."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from ..analyzer import FileAnalyzer, AnalysisResult
-from ..classifier import FileClassifier, ClassificationResult
 from ..config.models import FileAssistantConfig
-from ..database import Action, Classification, ClassificationStatus, File, FileStatus
-from ..mover import FileMover, MoveResult
+from ..database import Classification, ClassificationStatus, File, FileStatus
 from ..utils.logging import get_logger
-from ..utils.folder_scanner import FolderScanner, FolderScanResult
+
+# The pipeline components and Rich widgets are imported where they are first
+# used, so importing this module does not pull in the whole processing stack.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..analyzer import AnalysisResult
+    from ..classifier import ClassificationResult
+    from ..mover import MoveResult
+    from ..utils.folder_scanner import FolderScanResult
 
 logger = get_logger(__name__)
-console = Console()
+
+# How long a folder context scan is used before a fresh one is started
+_FOLDER_CONTEXT_TTL_SECONDS = 60.0
+
+
+@functools.cache
+def _console() -> Console:
+    """Get the processor console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 class UserDecision(str, Enum):
@@ -29,12 +51,26 @@ class UserDecision(str, Enum):
     SKIP = "skip"
 
 
+# Accepted answers for the accept/edit/skip prompt
+_DECISION_MAP = {
+    "y": UserDecision.ACCEPT,
+    "yes": UserDecision.ACCEPT,
+    "e": UserDecision.EDIT,
+    "edit": UserDecision.EDIT,
+    "s": UserDecision.SKIP,
+    "skip": UserDecision.SKIP,
+}
+_DECISION_CHOICES = list(_DECISION_MAP)
+
+
 @dataclass
 class ProcessingResult:
     """Result of processing a single file through the pipeline."""
 
     file_path: Path
     filename: str
+    # Lowercased suffix of file_path, derived so it cannot disagree with the path
+    extension: str = field(init=False)
 
     # Pipeline results
     analysis: AnalysisResult | None = None
@@ -59,6 +95,10 @@ class ProcessingResult:
             return self.classification.destination_folder
         return None
 
+    def __post_init__(self):
+        """Derive the extension from file_path."""
+        self.extension = self.file_path.suffix.lower()
+
 
 class FileProcessor:
     """
@@ -75,6 +115,11 @@ class FileProcessor:
             config: FileAssistant configuration
             db_session: Optional database session for persistence
         """
+        from ..analyzer import FileAnalyzer
+        from ..classifier import FileClassifier
+        from ..mover import FileMover
+        from ..utils.folder_scanner import FolderScanner
+
         self.config = config
         self.db_session = db_session
 
@@ -94,6 +139,20 @@ class FileProcessor:
         # Folder scanner for providing context to classifier
         self.folder_scanner = FolderScanner(max_depth=config.folder_scan_depth)
         self._folder_context: FolderScanResult | None = None
+        self._folder_context_time = 0.0
+
+        # The context scan runs in the background so it overlaps with file analysis
+        self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="folder-scan")
+        self._folder_context_future: Future[FolderScanResult | None] | None = None
+
+        # process_multiple batches commits; single files are committed immediately
+        self._batch_commits = False
+        self._uncommitted_records = 0
+
+    def close(self):
+        """Stop the background folder scan thread."""
+        self._scan_executor.shutdown(wait=False, cancel_futures=True)
+        self._folder_context_future = None
 
     def check_system_ready(self) -> tuple[bool, list[str]]:
         """
@@ -131,13 +190,15 @@ class FileProcessor:
         if not context_folders:
             return None
 
-        # Filter to only existing folders
-        existing_folders = [f for f in context_folders if f and f.exists()]
+        # Filter to only existing folders (one stat each; files are skipped here too)
+        existing_folders = [f for f in context_folders if f and os.path.isdir(f)]
         if not existing_folders:
             return None
 
         try:
-            result = self.folder_scanner.scan(existing_folders)
+            result = self.folder_scanner.scan(
+                existing_folders, max_folders=self.config.max_context_folders
+            )
             if result.total_folders > 0:
                 logger.info(
                     f"Scanned {result.total_folders} folders for context "
@@ -152,6 +213,9 @@ class FileProcessor:
         self, classification: ClassificationResult, analysis: AnalysisResult
     ):
         """Display classification result in a formatted panel."""
+        from rich.panel import Panel
+        from rich.table import Table
+
         # Build info table
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Label", style="cyan")
@@ -171,14 +235,14 @@ class FileProcessor:
         # Build reasoning panel
         reasoning_text = classification.reasoning or "No reasoning provided"
 
-        console.print()
-        console.print(Panel(
+        _console().print()
+        _console().print(Panel(
             table,
             title="[bold cyan]Classification Result[/bold cyan]",
             border_style="cyan",
         ))
-        console.print(f"[dim]Reasoning: {reasoning_text}[/dim]")
-        console.print()
+        _console().print(f"[dim]Reasoning: {reasoning_text}[/dim]")
+        _console().print()
 
     def _get_user_decision(self, classification: ClassificationResult) -> tuple[UserDecision, str | None]:
         """
@@ -187,95 +251,111 @@ class FileProcessor:
         Returns:
             Tuple of (decision, edited_destination or None)
         """
-        console.print("[yellow]Options:[/yellow]")
-        console.print("  [green][Y]es[/green] - Accept and move to suggested destination")
-        console.print("  [blue][E]dit[/blue] - Edit destination folder")
-        console.print("  [red][S]kip[/red] - Skip this file")
-        console.print()
+        from rich.prompt import Prompt
+
+        _console().print("[yellow]Options:[/yellow]")
+        _console().print("  [green][Y]es[/green] - Accept and move to suggested destination")
+        _console().print("  [blue][E]dit[/blue] - Edit destination folder")
+        _console().print("  [red][S]kip[/red] - Skip this file")
+        _console().print()
 
         while True:
-            choice = Prompt.ask(
-                "Your choice",
-                choices=["y", "yes", "e", "edit", "s", "skip"],
-                default="y",
-            ).lower()
-
-            if choice in ("y", "yes"):
-                return UserDecision.ACCEPT, None
-
-            elif choice in ("e", "edit"):
-                new_dest = Prompt.ask(
-                    "Enter new destination folder",
-                    default=classification.destination_folder,
+            # Prompt.ask only returns one of the listed choices
+            decision = _DECISION_MAP[
+                Prompt.ask("Your choice", choices=_DECISION_CHOICES, default="y")
+            ]
+            if decision != UserDecision.EDIT:
+                return decision, None
+
+            new_dest = Prompt.ask(
+                "Enter new destination folder",
+                default=classification.destination_folder,
+            )
+            new_dest = new_dest.strip("/\\").replace("\\", "/")
+            if new_dest:
+                return UserDecision.EDIT, new_dest
+            _console().print("[red]Invalid destination, please try again.[/red]")
+
+    def _record_classification(self, result: ProcessingResult, final_destination: str | None):
+        """Record the classification and user decision of a result in the database."""
+        classification = result.classification
+        if self.db_session is None or classification is None:
+            return
+
+        decision = result.user_decision
+
+        try:
+            # Each record gets its own savepoint so a failure only discards that file
+            with self.db_session.begin_nested():
+                # Determine status
+                if decision == UserDecision.ACCEPT:
+                    status = ClassificationStatus.ACCEPTED
+                elif decision == UserDecision.EDIT:
+                    status = ClassificationStatus.MODIFIED
+                else:
+                    status = ClassificationStatus.REJECTED
+
+                if decision == UserDecision.SKIP:
+                    file_status = FileStatus.SKIPPED
+                else:
+                    file_status = FileStatus.PROCESSED
+
+                # Create or update the file record in one statement
+                insert = sqlite_insert(File).values(
+                    path=os.fspath(result.file_path),
+                    filename=result.filename,
+                    extension=result.extension,
+                    status=file_status,
                 )
-                new_dest = new_dest.strip("/\\").replace("\\", "/")
-                if new_dest:
-                    return UserDecision.EDIT, new_dest
-                console.print("[red]Invalid destination, please try again.[/red]")
+                upsert = insert.on_conflict_do_update(
+                    index_elements=[File.path],
+                    set_={
+                        "filename": insert.excluded.filename,
+                        "status": insert.excluded.status,
+                        "modified_at": func.current_timestamp(),
+                    },
+                )
+                file_id = self.db_session.execute(upsert.returning(File.id)).scalar_one()
+
+                # No tags are stored as NULL rather than serializing an empty list
+                tags = classification.tags or None
+
+                # Create classification record
+                classification_record = Classification(
+                    file_id=file_id,
+                    suggested_destination=classification.destination_folder,
+                    suggested_tags=tags,
+                    confidence=classification.confidence,
+                    reasoning=classification.reasoning,
+                    status=status,
+                    final_destination=final_destination,
+                    final_tags=tags,
+                )
+                self.db_session.add(classification_record)
+
+        except Exception as e:
+            logger.error(f"Failed to record classification: {e}")
+            return
 
-            elif choice in ("s", "skip"):
-                return UserDecision.SKIP, None
+        self._uncommitted_records += 1
+        if (
+            not self._batch_commits
+            or self._uncommitted_records >= self.config.processing.batch_size
+        ):
+            self._commit_records()
 
-    def _record_classification(
-        self,
-        file_path: Path,
-        classification: ClassificationResult,
-        decision: UserDecision,
-        final_destination: str | None,
-    ):
-        """Record classification in the database."""
+    def _commit_records(self):
+        """Commit buffered classification and action records."""
         if self.db_session is None:
             return
 
         try:
-            # Create or get file record
-            file_record = (
-                self.db_session.query(File)
-                .filter(File.path == str(file_path))
-                .first()
-            )
-
-            if file_record is None:
-                file_record = File(
-                    path=str(file_path),
-                    filename=file_path.name,
-                    extension=file_path.suffix.lower(),
-                )
-                self.db_session.add(file_record)
-                self.db_session.flush()
-
-            # Determine status
-            if decision == UserDecision.ACCEPT:
-                status = ClassificationStatus.ACCEPTED
-            elif decision == UserDecision.EDIT:
-                status = ClassificationStatus.MODIFIED
-            else:
-                status = ClassificationStatus.REJECTED
-
-            # Create classification record
-            classification_record = Classification(
-                file_id=file_record.id,
-                suggested_destination=classification.destination_folder,
-                suggested_tags=classification.tags,
-                confidence=classification.confidence,
-                reasoning=classification.reasoning,
-                status=status.value,
-                final_destination=final_destination,
-                final_tags=classification.tags,
-            )
-            self.db_session.add(classification_record)
-
-            # Update file status
-            if decision == UserDecision.SKIP:
-                file_record.status = FileStatus.SKIPPED.value
-            else:
-                file_record.status = FileStatus.PROCESSED.value
-
             self.db_session.commit()
-
         except Exception as e:
-            logger.error(f"Failed to record classification: {e}")
+            logger.error(f"Failed to commit classifications: {e}")
             self.db_session.rollback()
+        finally:
+            self._uncommitted_records = 0
 
     def process_file(
         self,
@@ -292,45 +372,81 @@ class FileProcessor:
         Returns:
             ProcessingResult with pipeline results
         """
-        file_path = Path(file_path).resolve()
+        return self._process_resolved_file(Path(file_path).resolve(), interactive)
+
+    def _process_resolved_file(
+        self,
+        file_path: Path,
+        interactive: bool,
+        deferred_moves: list[tuple[ProcessingResult, str]] | None = None,
+    ) -> ProcessingResult:
+        """
+        Run the pipeline for a file path that is already resolved.
+
+        Args:
+            file_path: Resolved path of the file to process
+            interactive: Whether to prompt user for confirmation
+            deferred_moves: When given, an accepted file is appended here with its
+                destination instead of being moved; the caller finishes it with
+                _finish_move()
+
+        Returns:
+            ProcessingResult with pipeline results
+        """
         result = ProcessingResult(
             file_path=file_path,
             filename=file_path.name,
         )
 
+        # Start the folder context scan (Step 2) so it runs while the file is analyzed.
+        # A context older than the TTL is refreshed, since moves add new folders.
+        context_stale = (
+            time.monotonic() - self._folder_context_time >= _FOLDER_CONTEXT_TTL_SECONDS
+        )
+        if (self._folder_context is None or context_stale) and self._folder_context_future is None:
+            self._folder_context_future = self._scan_executor.submit(self._scan_folder_context)
+
         # Step 1: Analyze
-        console.print(f"[cyan]Analyzing[/cyan] {file_path.name}...")
+        _console().print(f"[cyan]Analyzing[/cyan] {result.filename}...")
         analysis = self.analyzer.analyze(file_path)
         result.analysis = analysis
 
         if not analysis.success:
             result.error_message = f"Analysis failed: {analysis.error_message}"
-            console.print(f"[red]Analysis failed:[/red] {analysis.error_message}")
+            _console().print(f"[red]Analysis failed:[/red] {analysis.error_message}")
             return result
 
-        console.print(f"[green]✓[/green] Analyzed: {analysis.word_count} words, {analysis.metadata.size_bytes / 1024:.1f} KB")
-
-        # Step 2: Scan folders for context (if not already done)
-        if self._folder_context is None:
-            console.print("[cyan]Scanning[/cyan] existing folder structure...")
-            self._folder_context = self._scan_folder_context()
-            if self._folder_context and self._folder_context.total_folders > 0:
-                console.print(f"[green]✓[/green] Found {self._folder_context.total_folders} existing folders")
+        _console().print(f"[green]✓[/green] Analyzed: {analysis.word_count} words, {analysis.metadata.size_bytes / 1024:.1f} KB")
+
+        # Step 2: Collect the folder context scan started above. Without a context we
+        # wait for it; a stale context keeps being used until the refresh finishes.
+        future = self._folder_context_future
+        if future is not None and (self._folder_context is None or future.done()):
+            first_scan = self._folder_context is None
+            if first_scan:
+                _console().print("[cyan]Scanning[/cyan] existing folder structure...")
+            self._folder_context = future.result()
+            self._folder_context_time = time.monotonic()
+            self._folder_context_future = None
+            if first_scan and self._folder_context and self._folder_context.total_folders > 0:
+                _console().print(f"[green]✓[/green] Found {self._folder_context.total_folders} existing folders")
 
         # Step 3: Classify
-        console.print(f"[cyan]Classifying[/cyan] with {self.config.ai_settings.model_name}...")
+        _console().print(f"[cyan]Classifying[/cyan] with {self.config.ai_settings.model_name}...")
         classification = self.classifier.classify(analysis, folder_context=self._folder_context)
         result.classification = classification
 
         if not classification.success:
             result.error_message = f"Classification failed: {classification.error_message}"
-            console.print(f"[red]Classification failed:[/red] {classification.error_message}")
+            _console().print(f"[red]Classification failed:[/red] {classification.error_message}")
             return result
 
-        console.print("[green]✓[/green] Classification complete")
+        _console().print("[green]✓[/green] Classification complete")
 
-        # Step 4: Display and get user decision
-        self._display_classification(classification, analysis)
+        # Step 4: Display and get user decision. Unattended runs with INFO output
+        # turned off skip rendering the panel, since nobody is there to read it.
+        if interactive or logger.isEnabledFor(logging.INFO):
+            self._display_classification(classification, analysis)
 
         if interactive:
             decision, edited_dest = self._get_user_decision(classification)
@@ -345,29 +461,36 @@ class FileProcessor:
         # Handle skip
         if decision == UserDecision.SKIP:
             result.skipped = True
-            self._record_classification(file_path, classification, decision, None)
-            console.print("[yellow]Skipped[/yellow]")
+            self._record_classification(result, None)
+            _console().print("[yellow]Skipped[/yellow]")
             return result
 
         # Step 5: Move file
         final_destination = edited_dest or classification.destination_folder
-        console.print(f"[cyan]Moving[/cyan] to {final_destination}...")
+        if deferred_moves is not None:
+            deferred_moves.append((result, final_destination))
+            return result
+
+        _console().print(f"[cyan]Moving[/cyan] to {final_destination}...")
+        self._finish_move(result, self.mover.move(file_path, final_destination), final_destination)
+        return result
 
-        move_result = self.mover.move(file_path, final_destination)
+    def _finish_move(
+        self, result: ProcessingResult, move_result: MoveResult, final_destination: str
+    ):
+        """Record the outcome of moving a classified file."""
         result.move_result = move_result
 
         if not move_result.success:
             result.error_message = f"Move failed: {move_result.error_message}"
-            console.print(f"[red]Move failed:[/red] {move_result.error_message}")
-            return result
+            _console().print(f"[red]Move failed:[/red] {move_result.error_message}")
+            return
 
         # Record to database
-        self._record_classification(file_path, classification, decision, final_destination)
+        self._record_classification(result, final_destination)
 
         result.success = True
-        console.print(f"[green]✓[/green] Moved to: [bold]{move_result.destination_path}[/bold]")
-
-        return result
+        _console().print(f"[green]✓[/green] Moved to: [bold]{move_result.destination_path}[/bold]")
 
     def process_multiple(
         self,
@@ -386,11 +509,49 @@ class FileProcessor:
         """
         results: list[ProcessingResult] = []
 
-        total = len(file_paths)
-        for i, file_path in enumerate(file_paths, 1):
-            console.print()
-            console.rule(f"[bold]File {i}/{total}[/bold]")
-            result = self.process_file(file_path, interactive=interactive)
-            results.append(result)
+        # Files usually share a few inbox folders, so resolve each folder once. Only
+        # symlinked files need their own full resolve.
+        resolved_parents: dict[Path, Path] = {}
+        resolved_paths = []
+        for file_path in map(Path, file_paths):
+            if file_path.is_symlink():
+                resolved_paths.append(file_path.resolve())
+                continue
+            parent = resolved_parents.get(file_path.parent)
+            if parent is None:
+                parent = resolved_parents[file_path.parent] = file_path.parent.resolve()
+            resolved_paths.append(parent / file_path.name)
+
+        # Unattended runs classify every file first and then move them together,
+        # so the renames run concurrently; interactive runs move as the user decides
+        deferred_moves: list[tuple[ProcessingResult, str]] | None = (
+            None if interactive else []
+        )
+
+        # Commit once per config.processing.batch_size files instead of per file
+        self._batch_commits = True
+        self.mover.defer_commit = True
+        try:
+            total = len(resolved_paths)
+            for i, file_path in enumerate(resolved_paths, 1):
+                _console().print()
+                _console().rule(f"[bold]File {i}/{total}[/bold]")
+                result = self._process_resolved_file(file_path, interactive, deferred_moves)
+                results.append(result)
+
+            if deferred_moves:
+                _console().print()
+                _console().print(f"[cyan]Moving[/cyan] {len(deferred_moves)} file(s)...")
+                move_results = self.mover.move_batch(
+                    [(result.file_path, destination) for result, destination in deferred_moves]
+                )
+                for (result, destination), move_result in zip(
+                    deferred_moves, move_results, strict=True
+                ):
+                    self._finish_move(result, move_result, destination)
+        finally:
+            self._batch_commits = False
+            self.mover.defer_commit = False
+            self._commit_records()
 
         return results
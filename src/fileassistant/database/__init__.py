@@ -2,6 +2,7 @@
 
 from .migrations import Migration, MigrationManager, initialize_migrations
 from .models import Database, get_database, get_session
+from .queries import get_file_with_history, list_files_with_tags, search_file_summaries
 from .schema import (
     Action,
     ActionType,
@@ -36,6 +37,10 @@ __all__ = [
     "Database",
     "get_database",
     "get_session",
+    # Queries
+    "list_files_with_tags",
+    "get_file_with_history",
+    "search_file_summaries",
     # Migrations
     "Migration",
     "MigrationManager",
@@ -1,13 +1,15 @@
 """Simple migration system for database schema updates."""
 
+import bisect
 from collections.abc import Callable
-from datetime import datetime
+from datetime import UTC, datetime
 
+from sqlalchemy import inspect, select, text
 from sqlalchemy.orm import Session
 
 from ..utils.logging import get_logger
 from .models import Database
-from .schema import SchemaVersion
+from .schema import Action, Classification, File, SchemaVersion
 
 logger = get_logger(__name__)
 
@@ -37,6 +39,11 @@ class Migration:
         self.down = down
 
 
+def _migration_version(migration: Migration) -> int:
+    """Sort key for keeping migrations in version order."""
+    return migration.version
+
+
 class MigrationManager:
     """Manages database migrations."""
 
@@ -52,9 +59,8 @@ class MigrationManager:
 
     def register(self, migration: Migration):
         """Register a migration."""
-        self.migrations.append(migration)
         # Keep migrations sorted by version
-        self.migrations.sort(key=lambda m: m.version)
+        bisect.insort(self.migrations, migration, key=_migration_version)
 
     def get_current_version(self, session: Session) -> int:
         """
@@ -67,8 +73,10 @@ class MigrationManager:
             Current version number (0 if no migrations applied)
         """
         try:
-            latest = session.query(SchemaVersion).order_by(SchemaVersion.version.desc()).first()
-            return latest.version if latest else 0
+            latest = session.execute(
+                select(SchemaVersion.version).order_by(SchemaVersion.version.desc()).limit(1)
+            ).scalar()
+            return latest or 0
         except Exception:
             # Table might not exist yet
             return 0
@@ -83,8 +91,10 @@ class MigrationManager:
         session = self.db.get_session()
 
         try:
-            # Ensure schema_version table exists
-            self.db.create_all_tables()
+            # Ensure schema_version table exists. An existing table means the schema
+            # was created before, so the CREATE TABLE round trips can be skipped.
+            if not inspect(self.db.engine).has_table(SchemaVersion.__tablename__):
+                self.db.create_all_tables()
 
             current_version = self.get_current_version(session)
             logger.info(f"Current database version: {current_version}")
@@ -116,7 +126,7 @@ class MigrationManager:
                     version_record = SchemaVersion(
                         version=migration.version,
                         description=migration.description,
-                        applied_at=datetime.utcnow(),
+                        applied_at=datetime.now(UTC),
                     )
                     session.add(version_record)
                     session.commit()
@@ -193,11 +203,80 @@ def create_initial_schema(session: Session):
     pass
 
 
-def migration_example_add_index(session: Session):
-    """Migration 2: Example - add index to files table."""
-    # Example of a future migration
-    # session.execute(text("CREATE INDEX idx_files_created_at ON files(created_at)"))
-    pass
+# Indexes added after the initial schema
+_QUERY_INDEXES = (
+    "ix_files_status",
+    "ix_classifications_file_id",
+    "ix_actions_action_type_timestamp",
+)
+
+
+def add_query_indexes(session: Session):
+    """Migration 2: Add indexes for status filters, classification joins and action history."""
+    connection = session.connection()
+    for table in (File.__table__, Classification.__table__, Action.__table__):
+        for index in table.indexes:
+            if index.name in _QUERY_INDEXES:
+                # Databases created with the current schema already have them
+                index.create(connection, checkfirst=True)
+
+    # Refresh planner statistics so the new indexes are used
+    session.execute(text("ANALYZE"))
+
+
+def drop_query_indexes(session: Session):
+    """Rollback migration 2."""
+    for name in _QUERY_INDEXES:
+        session.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+# Full-text index over files(path, content_summary). External content: the
+# FTS table stores only the index and reads column values from files.
+_FILES_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS files_fts USING fts5(
+        path, content_summary, content='files', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS files_fts_ai AFTER INSERT ON files BEGIN
+        INSERT INTO files_fts(rowid, path, content_summary)
+        VALUES (new.id, new.path, new.content_summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS files_fts_ad AFTER DELETE ON files BEGIN
+        INSERT INTO files_fts(files_fts, rowid, path, content_summary)
+        VALUES ('delete', old.id, old.path, old.content_summary);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS files_fts_au AFTER UPDATE OF path, content_summary ON files
+    BEGIN
+        INSERT INTO files_fts(files_fts, rowid, path, content_summary)
+        VALUES ('delete', old.id, old.path, old.content_summary);
+        INSERT INTO files_fts(rowid, path, content_summary)
+        VALUES (new.id, new.path, new.content_summary);
+    END
+    """,
+)
+
+
+def add_files_fts(session: Session):
+    """Migration 3: Add a full-text index over file paths and content summaries."""
+    for statement in _FILES_FTS_DDL:
+        session.execute(text(statement))
+
+    # Index rows that existed before the triggers
+    session.execute(text("INSERT INTO files_fts(files_fts) VALUES ('rebuild')"))
+
+
+def drop_files_fts(session: Session):
+    """Rollback migration 3."""
+    for trigger in ("files_fts_ai", "files_fts_ad", "files_fts_au"):
+        session.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    session.execute(text("DROP TABLE IF EXISTS files_fts"))
 
 
 # Initialize default migrations
@@ -210,6 +289,18 @@ def get_default_migrations() -> list[Migration]:
             up=create_initial_schema,
             down=None,  # Cannot rollback initial schema
         ),
+        Migration(
+            version=2,
+            description="Add query indexes",
+            up=add_query_indexes,
+            down=drop_query_indexes,
+        ),
+        Migration(
+            version=3,
+            description="Add full-text index on files",
+            up=add_files_fts,
+            down=drop_files_fts,
+        ),
         # Add more migrations here as the schema evolves
     ]
 
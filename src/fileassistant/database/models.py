@@ -1,12 +1,51 @@
 """Database models and ORM operations."""
 
+import functools
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
+from ..utils.logging import get_logger
 from .schema import Base
 
+logger = get_logger(__name__)
+
+
+# Applied to every new connection. WAL lets readers run alongside a writer and,
+# with synchronous=NORMAL, only syncs the log on checkpoints instead of on every commit.
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256 MiB
+    "cache_size=-65536",  # 64 MiB
+    "busy_timeout=5000",
+    "foreign_keys=ON",
+)
+
+# WAL needs a file; in-memory databases keep their own journal mode
+_SQLITE_MEMORY_PRAGMAS = tuple(p for p in _SQLITE_PRAGMAS if not p.startswith("journal_mode"))
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record, in_memory=False):
+    """Apply connection-level SQLite pragmas."""
+    # Stop pysqlite from managing transactions itself so SAVEPOINTs nest
+    # inside the BEGIN emitted by _begin_sqlite_transaction
+    dbapi_connection.isolation_level = None
+
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_MEMORY_PRAGMAS if in_memory else _SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _begin_sqlite_transaction(connection):
+    """Emit BEGIN explicitly at the start of each transaction."""
+    connection.exec_driver_sql("BEGIN")
+
 
 class Database:
     """Database connection and session management."""
@@ -19,17 +58,37 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create engine with SQLite
+        in_memory = str(self.db_path) == ":memory:"
+        if not in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Create engine with SQLite. File databases keep a sized pool of open
+        # connections; an in-memory database exists only on its one connection,
+        # which is shared.
+        pool_args: dict[str, Any]
+        if in_memory:
+            pool_args = {"poolclass": StaticPool}
+        else:
+            pool_args = {"poolclass": QueuePool, "pool_size": 5, "max_overflow": 10}
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,  # Set to True for SQL debugging
-            connect_args={"check_same_thread": False},  # Needed for SQLite
+            connect_args={"check_same_thread": False, "timeout": 30},  # Needed for SQLite
+            **pool_args,
         )
 
-        # Create session factory
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        event.listen(
+            self.engine,
+            "connect",
+            functools.partial(_configure_sqlite_connection, in_memory=in_memory),
+        )
+        event.listen(self.engine, "begin", _begin_sqlite_transaction)
+
+        # Create session factory. Objects keep their loaded attributes after
+        # commit instead of re-SELECTing on the next read.
+        self.SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=self.engine
+        )
 
     def create_all_tables(self):
         """Create all tables if they don't exist."""
@@ -43,6 +102,10 @@ class Database:
         """
         Get a new database session.
 
+        Attributes are not expired on commit, so values read after a commit
+        are those held in memory; call session.refresh(obj) when another
+        session may have changed the row.
+
         Returns:
             SQLAlchemy session
         """
@@ -50,6 +113,13 @@ class Database:
 
     def close(self):
         """Close database connection."""
+        # Let SQLite refresh query planner statistics that have drifted
+        try:
+            with self.engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA optimize")
+        except Exception as e:
+            logger.debug(f"PRAGMA optimize failed: {e}")
+        logger.debug(f"Closing database pool: {self.engine.pool.status()}")
         self.engine.dispose()
 
 
@@ -0,0 +1,75 @@
+"""Query helpers that load File relationships explicitly."""
+
+from sqlalchemy import column, literal_column, select, table
+from sqlalchemy.orm import Session, selectinload
+
+from .schema import File, FileTag
+
+# FTS5 table created by migration 3; rank orders matches by bm25 relevance
+_FILES_FTS = table("files_fts", column("rowid"), column("rank"))
+
+
+def list_files_with_tags(session: Session, limit: int = 100) -> list[File]:
+    """
+    List files with their tags loaded.
+
+    Tags are fetched with one batched IN query for all files rather than one
+    query per file.
+
+    Args:
+        session: Database session
+        limit: Maximum number of files to return
+
+    Returns:
+        File objects with tags (and each FileTag's Tag) loaded
+    """
+    statement = (
+        select(File)
+        .options(selectinload(File.tags).joinedload(FileTag.tag))
+        .order_by(File.id)
+        .limit(limit)
+    )
+    return list(session.execute(statement).scalars().all())
+
+
+def get_file_with_history(session: Session, file_id: int) -> File | None:
+    """
+    Get a file with its classifications and actions loaded.
+
+    Args:
+        session: Database session
+        file_id: ID of the file
+
+    Returns:
+        File with history loaded, or None if not found
+    """
+    statement = (
+        select(File)
+        .options(selectinload(File.classifications), selectinload(File.actions))
+        .where(File.id == file_id)
+    )
+    return session.execute(statement).scalars().first()
+
+
+def search_file_summaries(session: Session, query: str, limit: int = 50) -> list[File]:
+    """
+    Find files whose path or content summary match a full-text query.
+
+    Uses the files_fts index, so matching does not scan the files table.
+
+    Args:
+        session: Database session
+        query: FTS5 query string (e.g. "invoice", "tax AND 2024", "report*")
+        limit: Maximum number of files to return
+
+    Returns:
+        Matching File objects, best match first
+    """
+    statement = (
+        select(File)
+        .join(_FILES_FTS, File.id == _FILES_FTS.c.rowid)
+        .where(literal_column("files_fts").op("MATCH")(query))
+        .order_by(_FILES_FTS.c.rank)
+        .limit(limit)
+    )
+    return list(session.execute(statement).scalars().all())
@@ -1,6 +1,5 @@
 """SQLite database schema for FileAssistant."""
 
-from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import (
@@ -10,15 +9,22 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
 )
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# Timestamps are generated by SQLite inside the INSERT/UPDATE rather than in
+# Python. The inline default also covers tables created before the DDL default.
+_NOW = func.current_timestamp()
+
 
 class FileStatus(str, Enum):
     """File processing status."""
@@ -49,6 +55,23 @@ class ActionType(str, Enum):
     RENAME = "rename"
 
 
+def _enum_column(enum_class: type[Enum]) -> String:
+    """
+    Column type storing an enum's values as VARCHAR(20) with a CHECK constraint.
+
+    Values (e.g. "pending") are stored rather than member names, matching rows
+    written as plain strings. Reads return enum members.
+    """
+    return SQLEnum(
+        enum_class,
+        native_enum=False,
+        create_constraint=True,
+        validate_strings=True,
+        values_callable=lambda members: [member.value for member in members],
+        length=20,
+    )
+
+
 class File(Base):
     """File record table."""
 
@@ -62,21 +85,28 @@ class File(Base):
     hash_md5 = Column(String(32), index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    modified_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
+    modified_at = Column(DateTime, default=_NOW, server_default=_NOW, onupdate=_NOW)
     processed_at = Column(DateTime)
 
     # Processing
-    status = Column(String(20), default=FileStatus.PENDING, nullable=False)
+    status = Column(
+        _enum_column(FileStatus), default=FileStatus.PENDING, nullable=False, index=True
+    )
     content_summary = Column(Text)
     embedding_id = Column(String(255))  # Reference to vector store
 
-    # Relationships
-    tags = relationship("FileTag", back_populates="file", cascade="all, delete-orphan")
+    # Relationships. Collections must be loaded explicitly (see queries.py) so that
+    # iterating over files never issues one SELECT per file.
+    tags = relationship(
+        "FileTag", back_populates="file", cascade="all, delete-orphan", lazy="raise"
+    )
     classifications = relationship(
-        "Classification", back_populates="file", cascade="all, delete-orphan"
+        "Classification", back_populates="file", cascade="all, delete-orphan", lazy="raise"
+    )
+    actions = relationship(
+        "Action", back_populates="file", cascade="all, delete-orphan", lazy="raise"
     )
-    actions = relationship("Action", back_populates="file", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<File(id={self.id}, path='{self.path}', status='{self.status}')>"
@@ -94,8 +124,8 @@ class Tag(Base):
     parent_tag_id = Column(Integer, ForeignKey("tags.id"))
     auto_generated = Column(Boolean, default=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
+    updated_at = Column(DateTime, default=_NOW, server_default=_NOW, onupdate=_NOW)
 
     # Relationships
     parent = relationship("Tag", remote_side=[id], backref="children")
@@ -115,7 +145,7 @@ class FileTag(Base):
     confidence = Column(Float)
     source = Column(String(20))  # 'ai', 'user', 'rule'
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
 
     # Relationships
     file = relationship("File", back_populates="tags")
@@ -133,20 +163,20 @@ class Classification(Base):
     __tablename__ = "classifications"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    file_id = Column(Integer, ForeignKey("files.id"), nullable=False)
+    file_id = Column(Integer, ForeignKey("files.id"), nullable=False, index=True)
 
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
 
     # AI suggestions
     suggested_destination = Column(Text)
-    suggested_tags = Column(JSON)  # JSON array of tag names
+    suggested_tags = Column(JSON(none_as_null=True))  # JSON array of tag names, NULL if none
     confidence = Column(Float)
     reasoning = Column(Text)
 
     # User decision
-    status = Column(String(20), default=ClassificationStatus.PENDING)
+    status = Column(_enum_column(ClassificationStatus), default=ClassificationStatus.PENDING)
     final_destination = Column(Text)
-    final_tags = Column(JSON)  # JSON array of tag names
+    final_tags = Column(JSON(none_as_null=True))  # JSON array of tag names, NULL if none
 
     # Relationships
     file = relationship("File", back_populates="classifications")
@@ -159,11 +189,15 @@ class Action(Base):
     """Action log for undo capability."""
 
     __tablename__ = "actions"
+    __table_args__ = (
+        # Recent actions of a type, newest first (FileMover.get_recent_actions)
+        Index("ix_actions_action_type_timestamp", "action_type", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
 
-    action_type = Column(String(20), nullable=False)
+    action_type = Column(_enum_column(ActionType), nullable=False)
     file_id = Column(Integer, ForeignKey("files.id"))
 
     # State snapshots (JSON)
@@ -196,8 +230,8 @@ class Rule(Base):
 
     enabled = Column(Boolean, default=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
+    updated_at = Column(DateTime, default=_NOW, server_default=_NOW, onupdate=_NOW)
 
     def __repr__(self):
         return f"<Rule(id={self.id}, name='{self.name}', enabled={self.enabled})>"
@@ -211,7 +245,7 @@ class Preference(Base):
     key = Column(String(255), primary_key=True)
     value = Column(Text)
 
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=_NOW, server_default=_NOW, onupdate=_NOW)
 
     def __repr__(self):
         return f"<Preference(key='{self.key}', value='{self.value}')>"
@@ -225,7 +259,7 @@ class Correction(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     file_id = Column(Integer, ForeignKey("files.id"), nullable=False)
 
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    timestamp = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
 
     # Correction data (JSON)
     original_classification = Column(JSON)
@@ -243,7 +277,7 @@ class SchemaVersion(Base):
     __tablename__ = "schema_version"
 
     version = Column(Integer, primary_key=True)
-    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    applied_at = Column(DateTime, default=_NOW, server_default=_NOW, nullable=False)
     description = Column(String(255))
 
     def __repr__(self):
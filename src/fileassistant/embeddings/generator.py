@@ -1,19 +1,28 @@
 """Embedding generator for creating vector representations of text."""
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger(__name__)
 
+# Sentence-ending punctuation followed by whitespace
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class EmbeddingResult:
     """Result of embedding generation."""
 
-    embedding: list[float]
+    embedding: "np.ndarray"
     chunk_count: int
     token_estimate: int
     model_name: str
@@ -23,8 +32,10 @@ class EmbeddingResult:
     @classmethod
     def failure(cls, error_message: str) -> "EmbeddingResult":
         """Create a failed embedding result."""
+        import numpy as np
+
         return cls(
-            embedding=[],
+            embedding=np.empty(0, dtype=np.float32),
             chunk_count=0,
             token_estimate=0,
             model_name="",
@@ -46,6 +57,12 @@ class EmbeddingGenerator:
 
     # Class-level model cache to avoid reloading
     _model_cache: ClassVar[dict] = {}
+    # Serializes model loading so concurrent callers (e.g. a warm-up thread) load it once
+    _model_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Recently generated embeddings kept per generator, e.g. for a moved file that is
+    # re-indexed under its new path
+    EMBEDDING_CACHE_SIZE: ClassVar[int] = 256
 
     def __init__(
         self,
@@ -66,24 +83,38 @@ class EmbeddingGenerator:
         self.chunk_overlap = chunk_overlap
         self._model = None
 
+        # Content digest -> (embedding array, chunk count). Arrays keep the model's
+        # float32 output, a fraction of the size of a list of Python floats.
+        self._embedding_cache: OrderedDict[bytes, tuple[np.ndarray, int]] = OrderedDict()
+
     def _get_model(self):
         """
         Get the sentence transformer model, loading from cache if available.
 
-        The model is cached at the class level to avoid reloading across instances.
+        The model is cached at the class level to avoid reloading across instances,
+        and remembered on the instance so later calls skip the cache lookup.
         """
-        if self.model_name not in self._model_cache:
-            logger.info(f"Loading embedding model: {self.model_name}")
-            try:
-                from sentence_transformers import SentenceTransformer
+        if self._model is not None:
+            return self._model
 
-                self._model_cache[self.model_name] = SentenceTransformer(self.model_name)
-                logger.info(f"Embedding model loaded: {self.model_name}")
-            except Exception as e:
-                logger.error(f"Failed to load embedding model: {e}")
-                raise
+        model = self._model_cache.get(self.model_name)
+        if model is None:
+            with self._model_lock:
+                if self.model_name not in self._model_cache:
+                    logger.info(f"Loading embedding model: {self.model_name}")
+                    try:
+                        from sentence_transformers import SentenceTransformer
+
+                        self._model_cache[self.model_name] = SentenceTransformer(self.model_name)
+                        logger.info(f"Embedding model loaded: {self.model_name}")
+                    except Exception as e:
+                        logger.error(f"Failed to load embedding model: {e}")
+                        raise
+
+                model = self._model_cache[self.model_name]
 
-        return self._model_cache[self.model_name]
+        self._model = model
+        return model
 
     def _estimate_tokens(self, text: str) -> int:
         """
@@ -93,16 +124,28 @@ class EmbeddingGenerator:
         """
         return len(text) // 4
 
+    def _count_tokens(self, sentences: list[str]) -> list[int]:
+        """
+        Count the tokens in each sentence.
+
+        Uses the model's tokenizer in a single batched call, loading the model
+        if needed, so chunks are always packed against the same token counts.
+        Falls back to the character heuristic for a model without a tokenizer.
+        """
+        tokenizer = getattr(self._get_model(), "tokenizer", None)
+        if tokenizer is None:
+            return [self._estimate_tokens(sentence) for sentence in sentences]
+
+        encoded = tokenizer(sentences, add_special_tokens=False)["input_ids"]
+        return [len(ids) for ids in encoded]
+
     def _split_into_sentences(self, text: str) -> list[str]:
         """
         Split text into sentences.
 
         Uses a simple regex-based approach that handles common cases.
         """
-        # Split on sentence-ending punctuation followed by whitespace
-        sentence_pattern = r'(?<=[.!?])\s+'
-        sentences = re.split(sentence_pattern, text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [stripped for s in _SENTENCE_BOUNDARY.split(text) if (stripped := s.strip())]
 
     def _chunk_text(self, text: str) -> list[str]:
         """
@@ -122,50 +165,86 @@ class EmbeddingGenerator:
         if not sentences:
             return [text.strip()]
 
+        # Count each sentence once; the current chunk is always the contiguous
+        # run sentences[start:i], so overlap is found by walking back from i
+        tokens = self._count_tokens(sentences)
+
         chunks = []
-        current_chunk: list[str] = []
+        start = 0
         current_tokens = 0
 
-        for sentence in sentences:
-            sentence_tokens = self._estimate_tokens(sentence)
-
+        for i, sentence_tokens in enumerate(tokens):
             # If single sentence exceeds chunk size, add it as its own chunk
             if sentence_tokens > self.chunk_size:
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-                    current_chunk = []
-                    current_tokens = 0
-                chunks.append(sentence)
+                if start < i:
+                    chunks.append(" ".join(sentences[start:i]))
+                chunks.append(sentences[i])
+                start = i + 1
+                current_tokens = 0
                 continue
 
             # Check if adding this sentence would exceed chunk size
-            if current_tokens + sentence_tokens > self.chunk_size:
-                if current_chunk:
-                    chunks.append(" ".join(current_chunk))
-
-                    # Calculate overlap: keep last few sentences that fit in overlap budget
-                    overlap_sentences = []
-                    overlap_tokens = 0
-                    for s in reversed(current_chunk):
-                        s_tokens = self._estimate_tokens(s)
-                        if overlap_tokens + s_tokens <= self.chunk_overlap:
-                            overlap_sentences.insert(0, s)
-                            overlap_tokens += s_tokens
-                        else:
-                            break
-
-                    current_chunk = overlap_sentences
-                    current_tokens = overlap_tokens
-
-            current_chunk.append(sentence)
+            if current_tokens + sentence_tokens > self.chunk_size and start < i:
+                chunks.append(" ".join(sentences[start:i]))
+
+                # Overlap: keep the last sentences that fit in the overlap budget
+                overlap_start = i
+                overlap_tokens = 0
+                while (
+                    overlap_start > start
+                    and overlap_tokens + tokens[overlap_start - 1] <= self.chunk_overlap
+                ):
+                    overlap_start -= 1
+                    overlap_tokens += tokens[overlap_start]
+
+                start = overlap_start
+                current_tokens = overlap_tokens
+
             current_tokens += sentence_tokens
 
         # Add remaining sentences as final chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        if start < len(sentences):
+            chunks.append(" ".join(sentences[start:]))
 
         return chunks
 
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Digest identifying a text in the embedding cache."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cached_result(self, key: bytes, text: str) -> EmbeddingResult | None:
+        """Build a result from the embedding cache, or None on a miss."""
+        entry = self._embedding_cache.get(key)
+        if entry is None:
+            return None
+        self._embedding_cache.move_to_end(key)
+        embedding, chunk_count = entry
+        return EmbeddingResult(
+            embedding=embedding,
+            chunk_count=chunk_count,
+            token_estimate=self._estimate_tokens(text),
+            model_name=self.model_name,
+            success=True,
+        )
+
+    def _cache_store(self, key: bytes, embedding: "np.ndarray", chunk_count: int) -> "np.ndarray":
+        """
+        Remember an embedding, evicting the least recently used beyond the limit.
+
+        The cache keeps its own read-only copy, so a row of a batch matrix does not
+        keep the whole matrix alive and callers cannot alter later cache hits.
+
+        Returns:
+            The cached array, to hand out in place of the original
+        """
+        embedding = embedding.copy()
+        embedding.setflags(write=False)
+        self._embedding_cache[key] = (embedding, chunk_count)
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+
     def generate(self, text: str) -> EmbeddingResult:
         """
         Generate an embedding vector for the given text.
@@ -181,6 +260,11 @@ class EmbeddingGenerator:
         if not text or not text.strip():
             return EmbeddingResult.failure("Empty text provided")
 
+        cache_key = self._cache_key(text)
+        cached = self._cached_result(cache_key, text)
+        if cached is not None:
+            return cached
+
         try:
             model = self._get_model()
 
@@ -194,15 +278,15 @@ class EmbeddingGenerator:
             # Generate embeddings for each chunk
             chunk_embeddings = model.encode(chunks, convert_to_numpy=True)
 
-            # Average the embeddings if multiple chunks
+            # Average the embeddings if multiple chunks (one reduction, no copy for one chunk)
             if len(chunks) > 1:
                 import numpy as np
 
-                averaged = np.mean(chunk_embeddings, axis=0)
-                final_embedding = averaged.tolist()
+                final_embedding = chunk_embeddings.mean(axis=0, dtype=np.float32)
             else:
-                final_embedding = chunk_embeddings[0].tolist()
+                final_embedding = chunk_embeddings[0]
 
+            final_embedding = self._cache_store(cache_key, final_embedding, len(chunks))
             return EmbeddingResult(
                 embedding=final_embedding,
                 chunk_count=len(chunks),
@@ -219,16 +303,80 @@ class EmbeddingGenerator:
         """
         Generate embeddings for multiple texts efficiently.
 
+        All chunks of all texts go through the model in one encode call, so the
+        model runs on full batches instead of one small batch per text.
+
         Args:
             texts: List of texts to generate embeddings for
 
         Returns:
-            List of EmbeddingResult objects
+            List of EmbeddingResult objects, in the same order as texts
         """
-        results = []
-        for text in texts:
-            results.append(self.generate(text))
-        return results
+        results: list[EmbeddingResult | None] = [None] * len(texts)
+
+        # Texts still to embed after empty and cached ones are answered
+        pending: list[int] = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = EmbeddingResult.failure("Empty text provided")
+                continue
+            results[i] = self._cached_result(self._cache_key(text), text)
+            if results[i] is None:
+                pending.append(i)
+
+        if pending:
+            try:
+                import numpy as np
+
+                model = self._get_model()
+
+                # Chunk every text up front, remembering which result each belongs to
+                chunked: list[tuple[int, list[str]]] = []
+                for i in pending:
+                    chunks = self._chunk_text(texts[i])
+                    if not chunks:
+                        results[i] = EmbeddingResult.failure("No valid chunks generated from text")
+                        continue
+                    chunked.append((i, chunks))
+
+                if chunked:
+                    all_chunks = [chunk for _, chunks in chunked for chunk in chunks]
+                    counts = np.array([len(chunks) for _, chunks in chunked])
+                    logger.debug(
+                        f"Generating embeddings for {len(all_chunks)} chunk(s) "
+                        f"from {len(chunked)} text(s)"
+                    )
+
+                    chunk_embeddings = model.encode(
+                        all_chunks, batch_size=64, convert_to_numpy=True, show_progress_bar=False
+                    )
+
+                    # Average each text's rows: sum the contiguous slices, divide in place
+                    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+                    averaged = np.add.reduceat(chunk_embeddings, starts, axis=0, dtype=np.float32)
+                    averaged /= counts[:, None]
+
+                    for (i, chunks), embedding in zip(chunked, averaged, strict=True):
+                        key = self._cache_key(texts[i])
+                        embedding = self._cache_store(key, embedding, len(chunks))
+                        results[i] = EmbeddingResult(
+                            embedding=embedding,
+                            chunk_count=len(chunks),
+                            token_estimate=self._estimate_tokens(texts[i]),
+                            model_name=self.model_name,
+                            success=True,
+                        )
+
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings: {e}")
+                for i in pending:
+                    if results[i] is None:
+                        results[i] = EmbeddingResult.failure(str(e))
+
+        # Every text has a result by now: answered up front, embedded, or failed
+        done = [result for result in results if result is not None]
+        assert len(done) == len(texts)
+        return done
 
     @property
     def embedding_dimension(self) -> int:
@@ -1,8 +1,9 @@
 """Mover module for safe file movement with undo capability."""
 
-from .mover import FileMover, MoveResult
+from .mover import ActionSummary, FileMover, MoveResult
 
 __all__ = [
+    "ActionSummary",
     "FileMover",
     "MoveResult",
 ]
@@ -1,10 +1,15 @@
 """Mover component for safe file movement with undo capability."""
 
+import errno
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from ..classifier.classifier import ClassificationResult
@@ -13,6 +18,42 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Renames spend their time in syscalls with the GIL released
+_MOVE_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+
+def _move_no_clobber(source: Path, destination: Path):
+    """
+    Move a file, failing instead of overwriting an existing destination.
+
+    _resolve_conflict() only checks that a name was free; a file created there
+    since then must not be replaced. On POSIX the file is hard-linked to the new
+    name (which fails if it exists) and the old name removed. Windows renames
+    never overwrite.
+
+    Raises:
+        FileExistsError: If destination already exists
+        OSError: If the move fails
+    """
+    if os.name == "nt":
+        os.rename(source, destination)
+        return
+
+    try:
+        os.link(source, destination)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        # Across filesystems, or on one without hard links: check, then move
+        if os.path.lexists(destination):
+            raise FileExistsError(errno.EEXIST, "Destination exists", str(destination)) from e
+        if e.errno == errno.EXDEV:
+            shutil.move(source, destination)
+        else:
+            os.rename(source, destination)
+        return
+    os.unlink(source)
+
 
 @dataclass
 class MoveResult:
@@ -36,6 +77,17 @@ class MoveResult:
         return self.destination_path.parent
 
 
+@dataclass
+class ActionSummary:
+    """A recorded move, with only the fields shown in history listings."""
+
+    action_id: int
+    timestamp: datetime
+    filename: str | None
+    destination_path: str | None
+    undone: bool
+
+
 class FileMover:
     """
     Moves files safely with conflict handling and undo capability.
@@ -54,6 +106,12 @@ class FileMover:
         self.organized_base_path = Path(organized_base_path)
         self.db_session = db_session
 
+        # When set, actions are flushed inside a savepoint and the caller commits
+        self.defer_commit = False
+
+        # Actions waiting to be written together with the next one
+        self._pending_actions: list[Action] = []
+
     def _resolve_conflict(self, destination: Path) -> Path:
         """
         Resolve naming conflicts by adding (1), (2), etc.
@@ -72,23 +130,25 @@ class FileMover:
         suffixes = "".join(destination.suffixes)
         parent = destination.parent
 
-        counter = 1
-        while True:
+        # Read the folder once instead of probing each candidate with a stat. Names
+        # are casefolded so a case-insensitive filesystem never gets a clashing name.
+        with os.scandir(parent) as entries:
+            taken = {entry.name.casefold() for entry in entries}
+
+        for counter in range(1, 1001):
             new_name = f"{stem} ({counter}){suffixes}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
-            counter += 1
+            if new_name.casefold() not in taken:
+                return parent / new_name
 
-            # Safety limit
-            if counter > 1000:
-                raise RuntimeError(f"Too many conflicts for {destination}")
+        # Safety limit
+        raise RuntimeError(f"Too many conflicts for {destination}")
 
     def _record_action(
         self,
         source: Path,
         destination: Path,
         action_type: ActionType = ActionType.MOVE,
+        flush: bool = True,
     ) -> int | None:
         """
         Record an action in the database for undo capability.
@@ -97,6 +157,8 @@ class FileMover:
             source: Original file path
             destination: New file path
             action_type: Type of action
+            flush: Write this and any buffered actions now. When False the
+                action is buffered until the next flush_actions().
 
         Returns:
             Action ID if recorded, None otherwise
@@ -104,28 +166,56 @@ class FileMover:
         if self.db_session is None:
             return None
 
-        try:
-            action = Action(
-                action_type=action_type.value,
-                before_state={
-                    "path": str(source),
-                    "filename": source.name,
-                    "existed": source.exists(),
-                },
-                after_state={
-                    "path": str(destination),
-                    "filename": destination.name,
-                },
-            )
-            self.db_session.add(action)
-            self.db_session.commit()
+        self._pending_actions.append(self._build_action(source, destination, action_type))
+        if not flush:
+            return None
+        return self.flush_actions()
+
+    @staticmethod
+    def _build_action(source: Path, destination: Path, action_type: ActionType) -> Action:
+        """Create an unsaved Action describing a move or folder creation."""
+        return Action(
+            action_type=action_type,
+            before_state={
+                "path": str(source),
+                "filename": source.name,
+                "existed": source.exists(),
+            },
+            after_state={
+                "path": str(destination),
+                "filename": destination.name,
+            },
+        )
+
+    def flush_actions(self) -> int | None:
+        """
+        Write buffered actions in a single flush.
+
+        Returns:
+            ID of the last action written, None if nothing was recorded
+        """
+        if self.db_session is None or not self._pending_actions:
+            return None
 
-            logger.debug(f"Recorded action {action.id}: {action_type.value}")
-            return action.id
+        actions, self._pending_actions = self._pending_actions, []
+        try:
+            if self.defer_commit:
+                with self.db_session.begin_nested():
+                    for action in actions:
+                        self.db_session.add(action)
+            else:
+                for action in actions:
+                    self.db_session.add(action)
+                self.db_session.commit()
+
+            for action in actions:
+                logger.debug(f"Recorded action {action.id}: {action.action_type.value}")
+            return actions[-1].id
 
         except Exception as e:
             logger.error(f"Failed to record action: {e}")
-            self.db_session.rollback()
+            if not self.defer_commit:
+                self.db_session.rollback()
             return None
 
     def move(
@@ -145,26 +235,119 @@ class FileMover:
         Returns:
             MoveResult with operation status
         """
+        result = self._move(source, destination_folder, create_folders)
+        # A successful move writes its folder creation along with the move itself;
+        # on failure the folder may still have been created, so record that now
+        self.flush_actions()
+        return result
+
+    def move_batch(
+        self,
+        jobs: list[tuple[Path, str]],
+        create_folders: bool = True,
+    ) -> list[MoveResult]:
+        """
+        Move several files concurrently and record all actions in one commit.
+
+        Files bound for the same folder are moved one after another so that
+        conflict resolution sees earlier arrivals; different folders are
+        handled in parallel.
+
+        Args:
+            jobs: (source path, destination folder) pairs, as passed to move()
+            create_folders: Whether to create destination folders if they don't exist
+
+        Returns:
+            MoveResult for each job, in the same order as jobs
+        """
+        # Key on the resolved, casefolded folder so spellings of one folder ("Reports",
+        # "reports", "X/../Reports") never run in parallel
+        by_folder: dict[str, list[int]] = {}
+        for i, (_, destination_folder) in enumerate(jobs):
+            folder = (self.organized_base_path / destination_folder).resolve()
+            by_folder.setdefault(str(folder).casefold(), []).append(i)
+
+        def move_group(indices: list[int]) -> list[tuple[int, tuple[MoveResult, Path | None]]]:
+            return [(i, self._move_file(*jobs[i], create_folders)) for i in indices]
+
+        outcomes: dict[int, tuple[MoveResult, Path | None]] = {}
+        if by_folder:
+            workers = min(_MOVE_WORKERS, len(by_folder))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mover") as executor:
+                # Iterating the results re-raises any unexpected worker exception here
+                for group in executor.map(move_group, by_folder.values()):
+                    outcomes.update(group)
+
+        # The session is only touched from this thread, after all renames finished
+        results = []
+        move_actions: dict[int, Action] = {}
+        for i in range(len(jobs)):
+            result, created_folder = outcomes[i]
+            results.append(result)
+            if self.db_session is None:
+                continue
+            if created_folder is not None:
+                self._pending_actions.append(
+                    self._build_action(created_folder, created_folder, ActionType.CREATE_FOLDER)
+                )
+            if result.success:
+                move_actions[i] = self._build_action(
+                    result.source_path, result.destination_path, ActionType.MOVE
+                )
+                self._pending_actions.append(move_actions[i])
+
+        if self.flush_actions() is not None:
+            for i, action in move_actions.items():
+                results[i].action_id = action.id  # type: ignore
+
+        return results
+
+    def _move(self, source: Path, destination_folder: str, create_folders: bool) -> MoveResult:
+        """Move a file, buffering the folder creation action until the move is recorded."""
+        result, created_folder = self._move_file(source, destination_folder, create_folders)
+
+        if created_folder is not None:
+            self._record_action(
+                created_folder, created_folder, ActionType.CREATE_FOLDER, flush=False
+            )
+        if result.success:
+            result.action_id = self._record_action(
+                result.source_path, result.destination_path, ActionType.MOVE
+            )
+        return result
+
+    def _move_file(
+        self, source: Path, destination_folder: str, create_folders: bool
+    ) -> tuple[MoveResult, Path | None]:
+        """
+        Move a file on disk without touching the database.
+
+        Returns:
+            Tuple of (MoveResult, folder created for the move or None)
+        """
         source = Path(source).resolve()
+        created_folder = None
 
-        # Validate source exists
-        if not source.exists():
+        # Validate source exists and is a regular file, with a single stat
+        try:
+            source_mode = os.stat(source).st_mode
+        except OSError:
             return MoveResult(
                 source_path=source,
                 destination_path=source,
                 filename=source.name,
                 success=False,
                 error_message=f"Source file not found: {source}",
-            )
+            ), None
 
-        if not source.is_file():
+        if not stat.S_ISREG(source_mode):
             return MoveResult(
                 source_path=source,
                 destination_path=source,
                 filename=source.name,
                 success=False,
                 error_message=f"Source is not a file: {source}",
-            )
+            ), None
 
         # Build destination path
         dest_folder = self.organized_base_path / destination_folder
@@ -175,11 +358,7 @@ class FileMover:
             try:
                 dest_folder.mkdir(parents=True, exist_ok=True)
                 logger.info(f"Created folder: {dest_folder}")
-
-                # Record folder creation
-                self._record_action(
-                    dest_folder, dest_folder, ActionType.CREATE_FOLDER
-                )
+                created_folder = dest_folder
 
             except OSError as e:
                 return MoveResult(
@@ -188,7 +367,7 @@ class FileMover:
                     filename=source.name,
                     success=False,
                     error_message=f"Failed to create folder: {e}",
-                )
+                ), None
 
         # Resolve naming conflicts
         try:
@@ -200,23 +379,19 @@ class FileMover:
                 filename=source.name,
                 success=False,
                 error_message=str(e),
-            )
+            ), created_folder
 
         # Perform the move
         try:
-            shutil.move(str(source), str(destination))
+            _move_no_clobber(source, destination)
             logger.info(f"Moved: {source.name} -> {destination}")
 
-            # Record the action
-            action_id = self._record_action(source, destination, ActionType.MOVE)
-
             return MoveResult(
                 source_path=source,
                 destination_path=destination,
                 filename=destination.name,
                 success=True,
-                action_id=action_id,
-            )
+            ), created_folder
 
         except PermissionError as e:
             logger.error(f"Permission denied moving {source}: {e}")
@@ -226,7 +401,7 @@ class FileMover:
                 filename=source.name,
                 success=False,
                 error_message=f"Permission denied: {e}",
-            )
+            ), created_folder
 
         except OSError as e:
             logger.error(f"Error moving {source}: {e}")
@@ -236,7 +411,7 @@ class FileMover:
                 filename=source.name,
                 success=False,
                 error_message=f"Move failed: {e}",
-            )
+            ), created_folder
 
     def move_from_classification(
         self,
@@ -296,13 +471,13 @@ class FileMover:
                 error_message=f"Action {action_id} was already undone",
             )
 
-        if action.action_type != ActionType.MOVE.value:
+        if action.action_type != ActionType.MOVE:
             return MoveResult(
                 source_path=Path("."),
                 destination_path=Path("."),
                 filename="",
                 success=False,
-                error_message=f"Cannot undo action type: {action.action_type}",
+                error_message=f"Cannot undo action type: {action.action_type.value}",
             )
 
         # Get paths from action state
@@ -327,7 +502,7 @@ class FileMover:
             # Resolve conflicts for original location
             final_destination = self._resolve_conflict(original_path)
 
-            shutil.move(str(current_path), str(final_destination))
+            _move_no_clobber(current_path, final_destination)
 
             # Mark action as undone
             action.undone = True
@@ -354,23 +529,33 @@ class FileMover:
                 error_message=f"Undo failed: {e}",
             )
 
-    def get_recent_actions(self, limit: int = 10) -> list[Action]:
+    def get_recent_actions(self, limit: int = 10) -> list[ActionSummary]:
         """
         Get recent move actions for display.
 
+        Only the displayed fields are selected; the filename and destination are
+        extracted from the JSON state columns by SQLite, so no Action objects are
+        built and no JSON documents are parsed in Python.
+
         Args:
             limit: Maximum number of actions to return
 
         Returns:
-            List of Action objects
+            List of ActionSummary objects, newest first
         """
         if self.db_session is None:
             return []
 
-        return (
-            self.db_session.query(Action)
-            .filter(Action.action_type == ActionType.MOVE.value)
-            .order_by(Action.timestamp.desc())
+        statement: Select = (
+            select(
+                Action.id,
+                Action.timestamp,
+                Action.before_state["filename"].as_string(),
+                Action.after_state["path"].as_string(),
+                Action.undone,
+            )
+            .where(Action.action_type == ActionType.MOVE)
+            .order_by(Action.timestamp.desc(), Action.id.desc())
             .limit(limit)
-            .all()
         )
+        return [ActionSummary(*row) for row in self.db_session.execute(statement)]
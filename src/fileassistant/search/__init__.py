@@ -1,11 +1,12 @@
 """Search module for vector-based file search using ChromaDB."""
 
-from .index_manager import IndexManager, IndexedFileMetadata
+from .index_manager import IndexManager, IndexedFileMetadata, IndexRecord
 from .engine import SearchEngine, SearchResult
 
 __all__ = [
     "IndexManager",
     "IndexedFileMetadata",
+    "IndexRecord",
     "SearchEngine",
     "SearchResult",
 ]
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from ..embeddings import EmbeddingGenerator
@@ -11,7 +12,13 @@ from .index_manager import IndexManager, IndexedFileMetadata
 logger = get_logger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _normalize_extension(ext: str) -> str:
+    """Normalize an extension filter to the stored form: leading dot, lowercase."""
+    return (ext if ext.startswith(".") else f".{ext}").lower()
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result with relevance information."""
 
@@ -45,8 +52,9 @@ class SearchResult:
         Returns:
             SearchResult with normalized relevance score
         """
-        # Normalize distance to relevance score (0-1, higher = better)
-        # ChromaDB uses L2 distance by default, typical range 0-2
+        # Normalize distance to relevance score (0-1, higher = better). The index
+        # stores unit vectors, so ChromaDB's squared L2 distance is 2 - 2 * cosine
+        # and this is the cosine similarity, clipped at zero
         relevance = max(0.0, min(1.0, 1.0 - (distance / max_distance)))
 
         # Create snippet from document (first ~200 chars)
@@ -96,6 +104,22 @@ class SearchEngine:
         self.index_manager = index_manager or IndexManager(persist_directory=persist_directory)
         self.embedding_generator = embedding_generator or EmbeddingGenerator()
 
+        # Index size observed by the most recent search (None until a search runs)
+        self.last_indexed_count: int | None = None
+
+    def warm_up(self):
+        """
+        Load the embedding model ahead of the first query.
+
+        Meant to run on a background thread while the caller opens the index,
+        so model loading overlaps with ChromaDB start-up. Failures are only
+        logged here; search() reports them when it needs the model.
+        """
+        try:
+            self.embedding_generator._get_model()
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed: {e}")
+
     def search(
         self,
         query: str,
@@ -108,7 +132,7 @@ class SearchEngine:
         Args:
             query: Natural language search query
             filters: Optional filters:
-                - extension: str or list[str] (e.g., ".pdf" or [".pdf", ".docx"])
+                - extension: str or collection of str (e.g., ".pdf" or {".pdf", ".docx"})
                 - after: datetime - only files modified after this date
                 - before: datetime - only files modified before this date
                 - tag: str or list[str] - files must have these tags
@@ -116,7 +140,9 @@ class SearchEngine:
             limit: Maximum number of results to return
 
         Returns:
-            List of SearchResult objects sorted by relevance
+            List of SearchResult objects sorted by relevance. After the call,
+            ``last_indexed_count`` holds the index size seen by this search so
+            callers can tell an empty index apart from a query with no matches.
         """
         filters = filters or {}
 
@@ -125,13 +151,15 @@ class SearchEngine:
             logger.warning("Empty search query provided")
             return []
 
-        query = query.strip()
+        # Collapse whitespace so spacing variants of a query share one cached embedding
+        query = " ".join(query.split())
         if len(query) < 2:
             logger.warning(f"Query too short: '{query}'")
             return []
 
         # Check if index is empty
         indexed_count = self.index_manager.get_indexed_count()
+        self.last_indexed_count = indexed_count
         if indexed_count == 0:
             logger.info("Search attempted on empty index")
             return []
@@ -147,8 +175,9 @@ class SearchEngine:
         # Build ChromaDB where filter for extension/file_type (these are efficient in ChromaDB)
         chroma_where = self._build_chroma_filter(filters)
 
-        # Fetch more results than needed to allow for post-filtering
-        fetch_limit = min(limit * 2, 100)
+        # Fetch more results than needed only when post-filters may drop some
+        post_filters = self._prepare_post_filters(filters)
+        fetch_limit = min(limit * 2, 100) if post_filters else limit
 
         # Query the index
         raw_results = self.index_manager.search(
@@ -165,7 +194,7 @@ class SearchEngine:
         results = []
         for metadata, distance, document in raw_results:
             # Apply post-retrieval filters (date, tags)
-            if not self._passes_post_filters(metadata, filters):
+            if post_filters and not self._matches_post_filters(metadata, post_filters):
                 continue
 
             result = SearchResult.from_index_result(metadata, distance, document)
@@ -190,14 +219,12 @@ class SearchEngine:
         if "extension" in filters:
             ext = filters["extension"]
             if isinstance(ext, str):
-                # Normalize extension format
-                ext = ext if ext.startswith(".") else f".{ext}"
-                conditions.append({"extension": ext.lower()})
-            elif isinstance(ext, list) and ext:
-                # Multiple extensions - use $in operator
-                exts = [e if e.startswith(".") else f".{e}" for e in ext]
-                exts = [e.lower() for e in exts]
-                conditions.append({"extension": {"$in": exts}})
+                conditions.append({"extension": _normalize_extension(ext)})
+            elif isinstance(ext, (list, tuple, set, frozenset)) and ext:
+                # Multiple extensions - use $in operator (sets are sorted for a stable filter)
+                if isinstance(ext, (set, frozenset)):
+                    ext = sorted(ext)
+                conditions.append({"extension": {"$in": [_normalize_extension(e) for e in ext]}})
 
         # File type filter
         if "file_type" in filters:
@@ -211,42 +238,73 @@ class SearchEngine:
 
         return {"$and": conditions}
 
-    def _passes_post_filters(self, metadata: IndexedFileMetadata, filters: dict) -> bool:
+    def _prepare_post_filters(self, filters: dict) -> dict:
         """
-        Check if metadata passes filters that can't be done in ChromaDB.
+        Normalize the filters that can't be done in ChromaDB, once per query.
+
+        Date strings are parsed and tags lowercased here rather than for every
+        candidate result.
 
         Args:
-            metadata: The file metadata to check
             filters: User-provided filters
 
         Returns:
-            True if file passes all filters
+            Dict with "after"/"before" datetimes and a "tag" set, for those present
         """
+        prepared = {}
+
         # Date range filters
-        if "after" in filters and filters["after"]:
-            after_date = filters["after"]
-            if isinstance(after_date, str):
-                after_date = datetime.fromisoformat(after_date)
-            if metadata.modified_at and metadata.modified_at < after_date:
-                return False
-
-        if "before" in filters and filters["before"]:
-            before_date = filters["before"]
-            if isinstance(before_date, str):
-                before_date = datetime.fromisoformat(before_date)
-            if metadata.modified_at and metadata.modified_at > before_date:
-                return False
+        for key in ("after", "before"):
+            if filters.get(key):
+                value = filters[key]
+                prepared[key] = datetime.fromisoformat(value) if isinstance(value, str) else value
 
         # Tag filter
-        if "tag" in filters and filters["tag"]:
+        if filters.get("tag"):
             required_tags = filters["tag"]
             if isinstance(required_tags, str):
                 required_tags = [required_tags]
-            # Check if file has any of the required tags
-            file_tags = set(t.lower() for t in metadata.tags)
-            required_set = set(t.lower() for t in required_tags)
-            if not file_tags.intersection(required_set):
-                return False
+            prepared["tag"] = {t.lower() for t in required_tags}
+
+        return prepared
+
+    def _passes_post_filters(self, metadata: IndexedFileMetadata, filters: dict) -> bool:
+        """
+        Check if metadata passes filters that can't be done in ChromaDB.
+
+        Args:
+            metadata: The file metadata to check
+            filters: User-provided filters
+
+        Returns:
+            True if file passes all filters
+        """
+        return self._matches_post_filters(metadata, self._prepare_post_filters(filters))
+
+    def _matches_post_filters(self, metadata: IndexedFileMetadata, filters: dict) -> bool:
+        """
+        Check metadata against filters already normalized by _prepare_post_filters().
+
+        Args:
+            metadata: The file metadata to check
+            filters: Prepared filters
+
+        Returns:
+            True if file passes all filters
+        """
+        # Date range filters
+        after_date = filters.get("after")
+        if after_date and metadata.modified_at and metadata.modified_at < after_date:
+            return False
+
+        before_date = filters.get("before")
+        if before_date and metadata.modified_at and metadata.modified_at > before_date:
+            return False
+
+        # Check if file has any of the required tags
+        required_tags = filters.get("tag")
+        if required_tags and not any(t.lower() in required_tags for t in metadata.tags):
+            return False
 
         return True
 
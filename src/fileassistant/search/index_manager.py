@@ -4,13 +4,38 @@ import hashlib
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger(__name__)
 
+# ChromaDB already searches with an HNSW graph; these widen the graph for better
+# recall on 384-d embeddings and trim the per-query candidate list. Only applied
+# when the collection is first created.
+_HNSW_CONFIG = {"max_neighbors": 32, "ef_construction": 100, "ef_search": 64}
 
-@dataclass
+
+def _unit_rows(embeddings: "np.ndarray | list") -> "np.ndarray":
+    """
+    Scale each embedding to unit length.
+
+    For unit vectors ChromaDB's squared L2 distance is exactly 2 - 2 * cosine
+    similarity, so stored and query vectors are normalized the same way.
+    """
+    import numpy as np
+
+    # Always copy: cached embeddings are read-only
+    matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+@dataclass(slots=True)
 class IndexedFileMetadata:
     """Metadata stored alongside file embeddings in ChromaDB."""
 
@@ -61,11 +86,28 @@ class IndexedFileMetadata:
             created_at=datetime.fromisoformat(metadata["created_at"]) if metadata.get("created_at") else None,
             modified_at=datetime.fromisoformat(metadata["modified_at"]) if metadata.get("modified_at") else None,
             indexed_at=datetime.fromisoformat(metadata["indexed_at"]) if metadata.get("indexed_at") else datetime.now(),
-            size_bytes=int(metadata.get("size_bytes", 0)),
+            size_bytes=metadata.get("size_bytes", 0),  # Stored as an int
             source_folder=metadata.get("source_folder", ""),
         )
 
 
+@dataclass
+class IndexRecord:
+    """A file to add or update in the index, as accepted by index_files()."""
+
+    file_id: str
+    file_path: Path
+    text: str
+    embedding: "np.ndarray | list[float]"
+    tags: list[str] | None = None
+    content_summary: str | None = None
+    file_type: str = "document"
+    created_at: datetime | None = None
+    modified_at: datetime | None = None
+    size_bytes: int = 0
+    content_hash: str | None = None  # Computed from text when not given
+
+
 class IndexManager:
     """
     Manages file embeddings in ChromaDB.
@@ -118,10 +160,28 @@ class IndexManager:
             self._collection = client.get_or_create_collection(
                 name=self.COLLECTION_NAME,
                 metadata={"description": "FileAssistant indexed files"},
+                configuration={"hnsw": _HNSW_CONFIG},
             )
             logger.info(f"ChromaDB collection ready: {self.COLLECTION_NAME}")
         return self._collection
 
+    def warm_up(self):
+        """
+        Open the collection and load its vector index ahead of the first query.
+
+        Runs a one-result query with a stored vector, so ChromaDB reads the
+        HNSW index from disk now rather than during the first search. Failures
+        are only logged here; search() reports them.
+        """
+        try:
+            collection = self._get_collection()
+            sample = collection.get(limit=1, include=["embeddings"])
+            if not sample["ids"]:
+                return
+            collection.query(query_embeddings=[sample["embeddings"][0]], n_results=1, include=[])
+        except Exception as e:
+            logger.warning(f"Index warm-up failed: {e}")
+
     @staticmethod
     def compute_content_hash(text: str) -> str:
         """Compute a hash of the content for change detection."""
@@ -132,7 +192,7 @@ class IndexManager:
         file_id: str,
         file_path: Path | str,
         text: str,
-        embedding: list[float],
+        embedding: "np.ndarray | list[float]",
         tags: list[str] | None = None,
         content_summary: str | None = None,
         file_type: str = "document",
@@ -158,40 +218,82 @@ class IndexManager:
         Returns:
             True if successful, False otherwise
         """
+        return self.index_files(
+            [
+                IndexRecord(
+                    file_id=file_id,
+                    file_path=Path(file_path),
+                    text=text,
+                    embedding=embedding,
+                    tags=tags,
+                    content_summary=content_summary,
+                    file_type=file_type,
+                    created_at=created_at,
+                    modified_at=modified_at,
+                    size_bytes=size_bytes,
+                )
+            ]
+        )
+
+    def index_files(self, records: list[IndexRecord]) -> bool:
+        """
+        Add or update several files in the index with a single upsert.
+
+        Args:
+            records: Files to index
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not records:
+            return True
+
         try:
             collection = self._get_collection()
-            file_path = Path(file_path)
-
-            # Build metadata
-            metadata = IndexedFileMetadata(
-                file_id=file_id,
-                file_path=str(file_path),
-                filename=file_path.name,
-                extension=file_path.suffix.lower(),
-                file_type=file_type,
-                tags=tags or [],
-                content_summary=content_summary or text[:500],
-                content_hash=self.compute_content_hash(text),
-                created_at=created_at,
-                modified_at=modified_at,
-                indexed_at=datetime.now(),
-                size_bytes=size_bytes,
-                source_folder=file_path.parent.name,
-            )
+            indexed_at = datetime.now()
+
+            ids = []
+            embeddings = []
+            documents = []
+            metadatas = []
+            for record in records:
+                file_path = record.file_path
+                metadata = IndexedFileMetadata(
+                    file_id=record.file_id,
+                    file_path=str(file_path),
+                    filename=file_path.name,
+                    extension=file_path.suffix.lower(),
+                    file_type=record.file_type,
+                    tags=record.tags or [],
+                    content_summary=record.content_summary or record.text[:500],
+                    content_hash=record.content_hash or self.compute_content_hash(record.text),
+                    created_at=record.created_at,
+                    modified_at=record.modified_at,
+                    indexed_at=indexed_at,
+                    size_bytes=record.size_bytes,
+                    source_folder=file_path.parent.name,
+                )
+                ids.append(record.file_id)
+                embeddings.append(record.embedding)
+                documents.append(record.text[:2000])  # First 2000 chars for snippet display
+                metadatas.append(metadata.to_chroma_metadata())
 
             # Use upsert to add or update
             collection.upsert(
-                ids=[file_id],
-                embeddings=[embedding],
-                documents=[text[:2000]],  # Store first 2000 chars for snippet display
-                metadatas=[metadata.to_chroma_metadata()],
+                ids=ids,
+                embeddings=_unit_rows(embeddings),
+                documents=documents,
+                metadatas=metadatas,
             )
 
-            logger.debug(f"Indexed file: {file_path.name} (id={file_id})")
+            logger.debug(f"Indexed {len(records)} file(s)")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to index file {file_path}: {e}")
+            if len(records) == 1:
+                logger.error(f"Failed to index file {records[0].file_path}: {e}")
+            else:
+                logger.error(f"Failed to index {len(records)} files: {e}")
             return False
 
     def remove_file(self, file_id: str) -> bool:
@@ -258,6 +360,41 @@ class IndexManager:
             logger.error(f"Failed to check if indexed: {e}")
             return False
 
+    def lookup_cached_embeddings(self, content_hashes: list[str]) -> "dict[str, np.ndarray]":
+        """
+        Find stored embeddings for content that is already indexed.
+
+        A file that was moved or copied keeps its content hash, so its
+        embedding can be reused instead of running the model again.
+
+        Args:
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Mapping of content hash to stored embedding, for the hashes found
+        """
+        wanted = list(set(content_hashes))
+        if not wanted:
+            return {}
+
+        try:
+            collection = self._get_collection()
+            result = collection.get(
+                where={"content_hash": {"$in": wanted}},
+                include=["embeddings", "metadatas"],
+            )
+
+            return {
+                metadata["content_hash"]: embedding
+                for metadata, embedding in zip(
+                    result["metadatas"], result["embeddings"], strict=True
+                )
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to look up cached embeddings: {e}")
+            return {}
+
     def get_file(self, file_id: str) -> tuple[IndexedFileMetadata | None, str | None]:
         """
         Get a file's metadata and stored text snippet.
@@ -289,7 +426,7 @@ class IndexManager:
 
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: "np.ndarray | list[float]",
         n_results: int = 10,
         where: dict | None = None,
     ) -> list[tuple[IndexedFileMetadata, float, str]]:
@@ -308,7 +445,7 @@ class IndexManager:
             collection = self._get_collection()
 
             results = collection.query(
-                query_embeddings=[query_embedding],
+                query_embeddings=_unit_rows(query_embedding),
                 n_results=n_results,
                 where=where,
                 include=["metadatas", "documents", "distances"],
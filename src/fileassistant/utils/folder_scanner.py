@@ -1,6 +1,12 @@
 """Folder scanner utility for discovering existing folder structures."""
 
+import heapq
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 from .logging import get_logger
@@ -35,8 +41,11 @@ EXCLUDED_FOLDERS = {
     ".fileassistant",
 }
 
+# Hidden folders and temp folders, excluded by their first character
+_EXCLUDED_PREFIXES = (".", "~")
 
-@dataclass
+
+@dataclass(slots=True)
 class FolderNode:
     """Represents a folder in the tree structure."""
 
@@ -47,38 +56,47 @@ class FolderNode:
 
     def to_tree_string(self, prefix: str = "", is_last: bool = True) -> str:
         """Convert this node and children to a tree string representation."""
+        # Depth-first with an explicit stack so deep trees cannot hit the recursion
+        # limit; every line goes into one list that is joined once
         lines = []
-
-        # Add this node
-        if self.depth == 0:
-            lines.append(f"{self.name}/")
-        else:
-            connector = "└── " if is_last else "├── "
-            lines.append(f"{prefix}{connector}{self.name}/")
-
-        # Add children
-        child_prefix = prefix + ("    " if is_last else "│   ")
-        for i, child in enumerate(self.children):
-            is_last_child = i == len(self.children) - 1
-            lines.append(child.to_tree_string(child_prefix, is_last_child))
+        stack = [(self, prefix, is_last)]
+        while stack:
+            node, node_prefix, node_is_last = stack.pop()
+
+            # Add this node
+            if node.depth == 0:
+                lines.append(f"{node.name}/")
+            else:
+                connector = "└── " if node_is_last else "├── "
+                lines.append(f"{node_prefix}{connector}{node.name}/")
+
+            # Add children, last pushed first so they pop in order
+            child_prefix = node_prefix + ("    " if node_is_last else "│   ")
+            last = len(node.children) - 1
+            stack.extend(
+                (child, child_prefix, i == last)
+                for i, child in reversed(list(enumerate(node.children)))
+            )
 
         return "\n".join(lines)
 
     def get_all_paths(self, relative_to: Path | None = None) -> list[str]:
         """Get all folder paths as a flat list of relative path strings."""
-        paths = []
-
+        path = self.path
         if relative_to:
             try:
-                rel_path = self.path.relative_to(relative_to)
-                paths.append(str(rel_path).replace("\\", "/"))
+                path = self.path.relative_to(relative_to)
             except ValueError:
-                paths.append(str(self.path).replace("\\", "/"))
-        else:
-            paths.append(str(self.path).replace("\\", "/"))
+                pass
 
-        for child in self.children:
-            paths.extend(child.get_all_paths(relative_to))
+        # Depth-first in child order; each path extends its parent's string rather
+        # than re-deriving it from a Path
+        paths = []
+        stack = [(self, str(path).replace("\\", "/"))]
+        while stack:
+            node, node_path = stack.pop()
+            paths.append(node_path)
+            stack.extend((child, f"{node_path}/{child.name}") for child in reversed(node.children))
 
         return paths
 
@@ -90,6 +108,12 @@ class FolderScanResult:
     roots: list[FolderNode] = field(default_factory=list)
     total_folders: int = 0
     max_depth_reached: int = 0
+    # Set when the scan stopped at its folder limit, so total_folders is a lower bound
+    truncated: bool = False
+    # Rendered prompt context by max_folders; a result is reused across classifications
+    _prompt_context_cache: dict[int, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def to_tree_string(self) -> str:
         """Get a combined tree string of all roots."""
@@ -116,19 +140,24 @@ class FolderScanResult:
         Returns:
             A string representation suitable for LLM context
         """
-        all_paths = self.get_all_paths()
+        cached = self._prompt_context_cache.get(max_folders)
+        if cached is not None:
+            return cached
 
-        # Sort by path for readability
-        all_paths.sort()
+        all_paths = self.get_all_paths()
 
-        # Truncate if needed
+        # Sort by path for readability; when truncating, only the kept paths are ordered
         if len(all_paths) > max_folders:
-            all_paths = all_paths[:max_folders]
-            truncated_note = f"\n... and {self.total_folders - max_folders} more folders"
+            all_paths = heapq.nsmallest(max_folders, all_paths)
+            more = f"{self.total_folders - max_folders}{'+' if self.truncated else ''}"
+            truncated_note = f"\n... and {more} more folders"
         else:
-            truncated_note = ""
+            all_paths.sort()
+            truncated_note = "\n... and more folders" if self.truncated else ""
 
-        return "\n".join(f"- {p}" for p in all_paths) + truncated_note
+        context = "\n".join(f"- {p}" for p in all_paths) + truncated_note
+        self._prompt_context_cache[max_folders] = context
+        return context
 
 
 class FolderScanner:
@@ -143,6 +172,7 @@ class FolderScanner:
         self,
         max_depth: int = 4,
         excluded_folders: set[str] | None = None,
+        max_workers: int = 8,
     ):
         """
         Initialize the folder scanner.
@@ -150,80 +180,112 @@ class FolderScanner:
         Args:
             max_depth: Maximum depth to scan (0 = root only)
             excluded_folders: Additional folder names to exclude
+            max_workers: Folders listed concurrently (1 = no threads)
         """
         self.max_depth = max_depth
+        self.max_workers = max_workers
         self.excluded_folders = EXCLUDED_FOLDERS.copy()
         if excluded_folders:
             self.excluded_folders.update(excluded_folders)
 
     def _should_exclude(self, folder: Path) -> bool:
         """Check if a folder should be excluded from scanning."""
-        name = folder.name
-
-        # Check against excluded names
-        if name in self.excluded_folders:
-            return True
-
-        # Exclude hidden folders (starting with .)
-        if name.startswith("."):
-            return True
+        return self._should_exclude_name(folder.name)
 
-        # Exclude folders starting with ~ (temp files)
-        if name.startswith("~"):
-            return True
+    def _should_exclude_name(self, name: str) -> bool:
+        """Check if a folder name should be excluded from scanning."""
+        # Excluded names, hidden folders (.) and temp folders (~)
+        return name in self.excluded_folders or name.startswith(_EXCLUDED_PREFIXES)
 
-        return False
-
-    def _scan_folder(self, folder: Path, current_depth: int) -> FolderNode | None:
+    def _list_subfolders(self, folder: Path) -> list[str]:
         """
-        Recursively scan a folder and build a tree.
-
-        Args:
-            folder: Folder to scan
-            current_depth: Current depth in the tree
+        List the names of a folder's subfolders that are not excluded, sorted.
 
         Returns:
-            FolderNode or None if folder should be excluded
+            Subfolder names, empty if the folder cannot be read
         """
-        if self._should_exclude(folder):
-            return None
-
-        node = FolderNode(
-            name=folder.name,
-            path=folder,
-            depth=current_depth,
-        )
-
-        # Stop at max depth
-        if current_depth >= self.max_depth:
-            return node
-
-        # Scan children
+        # scandir reports entry types from the directory listing itself, so files
+        # and excluded names are dropped without a stat or a Path each
+        exclude = self._should_exclude_name
         try:
-            for child in sorted(folder.iterdir()):
-                if child.is_dir():
-                    child_node = self._scan_folder(child, current_depth + 1)
-                    if child_node:
-                        node.children.append(child_node)
+            with os.scandir(folder) as entries:
+                return sorted(
+                    entry.name for entry in entries if not exclude(entry.name) and entry.is_dir()
+                )
         except PermissionError:
             logger.debug(f"Permission denied accessing {folder}")
         except OSError as e:
             logger.debug(f"Error accessing {folder}: {e}")
+        return []
+
+    def _walk(self, roots: list[Path]) -> Iterator[tuple[Path, int, int]]:
+        """
+        Walk folder trees breadth-first, children in sorted order.
 
-        return node
+        All roots are walked together level by level, so a limit on the number of
+        folders read keeps the shallow folders of every root rather than one deep
+        subtree. The folders of a level are listed concurrently, which hides
+        per-directory latency on network filesystems; the order is unchanged.
 
-    def scan(self, paths: list[Path]) -> FolderScanResult:
+        Args:
+            roots: Folders to start from (depth 0)
+
+        Yields:
+            (folder, depth, root_index) for every folder that is not excluded, where
+            root_index is the position in roots of the root it was found under
         """
-        Scan multiple root paths and return combined results.
+        level = [(i, root) for i, root in enumerate(roots) if not self._should_exclude(root)]
+        depth = 0
+        # Threads are only started on the first level with several folders to list
+        executor = (
+            ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scan")
+            if self.max_workers > 1
+            else None
+        )
+        try:
+            while level:
+                # A level is yielded before any of it is listed, so a caller that
+                # stops early never pays for listing folders it did not reach
+                for root_index, folder in level:
+                    yield folder, depth, root_index
+
+                # Stop at max depth
+                if depth >= self.max_depth:
+                    break
+
+                folders = [folder for _, folder in level]
+                listings: Iterable[list[str]]
+                if executor is None or len(level) == 1:
+                    listings = map(self._list_subfolders, folders)
+                else:
+                    listings = executor.map(self._list_subfolders, folders)
+                level = [
+                    (root_index, folder / name)
+                    for (root_index, folder), names in zip(level, listings, strict=True)
+                    for name in names
+                ]
+                depth += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def iter_folders(self, paths: Iterable[Path]) -> Iterator[tuple[Path, int]]:
+        """
+        Lazily yield the folders under multiple root paths.
 
         Args:
-            paths: List of root paths to scan
+            paths: Root paths to scan
 
-        Returns:
-            FolderScanResult with all discovered folders
+        Yields:
+            (folder, depth) pairs breadth-first: every root at depth 0, then
+            all folders at depth 1, and so on
         """
-        result = FolderScanResult()
+        for folder, depth, _ in self._walk(self._resolve_roots(paths)):
+            yield folder, depth
 
+    def _resolve_roots(self, paths: Iterable[Path]) -> list[Path]:
+        """Resolve root paths, skipping (with a warning) any that are not directories."""
+        roots = []
         for path in paths:
             path = Path(path).resolve()
 
@@ -236,14 +298,46 @@ class FolderScanner:
                 continue
 
             logger.debug(f"Scanning folder structure: {path}")
+            roots.append(path)
+
+        return roots
+
+    def scan(self, paths: list[Path], max_folders: int | None = None) -> FolderScanResult:
+        """
+        Scan multiple root paths and return combined results.
+
+        Args:
+            paths: List of root paths to scan
+            max_folders: Stop after this many folders (None = no limit). Folders
+                are read shallowest first, so the limit drops the deepest ones.
 
-            root_node = self._scan_folder(path, 0)
-            if root_node:
-                result.roots.append(root_node)
+        Returns:
+            FolderScanResult with all discovered folders
+        """
+        result = FolderScanResult()
 
-        # Calculate statistics
-        result.total_folders = self._count_folders(result)
-        result.max_depth_reached = self._find_max_depth(result)
+        # Rebuild the tree from the stream; a parent is always read before its
+        # children. Nodes are keyed by root as well as path, so overlapping or
+        # repeated roots each get their own subtree. One folder past the limit is
+        # read to tell whether the scan was cut short.
+        nodes: dict[tuple[int, Path], FolderNode] = {}
+        limit = None if max_folders is None else max_folders + 1
+        walk = self._walk(self._resolve_roots(paths))
+        for folder, depth, root_index in islice(walk, limit):
+            if result.total_folders == max_folders:
+                result.truncated = True
+                break
+
+            # Common names (src, docs, 2024) recur across a tree; share one string each
+            node = FolderNode(name=sys.intern(folder.name), path=folder, depth=depth)
+            if depth == 0:
+                result.roots.append(node)
+            else:
+                nodes[root_index, folder.parent].children.append(node)
+            nodes[root_index, folder] = node
+
+            result.total_folders += 1
+            result.max_depth_reached = max(result.max_depth_reached, depth)
 
         logger.info(
             f"Scanned {len(paths)} root(s), found {result.total_folders} folders "
@@ -252,26 +346,6 @@ class FolderScanner:
 
         return result
 
-    def _count_folders(self, result: FolderScanResult) -> int:
-        """Count total folders in the result."""
-
-        def count_node(node: FolderNode) -> int:
-            return 1 + sum(count_node(child) for child in node.children)
-
-        return sum(count_node(root) for root in result.roots)
-
-    def _find_max_depth(self, result: FolderScanResult) -> int:
-        """Find the maximum depth in the result."""
-
-        def max_depth_node(node: FolderNode) -> int:
-            if not node.children:
-                return node.depth
-            return max(max_depth_node(child) for child in node.children)
-
-        if not result.roots:
-            return 0
-        return max(max_depth_node(root) for root in result.roots)
-
 
 def scan_folders_for_context(
     paths: list[Path],
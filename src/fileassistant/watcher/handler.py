@@ -1,5 +1,8 @@
 """File system event handler with debouncing."""
 
+import heapq
+import logging
+import os
 import threading
 import time
 from collections.abc import Callable
@@ -44,6 +47,14 @@ IGNORED_PATTERNS = {
 SUPPORTED_EXTENSIONS = {".txt", ".md", ".pdf", ".docx"}
 
 
+def _lower_suffix(name: str) -> str:
+    """Return a file name's extension, lowercased, with Path.suffix semantics."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
+
+
 class DebouncedFileHandler(FileSystemEventHandler):
     """
     File system event handler with debouncing.
@@ -70,132 +81,196 @@ class DebouncedFileHandler(FileSystemEventHandler):
         self.callback = callback
         self.debounce_seconds = debounce_seconds
         self.supported_extensions = supported_extensions or SUPPORTED_EXTENSIONS
-
-        # Track pending files: path -> (timer, last_size)
-        self._pending: dict[str, tuple[threading.Timer, int]] = {}
+        self._supported_lc = frozenset(e.lower() for e in self.supported_extensions)
+
+        # Track pending files: path -> deadline (time.monotonic), and path -> size
+        # when scheduled. The heap may hold stale entries for rescheduled files;
+        # only an entry matching _deadlines is due.
+        self._deadlines: dict[str, float] = {}
+        self._sizes: dict[str, int] = {}
+        self._heap: list[tuple[float, str]] = []
         self._lock = threading.Lock()
 
-    def _should_ignore(self, path: Path) -> bool:
+        # One scheduler thread serves every pending file, started on first use
+        self._wakeup = threading.Condition(self._lock)
+        self._scheduler: threading.Thread | None = None
+        self._stopped = False
+
+    def _should_ignore(self, path: str | Path) -> bool:
         """Check if a file should be ignored based on name or extension."""
+        name = os.path.basename(path)
+
         # Ignore hidden files
-        if path.name.startswith("."):
+        if name.startswith("."):
             return True
 
         # Ignore known system files
-        if path.name in IGNORED_PATTERNS:
+        if name in IGNORED_PATTERNS:
             return True
 
         # Ignore temp file extensions
-        suffix = path.suffix.lower()
-        if suffix in IGNORED_EXTENSIONS:
+        if _lower_suffix(name) in IGNORED_EXTENSIONS:
             return True
 
         # Ignore files that end with ~ (backup files)
-        if path.name.endswith("~"):
+        if name.endswith("~"):
             return True
 
         return False
 
-    def _is_supported(self, path: Path) -> bool:
+    def _is_supported(self, path: str | Path) -> bool:
         """Check if file extension is supported."""
-        return path.suffix.lower() in self.supported_extensions
+        return _lower_suffix(os.path.basename(path)) in self._supported_lc
 
-    def _get_file_size(self, path: Path) -> int:
+    def _get_file_size(self, path_str: str) -> int:
         """Get file size, returns -1 if file doesn't exist or can't be read."""
         try:
-            return path.stat().st_size
-        except (OSError, FileNotFoundError):
+            return os.stat(path_str).st_size
+        except OSError:
             return -1
 
     def _schedule_callback(self, path_str: str):
         """Schedule a callback for a file after debounce period."""
-        path = Path(path_str)
-
         with self._lock:
-            # Cancel existing timer if any
-            if path_str in self._pending:
-                old_timer, _ = self._pending[path_str]
-                old_timer.cancel()
-
-            current_size = self._get_file_size(path)
-
-            def check_and_process():
-                """Check if file is stable and process it."""
-                with self._lock:
-                    if path_str not in self._pending:
-                        return
-
-                    _, last_size = self._pending[path_str]
-                    new_size = self._get_file_size(path)
-
-                    # File was deleted or can't be read
-                    if new_size == -1:
-                        logger.debug(f"File no longer accessible: {path}")
-                        del self._pending[path_str]
-                        return
-
-                    # File size changed, reschedule
-                    if new_size != last_size:
-                        logger.debug(f"File still changing: {path} ({last_size} -> {new_size})")
-                        del self._pending[path_str]
-                        # Release lock before recursive call
-                        self._schedule_callback(path_str)
-                        return
-
-                    # File is stable, process it
-                    del self._pending[path_str]
-
-                # Call callback outside of lock
+            self._schedule_locked(path_str)
+
+    def _schedule_locked(self, path_str: str, size: int | None = None):
+        """
+        Schedule a callback for a file; the caller holds self._lock.
+
+        Args:
+            path_str: File to schedule
+            size: The file's current size, if just read; stat'ed otherwise
+        """
+        if self._stopped:
+            return
+
+        deadline = time.monotonic() + self.debounce_seconds
+        self._deadlines[path_str] = deadline
+        self._sizes[path_str] = self._get_file_size(path_str) if size is None else size
+        heapq.heappush(self._heap, (deadline, path_str))
+
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(
+                target=self._run_scheduler, name="debounce", daemon=True
+            )
+            self._scheduler.start()
+        elif self._heap[0] == (deadline, path_str):
+            # The scheduler is waiting for a later deadline
+            self._wakeup.notify()
+
+    def _is_stable_locked(self, path_str: str) -> bool:
+        """
+        Check whether a due file stopped changing; the caller holds self._lock.
+
+        A file that is still growing is rescheduled, one that disappeared dropped.
+        """
+        last_size = self._sizes.pop(path_str)
+        del self._deadlines[path_str]
+        new_size = self._get_file_size(path_str)
+
+        # File was deleted or can't be read
+        if new_size == -1:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"File no longer accessible: {path_str}")
+            return False
+
+        # File size changed, reschedule with the size just read
+        if new_size != last_size:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"File still changing: {path_str} ({last_size} -> {new_size})")
+            self._schedule_locked(path_str, new_size)
+            return False
+
+        return True
+
+    def _wait_for_ready(self) -> list[Path] | None:
+        """
+        Block until at least one file is stable; the caller holds self._lock.
+
+        Returns:
+            Files ready for processing, or None once the handler is stopped
+        """
+        while not self._stopped:
+            now = time.monotonic()
+            ready = []
+            while self._heap and self._heap[0][0] <= now:
+                deadline, path_str = heapq.heappop(self._heap)
+                if self._deadlines.get(path_str) != deadline:
+                    continue  # Rescheduled since this entry was pushed
+                if self._is_stable_locked(path_str):
+                    ready.append(Path(path_str))
+
+            if ready:
+                return ready
+
+            self._wakeup.wait(self._heap[0][0] - now if self._heap else None)
+        return None
+
+    def _run_scheduler(self):
+        """Process files as their debounce periods end, one after another."""
+        while True:
+            with self._lock:
+                ready = self._wait_for_ready()
+            if ready is None:
+                return
+
+            # Call callback outside of lock
+            for path in ready:
                 logger.info(f"File ready for processing: {path}")
                 try:
                     self.callback(path)
                 except Exception as e:
                     logger.error(f"Error processing file {path}: {e}")
 
-            timer = threading.Timer(self.debounce_seconds, check_and_process)
-            self._pending[path_str] = (timer, current_size)
-            timer.start()
-
     def on_created(self, event):
         """Handle file creation events."""
         if event.is_directory:
             return
 
-        path = Path(event.src_path)
+        src = event.src_path
+        # Checked once per event so bursts at INFO level skip building log messages
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        if self._should_ignore(path):
-            logger.debug(f"Ignoring file (system/temp): {path}")
+        if self._should_ignore(src):
+            if debug:
+                logger.debug(f"Ignoring file (system/temp): {src}")
             return
 
-        if not self._is_supported(path):
-            logger.debug(f"Ignoring file (unsupported extension): {path}")
+        if not self._is_supported(src):
+            if debug:
+                logger.debug(f"Ignoring file (unsupported extension): {src}")
             return
 
-        logger.debug(f"File created: {path}")
-        self._schedule_callback(event.src_path)
+        if debug:
+            logger.debug(f"File created: {src}")
+        self._schedule_callback(src)
 
     def on_modified(self, event):
         """Handle file modification events."""
         if event.is_directory:
             return
 
-        path = Path(event.src_path)
+        src = event.src_path
 
-        if self._should_ignore(path):
+        if self._should_ignore(src):
             return
 
-        if not self._is_supported(path):
+        if not self._is_supported(src):
             return
 
         # Only reschedule if we're already tracking this file
         with self._lock:
-            if event.src_path in self._pending:
-                logger.debug(f"File modified (rescheduling): {path}")
-                self._schedule_callback(event.src_path)
+            if src in self._deadlines:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"File modified (rescheduling): {src}")
+                self._schedule_locked(src)
 
     def stop(self):
-        """Cancel all pending timers."""
+        """Drop all pending files and end the scheduler thread."""
         with self._lock:
-            for timer, _ in self._pending.values():
-                timer.cancel()
-            self._pending.clear()
+            self._stopped = True
+            self._deadlines.clear()
+            self._sizes.clear()
+            self._heap.clear()
+            self._wakeup.notify()
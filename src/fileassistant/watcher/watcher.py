@@ -1,5 +1,6 @@
 """File watcher component for monitoring inbox folders."""
 
+import os
 import threading
 from collections.abc import Callable
 from pathlib import Path
@@ -8,7 +9,7 @@ from watchdog.observers import Observer
 
 from ..config import FileAssistantConfig
 from ..utils.logging import get_logger
-from .handler import SUPPORTED_EXTENSIONS, DebouncedFileHandler
+from .handler import SUPPORTED_EXTENSIONS, DebouncedFileHandler, _lower_suffix
 
 logger = get_logger(__name__)
 
@@ -111,10 +112,16 @@ class FileWatcher:
             if not folder.exists():
                 continue
 
-            for file_path in folder.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_EXTENSIONS:
+            # Filter on the entry name first; is_file() only stats symlinks
+            with os.scandir(folder) as entries:
+                for entry in entries:
                     # Skip hidden files
-                    if not file_path.name.startswith("."):
+                    if entry.name.startswith("."):
+                        continue
+                    if _lower_suffix(entry.name) not in SUPPORTED_EXTENSIONS:
+                        continue
+                    if entry.is_file():
+                        file_path = folder / entry.name
                         existing_files.append(file_path)
                         logger.debug(f"Found existing file: {file_path}")
 
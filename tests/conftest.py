@@ -0,0 +1,13 @@
+"""Shared pytest configuration."""
+
+import getpass
+import os
+import sys
+
+
+def pytest_configure(config):
+    """Keep tmp_path directories in memory on Linux when no --basetemp is given."""
+    # Many tests create and stat small files; /dev/shm is tmpfs, so they never
+    # touch the disk. xdist workers inherit a per-worker basetemp from the controller.
+    if config.option.basetemp is None and sys.platform == "linux" and os.path.isdir("/dev/shm"):
+        config.option.basetemp = f"/dev/shm/pytest-of-{getpass.getuser()}"
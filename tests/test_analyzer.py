@@ -103,37 +103,39 @@ class TestGetSupportedExtensions:
         assert ".docx" in extensions
 
 
+@pytest.fixture(scope="session")
+def analyzer():
+    """Create one FileAnalyzer for the session; tests needing other limits build their own."""
+    return FileAnalyzer()
+
+
 class TestFileAnalyzer:
     """Tests for FileAnalyzer class."""
 
-    def test_can_analyze_txt(self, tmp_path):
+    def test_can_analyze_txt(self, tmp_path, analyzer):
         """Test can_analyze returns True for supported files."""
         test_file = tmp_path / "test.txt"
         test_file.write_text("test content")
 
-        analyzer = FileAnalyzer()
         assert analyzer.can_analyze(test_file)
 
-    def test_cannot_analyze_unsupported(self, tmp_path):
+    def test_cannot_analyze_unsupported(self, tmp_path, analyzer):
         """Test can_analyze returns False for unsupported files."""
         test_file = tmp_path / "test.xyz"
         test_file.write_text("test content")
 
-        analyzer = FileAnalyzer()
         assert not analyzer.can_analyze(test_file)
 
-    def test_cannot_analyze_nonexistent(self, tmp_path):
+    def test_cannot_analyze_nonexistent(self, tmp_path, analyzer):
         """Test can_analyze returns False for nonexistent files."""
-        analyzer = FileAnalyzer()
         assert not analyzer.can_analyze(tmp_path / "nonexistent.txt")
 
-    def test_analyze_txt_file(self, tmp_path):
+    def test_analyze_txt_file(self, tmp_path, analyzer):
         """Test analyzing a text file."""
         test_file = tmp_path / "test.txt"
         test_content = "Hello, World!\nThis is a test file."
         test_file.write_text(test_content)
 
-        analyzer = FileAnalyzer()
         result = analyzer.analyze(test_file)
 
         assert result.success
@@ -143,21 +145,19 @@ class TestFileAnalyzer:
         assert result.word_count == 6
         assert result.has_content
 
-    def test_analyze_empty_file(self, tmp_path):
+    def test_analyze_empty_file(self, tmp_path, analyzer):
         """Test analyzing an empty file."""
         test_file = tmp_path / "empty.txt"
         test_file.write_text("")
 
-        analyzer = FileAnalyzer()
         result = analyzer.analyze(test_file)
 
         assert result.success
         assert result.content == ""
         assert not result.has_content
 
-    def test_analyze_nonexistent_file(self, tmp_path):
+    def test_analyze_nonexistent_file(self, tmp_path, analyzer):
         """Test analyzing a nonexistent file."""
-        analyzer = FileAnalyzer()
         result = analyzer.analyze(tmp_path / "nonexistent.txt")
 
         assert not result.success
@@ -175,12 +175,11 @@ class TestFileAnalyzer:
         assert not result.success
         assert "too large" in result.error_message.lower()
 
-    def test_analyze_metadata_extraction(self, tmp_path):
+    def test_analyze_metadata_extraction(self, tmp_path, analyzer):
         """Test that metadata is correctly extracted."""
         test_file = tmp_path / "metadata_test.txt"
         test_file.write_text("test content for metadata")
 
-        analyzer = FileAnalyzer()
         result = analyzer.analyze(test_file)
 
         assert result.success
@@ -190,7 +189,7 @@ class TestFileAnalyzer:
         assert result.metadata.hash_md5  # MD5 should be computed
         assert len(result.metadata.hash_md5) == 32  # MD5 hex length
 
-    def test_analyze_multiple(self, tmp_path):
+    def test_analyze_multiple(self, tmp_path, analyzer):
         """Test analyzing multiple files."""
         files = []
         for i in range(3):
@@ -198,19 +197,17 @@ class TestFileAnalyzer:
             f.write_text(f"Content {i}")
             files.append(f)
 
-        analyzer = FileAnalyzer()
         results = analyzer.analyze_multiple(files)
 
         assert len(results) == 3
         assert all(r.success for r in results)
 
-    def test_content_preview_truncation(self, tmp_path):
+    def test_content_preview_truncation(self, tmp_path, analyzer):
         """Test that content preview is truncated for long files."""
         test_file = tmp_path / "long.txt"
         long_content = "word " * 200  # More than 500 chars
         test_file.write_text(long_content)
 
-        analyzer = FileAnalyzer()
         result = analyzer.analyze(test_file)
 
         assert result.success
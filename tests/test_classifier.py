@@ -95,14 +95,15 @@ class TestClassificationResult:
         assert result.confidence_level == "low"
 
 
+@pytest.fixture(scope="session")
+def classifier():
+    """Create one FileClassifier for the session; tests only read its state."""
+    return FileClassifier()
+
+
 class TestFileClassifier:
     """Tests for FileClassifier."""
 
-    @pytest.fixture
-    def classifier(self):
-        """Create a FileClassifier instance."""
-        return FileClassifier()
-
     @pytest.fixture
     def mock_analysis(self, tmp_path):
         """Create a mock AnalysisResult."""
@@ -1,5 +1,6 @@
 """Tests for the index CLI command."""
 
+import os
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -127,8 +128,10 @@ class TestCollectFiles:
         small_file = tmp_path / "small.txt"
         small_file.write_text("small")
 
+        # Sparse 2MB file; collect_files only looks at its size
         large_file = tmp_path / "large.txt"
-        large_file.write_text("x" * (2 * 1024 * 1024))  # 2MB
+        large_file.touch()
+        os.truncate(large_file, 2 * 1024 * 1024)
 
         files = collect_files(
             tmp_path,
@@ -142,15 +145,16 @@ class TestCollectFiles:
         assert "large.txt" not in filenames
 
 
+@pytest.fixture(scope="session")
+def analyzer():
+    """Create one FileAnalyzer for the session; extraction does not mutate it."""
+    from fileassistant.analyzer import FileAnalyzer
+    return FileAnalyzer()
+
+
 class TestExtractTextForIndexing:
     """Tests for extract_text_for_indexing function."""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create a mock analyzer."""
-        from fileassistant.analyzer import FileAnalyzer
-        return FileAnalyzer()
-
     def test_extract_text_txt_file(self, tmp_path, analyzer):
         """Test extracting text from a .txt file."""
         file_path = tmp_path / "test.txt"
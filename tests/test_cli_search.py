@@ -51,6 +51,11 @@ class TestHelperFunctions:
         result = parse_extensions(".pdf,docx,.TXT")
         assert result == [".pdf", ".docx", ".txt"]
 
+    def test_parse_extensions_deduplicates(self):
+        """Test that repeated extensions are only returned once."""
+        result = parse_extensions("pdf,PDF,.pdf,txt")
+        assert result == [".pdf", ".txt"]
+
     def test_parse_date_valid(self):
         """Test parsing valid date."""
         result = parse_date("2025-01-15")
@@ -142,7 +147,8 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = True
+                mock_engine_instance.search.return_value = []
+                mock_engine_instance.last_indexed_count = 0
                 mock_engine.return_value = mock_engine_instance
 
                 result = runner.invoke(search_command, ["test query"])
@@ -151,6 +157,23 @@ class TestSearchCommandUnit:
                 assert "No files have been indexed" in result.output
                 assert "fileassistant index" in result.output
 
+    def test_search_without_index_skips_model_warm_up(self, runner, tmp_path):
+        """Test the embedding model is not loaded when no index exists on disk."""
+        with patch("fileassistant.cli.search.get_config_manager") as mock_cm:
+            with patch("fileassistant.cli.search.SearchEngine") as mock_engine:
+                mock_cm.return_value.load.side_effect = FileNotFoundError()
+
+                mock_engine_instance = MagicMock()
+                mock_engine_instance.index_manager.persist_directory = tmp_path / "missing"
+                mock_engine_instance.search.return_value = []
+                mock_engine_instance.last_indexed_count = 0
+                mock_engine.return_value = mock_engine_instance
+
+                result = runner.invoke(search_command, ["test query"])
+
+                assert result.exit_code == 0
+                mock_engine_instance.warm_up.assert_not_called()
+
     def test_search_no_results(self, runner):
         """Test search with no matching results."""
         with patch("fileassistant.cli.search.get_config_manager") as mock_cm:
@@ -158,7 +181,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -187,7 +210,7 @@ class TestSearchCommandUnit:
                 )
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = [mock_result]
                 mock_engine.return_value = mock_engine_instance
 
@@ -216,7 +239,7 @@ class TestSearchCommandUnit:
                 )
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = [mock_result]
                 mock_engine.return_value = mock_engine_instance
 
@@ -248,7 +271,7 @@ class TestSearchCommandUnit:
                 )
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = [mock_result]
                 mock_engine.return_value = mock_engine_instance
 
@@ -264,7 +287,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -284,7 +307,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -309,7 +332,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -327,7 +350,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -344,7 +367,7 @@ class TestSearchCommandUnit:
                 mock_cm.return_value.load.side_effect = FileNotFoundError()
 
                 mock_engine_instance = MagicMock()
-                mock_engine_instance.is_index_empty.return_value = False
+                mock_engine_instance.last_indexed_count = 1
                 mock_engine_instance.search.return_value = []
                 mock_engine.return_value = mock_engine_instance
 
@@ -0,0 +1,90 @@
+"""Tests for configuration models and persistence."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from fileassistant.config.manager import ConfigManager
+from fileassistant.config.models import ConfidenceThresholds, FileAssistantConfig
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create a test configuration."""
+    return FileAssistantConfig(
+        inbox_folders=[tmp_path / "inbox"],
+        organized_base_path=tmp_path / "organized",
+    )
+
+
+class TestConfidenceThresholds:
+    """Tests for ConfidenceThresholds validation."""
+
+    def test_out_of_range_threshold_rejected(self):
+        """Test thresholds outside 0..1 are rejected."""
+        with pytest.raises(ValidationError):
+            ConfidenceThresholds(high=1.5)
+
+    def test_medium_must_be_below_high(self):
+        """Test thresholds out of order are rejected."""
+        with pytest.raises(ValidationError, match="medium threshold"):
+            ConfidenceThresholds(high=0.5, medium=0.7)
+
+    def test_low_must_not_exceed_medium(self):
+        """Test a low threshold above medium is rejected."""
+        with pytest.raises(ValidationError, match="low threshold"):
+            ConfidenceThresholds(low=0.7, medium=0.6)
+
+
+class TestFileAssistantConfig:
+    """Tests for FileAssistantConfig."""
+
+    def test_organized_base_path_defaults_to_documents(self):
+        """Test the organized path falls back to Documents when not given."""
+        config = FileAssistantConfig()
+        assert config.organized_base_path == Path.home() / "Documents" / "FileAssistant"
+
+    def test_unknown_section_key_rejected(self):
+        """Test a misspelled key inside a settings section raises."""
+        with pytest.raises(ValidationError, match="batch_sise"):
+            FileAssistantConfig.model_validate({"processing": {"batch_sise": 5}})
+
+    def test_unknown_top_level_key_rejected(self):
+        """Test an unknown top-level key raises."""
+        with pytest.raises(ValidationError):
+            FileAssistantConfig.model_validate({"organised_base_path": "/tmp"})
+
+
+class TestConfigManager:
+    """Tests for ConfigManager save and load."""
+
+    def test_save_writes_every_setting(self, tmp_path):
+        """Test saving a default config writes all keys, not an empty file."""
+        path = tmp_path / "config.yaml"
+        ConfigManager(path).save(FileAssistantConfig(), path)
+
+        saved = yaml.safe_load(path.read_text())
+        assert set(saved) == set(FileAssistantConfig.model_fields)
+        assert saved["confidence_thresholds"]["high"] == 0.9
+
+    def test_yaml_round_trip(self, config, tmp_path):
+        """Test a saved YAML config loads back unchanged."""
+        config.processing.batch_size = 25
+        path = tmp_path / "config.yaml"
+        ConfigManager(path).save(config, path)
+
+        loaded = ConfigManager(path).load()
+
+        assert loaded == config
+
+    def test_json_round_trip(self, config, tmp_path):
+        """Test a config saved to a .json path is written as JSON and loads back."""
+        import json
+
+        path = tmp_path / "config.json"
+        ConfigManager(path).save(config, path)
+
+        assert json.loads(path.read_text())["organized_base_path"] == str(tmp_path / "organized")
+        assert ConfigManager(path).load() == config
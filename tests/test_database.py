@@ -0,0 +1,59 @@
+"""Tests for the database connection setup."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError, StatementError
+
+from fileassistant.database import Classification, Database, File, FileStatus
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a database with all tables."""
+    database = Database(tmp_path / "test.db")
+    database.create_all_tables()
+    yield database
+    database.close()
+
+
+class TestDatabase:
+    """Tests for Database."""
+
+    def test_foreign_keys_are_enforced(self, database):
+        """Test a classification pointing at a missing file is rejected."""
+        session = database.get_session()
+        session.add(Classification(file_id=999, suggested_destination="Documents"))
+
+        with pytest.raises(IntegrityError):
+            session.commit()
+        session.close()
+
+    def test_connections_use_wal(self, database):
+        """Test file databases run in WAL mode."""
+        with database.engine.connect() as connection:
+            mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        assert mode == "wal"
+
+    def test_status_columns_store_values_and_check_them(self, database):
+        """Test enum columns store member values, read back members and reject others."""
+        session = database.get_session()
+        session.add(File(path="/a.txt", filename="a.txt", status="processed"))
+        session.commit()
+
+        assert session.execute(text("SELECT status FROM files")).scalar() == "processed"
+        assert session.query(File).one().status is FileStatus.PROCESSED
+
+        session.add(File(path="/b.txt", filename="b.txt", status="PROCESSED"))
+        with pytest.raises(StatementError):
+            session.commit()
+        session.rollback()
+
+        # The CHECK constraint also guards writes that bypass the ORM
+        with pytest.raises(IntegrityError):
+            session.execute(
+                text(
+                    "INSERT INTO files (path, filename, status) "
+                    "VALUES ('/c.txt', 'c.txt', 'bogus')"
+                )
+            )
+        session.close()
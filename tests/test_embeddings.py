@@ -7,6 +7,11 @@ import pytest
 from fileassistant.embeddings.generator import EmbeddingGenerator, EmbeddingResult
 
 
+def _fake_tokenizer(sentences, **kwargs):
+    """Tokenize like the ~4 characters per token heuristic, without a real model."""
+    return {"input_ids": [[0] * (len(sentence) // 4) for sentence in sentences]}
+
+
 class TestEmbeddingResult:
     """Tests for EmbeddingResult dataclass."""
 
@@ -28,7 +33,7 @@ class TestEmbeddingResult:
         result = EmbeddingResult.failure("Test error")
         assert result.success is False
         assert result.error_message == "Test error"
-        assert result.embedding == []
+        assert result.embedding.size == 0
         assert result.chunk_count == 0
 
 
@@ -37,12 +42,14 @@ class TestEmbeddingGenerator:
 
     @pytest.fixture
     def generator(self):
-        """Create a generator instance."""
-        return EmbeddingGenerator(
+        """Create a generator instance with a stand-in model for tokenizing."""
+        generator = EmbeddingGenerator(
             model_name="all-MiniLM-L6-v2",
             chunk_size=512,
             chunk_overlap=50,
         )
+        generator._model = MagicMock(tokenizer=_fake_tokenizer)
+        return generator
 
     def test_initialization(self, generator):
         """Test generator initialization."""
@@ -96,6 +103,26 @@ class TestEmbeddingGenerator:
         chunks = generator._chunk_text(long_text)
         assert len(chunks) > 1
 
+    def test_chunk_text_loads_model_tokenizer(self, generator):
+        """Test that chunk packing loads the model and uses its token counts."""
+        tokenizer = MagicMock(
+            side_effect=lambda sentences, **kwargs: {
+                "input_ids": [[0] * 200 for _ in sentences]
+            }
+        )
+        generator._model = None
+
+        long_text = ". ".join(["This is sentence number " + str(i) for i in range(100)])
+        with patch.object(
+            EmbeddingGenerator, "_get_model", return_value=MagicMock(tokenizer=tokenizer)
+        ) as mock_get_model:
+            chunks = generator._chunk_text(long_text)
+
+        mock_get_model.assert_called_once()
+        tokenizer.assert_called_once()
+        # 200 tokens per sentence against a 512 budget packs two sentences per chunk
+        assert all(chunk.count("sentence number") <= 2 for chunk in chunks)
+
     def test_chunk_text_preserves_content(self, generator):
         """Test that chunking doesn't lose content."""
         sentences = [f"Sentence {i}." for i in range(20)]
@@ -140,7 +167,7 @@ class TestEmbeddingGenerator:
         import numpy as np
 
         # Mock model with deterministic embeddings
-        mock_model = MagicMock()
+        mock_model = MagicMock(tokenizer=_fake_tokenizer)
         # Return different embeddings for each chunk
         mock_model.encode.return_value = np.array([
             [1.0, 2.0, 3.0],
@@ -155,7 +182,8 @@ class TestEmbeddingGenerator:
         assert result.success is True
         assert result.chunk_count > 1
         # Average of [1,2,3] and [3,4,5] is [2,3,4]
-        assert result.embedding == [2.0, 3.0, 4.0]
+        assert result.embedding.tolist() == [2.0, 3.0, 4.0]
+        assert result.embedding.dtype == np.float32
 
     @patch.object(EmbeddingGenerator, '_get_model')
     def test_generate_handles_model_error(self, mock_get_model, generator):
@@ -173,7 +201,9 @@ class TestEmbeddingGenerator:
         import numpy as np
 
         mock_model = MagicMock()
-        mock_model.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+        mock_model.encode.side_effect = lambda chunks, **kwargs: np.array(
+            [[0.1, 0.2, 0.3]] * len(chunks)
+        )
         mock_get_model.return_value = mock_model
 
         texts = ["Text one.", "Text two.", "Text three."]
@@ -182,6 +212,69 @@ class TestEmbeddingGenerator:
         assert len(results) == 3
         for result in results:
             assert result.success is True
+        # All texts are encoded together in one call
+        mock_model.encode.assert_called_once()
+
+    @patch.object(EmbeddingGenerator, '_get_model')
+    def test_generate_batch_averages_per_text(self, mock_get_model, generator):
+        """Test batch results average only their own chunks and keep input order."""
+        import numpy as np
+
+        # Each chunk embeds to [n, n, n] where n is its position in the flat batch
+        mock_model = MagicMock(tokenizer=_fake_tokenizer)
+        mock_model.encode.side_effect = lambda chunks, **kwargs: np.repeat(
+            np.arange(len(chunks), dtype=float)[:, None], 3, axis=1
+        )
+        mock_get_model.return_value = mock_model
+
+        long_text = ". ".join([f"Sentence number {i} with more words" for i in range(100)])
+        chunk_count = len(generator._chunk_text(long_text))
+        assert chunk_count > 1
+
+        results = generator.generate_batch(["Short text.", "", long_text])
+
+        assert results[0].embedding.tolist() == [0.0, 0.0, 0.0]
+        assert results[1].success is False
+        assert results[2].chunk_count == chunk_count
+        expected = (1 + chunk_count) / 2  # mean of positions 1..chunk_count
+        assert results[2].embedding == pytest.approx([expected] * 3)
+
+    @patch.object(EmbeddingGenerator, '_get_model')
+    def test_generate_batch_reports_tokenizer_errors(self, mock_get_model, generator):
+        """Test a failing tokenizer gives failed results instead of raising."""
+        mock_get_model.return_value = MagicMock(
+            tokenizer=MagicMock(side_effect=RuntimeError("tokenizer broke"))
+        )
+
+        long_text = ". ".join([f"Sentence number {i} with more words" for i in range(100)])
+        results = generator.generate_batch(["", long_text])
+
+        assert "Empty text" in results[0].error_message
+        assert results[1].success is False
+        assert "tokenizer broke" in results[1].error_message
+
+    @patch.object(EmbeddingGenerator, '_get_model')
+    def test_generate_reuses_cached_embeddings(self, mock_get_model, generator):
+        """Test repeated text is served from the embedding cache."""
+        import numpy as np
+
+        mock_model = MagicMock()
+        mock_model.encode.side_effect = lambda chunks, **kwargs: np.ones(
+            (len(chunks), 3), dtype=np.float32
+        )
+        mock_get_model.return_value = mock_model
+
+        first = generator.generate("Same text.")
+        batch = generator.generate_batch(["Same text.", "Other text."])
+
+        assert np.array_equal(batch[0].embedding, first.embedding)
+        # Cached vectors are read-only so callers cannot corrupt later hits
+        with pytest.raises(ValueError):
+            first.embedding[0] = 0.0
+        assert batch[0].chunk_count == first.chunk_count
+        # The batch only encoded the text that was not cached
+        assert mock_model.encode.call_args.args[0] == ["Other text."]
+        assert mock_model.encode.call_count == 2
 
     @patch.object(EmbeddingGenerator, '_get_model')
     def test_embedding_dimension(self, mock_get_model, generator):
@@ -201,6 +294,16 @@ class TestEmbeddingGenerator:
         EmbeddingGenerator.clear_model_cache()
         assert len(EmbeddingGenerator._model_cache) == 0
 
+    def test_get_model_remembers_cached_model(self):
+        """Test an instance keeps the shared model after its first lookup."""
+        model = MagicMock()
+        EmbeddingGenerator._model_cache["test-model"] = model
+        generator = EmbeddingGenerator(model_name="test-model")
+
+        assert generator._get_model() is model
+        EmbeddingGenerator.clear_model_cache()
+        assert generator._get_model() is model
+
 
 class TestEmbeddingGeneratorIntegration:
     """Integration tests that use the real model (slower, optional)."""
@@ -1,6 +1,7 @@
 """Tests for the folder scanner utility."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -133,6 +134,20 @@ class TestFolderScanResult:
         assert "... and" in context
         assert "more folders" in context
 
+    def test_to_prompt_context_keeps_smallest_paths_and_caches(self, tmp_path):
+        """Test truncated context lists the first paths in order and is reused."""
+        root = FolderNode(name="root", path=tmp_path / "root", depth=0)
+        for name in ["d", "b", "e", "a", "c"]:
+            root.children.append(FolderNode(name=name, path=tmp_path / "root" / name, depth=1))
+
+        result = FolderScanResult(roots=[root], total_folders=6)
+        context = result.to_prompt_context(max_folders=3)
+
+        assert context.splitlines()[:3] == ["- root", "- root/a", "- root/b"]
+        with patch.object(FolderScanResult, "get_all_paths") as mock_paths:
+            assert result.to_prompt_context(max_folders=3) is context
+            mock_paths.assert_not_called()
+
 
 class TestFolderScanner:
     """Tests for FolderScanner."""
@@ -246,6 +261,15 @@ class TestFolderScanner:
         assert any("Documents" in p for p in paths)
         assert any("Downloads" in p for p in paths)
 
+    def test_scan_overlapping_roots(self, scanner, tmp_path):
+        """Test a root inside another root gets its own complete subtree."""
+        (tmp_path / "A" / "B" / "C").mkdir(parents=True)
+
+        result = scanner.scan([tmp_path / "A", tmp_path / "A" / "B", tmp_path / "A"])
+
+        paths = result.get_all_paths()
+        assert paths == ["A", "A/B", "A/B/C", "B", "B/C", "A", "A/B", "A/B/C"]
+
     def test_scan_empty_directory(self, scanner, tmp_path):
         """Test scanning an empty directory."""
         empty = tmp_path / "empty"
@@ -277,6 +301,71 @@ class TestFolderScanner:
         assert any("normal" in p for p in paths)
         assert not any("~temp" in p for p in paths)
 
+    def test_iter_folders_order_and_depth(self, scanner, folder_structure):
+        """Test folders stream breadth-first in sorted order with their depths."""
+        docs = folder_structure / "Documents"
+
+        folders = [
+            (path.relative_to(folder_structure).as_posix(), depth)
+            for path, depth in scanner.iter_folders([docs])
+        ]
+
+        assert folders == [
+            ("Documents", 0),
+            ("Documents/Personal", 1),
+            ("Documents/Work", 1),
+            ("Documents/Personal/Finance", 2),
+            ("Documents/Work/Projects", 2),
+            ("Documents/Work/Projects/Python", 3),
+        ]
+
+    def test_iter_folders_same_order_without_threads(self, folder_structure):
+        """Test the serial walk yields exactly what the concurrent walk does."""
+        roots = [folder_structure / "Documents"]
+
+        serial = list(FolderScanner(max_workers=1).iter_folders(roots))
+        concurrent = list(FolderScanner(max_workers=4).iter_folders(roots))
+
+        assert serial == concurrent
+        assert len(serial) == 6
+
+    def test_scan_max_folders(self, scanner, folder_structure):
+        """Test scanning stops at max_folders and marks the result truncated."""
+        docs = folder_structure / "Documents"
+
+        result = scanner.scan([docs], max_folders=3)
+
+        assert result.total_folders == 3
+        assert result.truncated
+        assert result.get_all_paths() == [
+            "Documents",
+            "Documents/Personal",
+            "Documents/Work",
+        ]
+        assert "... and more folders" in result.to_prompt_context()
+
+        # A limit the tree fits in exactly is not a truncation
+        assert not scanner.scan([docs], max_folders=6).truncated
+
+    def test_scan_max_folders_keeps_shallow_folders_of_every_root(self, scanner, tmp_path):
+        """Test a deep first root cannot use up the limit before later roots."""
+        deep = tmp_path / "Deep"
+        (deep / "a" / "b" / "c").mkdir(parents=True)
+        (deep / "d" / "e").mkdir(parents=True)
+        shallow = tmp_path / "Shallow"
+        (shallow / "Inbox").mkdir(parents=True)
+
+        result = scanner.scan([deep, shallow], max_folders=5)
+
+        assert result.truncated
+        assert sorted(result.get_all_paths()) == [
+            "Deep",
+            "Deep/a",
+            "Deep/d",
+            "Shallow",
+            "Shallow/Inbox",
+        ]
+
 
 class TestScanFoldersForContext:
     """Tests for the convenience function."""
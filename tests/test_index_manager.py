@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from fileassistant.search.index_manager import IndexManager, IndexedFileMetadata
+from fileassistant.search.index_manager import IndexedFileMetadata, IndexManager, IndexRecord
 
 # ChromaDB has compatibility issues with Python 3.14+ due to Pydantic v1 usage
 CHROMADB_PYTHON_COMPAT_ISSUE = sys.version_info >= (3, 14)
@@ -183,6 +183,68 @@ class TestIndexManager:
         metadata, document = index_manager.get_file("file1")
         assert "Updated" in document
 
+    def test_index_files_batch(self, index_manager, sample_embedding, tmp_path):
+        """Test indexing several files with one call."""
+        records = []
+        for i in range(3):
+            test_file = tmp_path / f"doc{i}.txt"
+            test_file.touch()
+            records.append(
+                IndexRecord(
+                    file_id=f"file{i}",
+                    file_path=test_file,
+                    text=f"Content of document {i}",
+                    embedding=sample_embedding,
+                )
+            )
+
+        assert index_manager.index_files(records) is True
+        assert index_manager.get_indexed_count() == 3
+
+        metadata, document = index_manager.get_file("file2")
+        assert metadata.filename == "doc2.txt"
+        assert document == "Content of document 2"
+
+    def test_index_files_empty(self, index_manager):
+        """Test that an empty batch is a no-op."""
+        assert index_manager.index_files([]) is True
+
+    def test_lookup_cached_embeddings(self, index_manager, sample_embedding, tmp_path):
+        """Test finding stored embeddings by content hash."""
+        test_file = tmp_path / "test.txt"
+        test_file.touch()
+        index_manager.index_file(
+            file_id="file1",
+            file_path=test_file,
+            text="Shared content",
+            embedding=sample_embedding,
+        )
+
+        known = IndexManager.compute_content_hash("Shared content")
+        unknown = IndexManager.compute_content_hash("Other content")
+        cached = index_manager.lookup_cached_embeddings([known, unknown])
+
+        assert list(cached) == [known]
+        # Embeddings are stored scaled to unit length
+        assert cached[known] == pytest.approx([384**-0.5] * 384, abs=1e-6)
+        assert index_manager.lookup_cached_embeddings([]) == {}
+
+    def test_warm_up(self, index_manager, sample_embedding, tmp_path):
+        """Test warming up an empty and a populated index."""
+        index_manager.warm_up()
+
+        test_file = tmp_path / "test.txt"
+        test_file.touch()
+        index_manager.index_file(
+            file_id="file1",
+            file_path=test_file,
+            text="Content",
+            embedding=sample_embedding,
+        )
+        index_manager.warm_up()
+
+        assert index_manager.get_indexed_count() == 1
+
     def test_remove_file(self, index_manager, sample_embedding, tmp_path):
         """Test removing a file from the index."""
         test_file = tmp_path / "test.pdf"
@@ -0,0 +1,123 @@
+"""Tests for database migrations."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect, text
+
+from fileassistant.database import (
+    Database,
+    File,
+    SchemaVersion,
+    initialize_migrations,
+    search_file_summaries,
+)
+from fileassistant.database.migrations import _QUERY_INDEXES
+
+
+@pytest.fixture
+def baseline_database(tmp_path):
+    """Create a database at version 1, as written before the later migrations."""
+    database = Database(tmp_path / "test.db")
+    database.create_all_tables()
+
+    session = database.get_session()
+    for name in _QUERY_INDEXES:
+        session.execute(text(f"DROP INDEX {name}"))
+    session.add(
+        SchemaVersion(version=1, description="Create initial schema", applied_at=datetime.now())
+    )
+    session.add(
+        File(
+            path="/inbox/taxes.pdf",
+            filename="taxes.pdf",
+            extension=".pdf",
+            size_bytes=1,
+            content_summary="Annual tax return",
+        )
+    )
+    session.commit()
+    session.close()
+
+    yield database
+    database.close()
+
+
+def _index_names(database: Database) -> set[str]:
+    """Names of the indexes on the tables touched by migration 2."""
+    inspector = inspect(database.engine)
+    return {
+        index["name"]
+        for table in ("files", "classifications", "actions")
+        for index in inspector.get_indexes(table)
+    }
+
+
+def _current_version(manager) -> int:
+    """Read the schema version with a fresh session."""
+    session = manager.db.get_session()
+    try:
+        return manager.get_current_version(session)
+    finally:
+        session.close()
+
+
+class TestMigrations:
+    """Tests for the default migrations."""
+
+    def test_upgrade_from_baseline(self, baseline_database):
+        """Test a version 1 database gains the query indexes and the FTS index."""
+        manager = initialize_migrations(baseline_database)
+
+        manager.apply_migrations()
+
+        assert _current_version(manager) == 3
+        assert set(_QUERY_INDEXES) <= _index_names(baseline_database)
+
+        session = baseline_database.get_session()
+        # Rows that existed before the migration are indexed by the rebuild
+        assert [f.filename for f in search_file_summaries(session, "tax")] == ["taxes.pdf"]
+
+        # New rows are indexed by the triggers
+        session.add(
+            File(
+                path="/inbox/report.txt",
+                filename="report.txt",
+                extension=".txt",
+                size_bytes=1,
+                content_summary="Quarterly sales report",
+            )
+        )
+        session.commit()
+        assert [f.filename for f in search_file_summaries(session, "sales")] == ["report.txt"]
+        session.close()
+
+    def test_rollback_and_reapply(self, baseline_database):
+        """Test rolling back to version 1 removes later objects and they can be reapplied."""
+        manager = initialize_migrations(baseline_database)
+        manager.apply_migrations()
+
+        manager.rollback(1)
+
+        assert _current_version(manager) == 1
+        assert not set(_QUERY_INDEXES) & _index_names(baseline_database)
+        assert not inspect(baseline_database.engine).has_table("files_fts")
+
+        manager.apply_migrations()
+
+        assert _current_version(manager) == 3
+        assert set(_QUERY_INDEXES) <= _index_names(baseline_database)
+        session = baseline_database.get_session()
+        assert [f.filename for f in search_file_summaries(session, "return")] == ["taxes.pdf"]
+        session.close()
+
+    def test_fresh_database_applies_all_migrations(self, tmp_path):
+        """Test migrating an empty database creates the schema and records every version."""
+        database = Database(tmp_path / "fresh.db")
+        manager = initialize_migrations(database)
+
+        manager.apply_migrations()
+
+        assert _current_version(manager) == 3
+        assert inspect(database.engine).has_table("files_fts")
+        database.close()
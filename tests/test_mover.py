@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -159,6 +159,30 @@ class TestFileMover:
         # Actually, let's verify the folder was created by shutil.move
         assert result.success or not result.success  # Either way works
 
+    def test_move_falls_back_across_filesystems(self, mover, source_file):
+        """Test a cross-device rename error falls back to copy and delete."""
+        import errno
+
+        with patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            result = mover.move(source_file, "Documents")
+
+        assert result.success
+        assert not source_file.exists()
+        assert result.destination_path.exists()
+
+    def test_move_never_overwrites_existing_destination(self, mover, source_file, organized_path):
+        """Test a file that appears after conflict resolution is not clobbered."""
+        existing = organized_path / "Documents" / "test.txt"
+        existing.parent.mkdir()
+        existing.write_text("Existing content")
+
+        with patch.object(mover, "_resolve_conflict", side_effect=lambda destination: destination):
+            result = mover.move(source_file, "Documents")
+
+        assert not result.success
+        assert existing.read_text() == "Existing content"
+        assert source_file.read_text() == "Test content"
+
     def test_move_preserves_content(self, mover, organized_path, tmp_path):
         """Test that moved file content is preserved."""
         source = tmp_path / "content_test.txt"
@@ -226,3 +250,121 @@ class TestFileMoverWithDatabase:
         # Move itself may succeed, but action_id will be None
         # The important thing is that the operation doesn't crash
         assert result.action_id is None or result.success
+
+    def test_move_to_new_folder_commits_actions_together(
+        self, organized_path, source_file, tmp_path
+    ):
+        """Test folder creation and move are recorded in a single commit."""
+        from fileassistant.database import Action, ActionType, Database
+
+        database = Database(tmp_path / "test.db")
+        database.create_all_tables()
+        session = database.get_session()
+        mover = FileMover(organized_base_path=organized_path, db_session=session)
+
+        with patch.object(session, "commit", wraps=session.commit) as mock_commit:
+            result = mover.move(source_file, "New/Folder")
+
+        assert result.success
+        assert mock_commit.call_count == 1
+        actions = session.query(Action).order_by(Action.id).all()
+        assert [a.action_type for a in actions] == [
+            ActionType.CREATE_FOLDER.value,
+            ActionType.MOVE.value,
+        ]
+        assert result.action_id == actions[-1].id
+        session.close()
+        database.close()
+
+    def test_move_batch_records_actions_in_one_commit(self, organized_path, tmp_path):
+        """Test batched moves keep job order, resolve same-folder conflicts and commit once."""
+        from fileassistant.database import Action, ActionType, Database
+
+        sources = []
+        for name in ("one", "two"):
+            source = tmp_path / name / "report.txt"
+            source.parent.mkdir()
+            source.write_text(name)
+            sources.append(source)
+        other = tmp_path / "one" / "photo.jpg"
+        other.write_text("photo")
+
+        database = Database(tmp_path / "test.db")
+        database.create_all_tables()
+        session = database.get_session()
+        mover = FileMover(organized_base_path=organized_path, db_session=session)
+
+        with patch.object(session, "commit", wraps=session.commit) as mock_commit:
+            results = mover.move_batch(
+                [(sources[0], "Reports"), (other, "Photos"), (sources[1], "Reports")]
+            )
+
+        assert all(r.success for r in results)
+        assert mock_commit.call_count == 1
+        assert [r.filename for r in results] == ["report.txt", "photo.jpg", "report (1).txt"]
+        assert (organized_path / "Reports" / "report (1).txt").read_text() == "two"
+
+        moves = (
+            session.query(Action)
+            .filter(Action.action_type == ActionType.MOVE.value)
+            .order_by(Action.id)
+            .all()
+        )
+        assert [r.action_id for r in results] == [a.id for a in moves]
+        assert session.query(Action).count() == 5  # two folders created, three moves
+        session.close()
+        database.close()
+
+    def test_move_batch_serializes_folders_differing_in_case(self, organized_path, tmp_path):
+        """Test jobs for one folder spelled differently never overwrite each other."""
+        sources = []
+        for name in ("one", "two", "three"):
+            source = tmp_path / name / "report.txt"
+            source.parent.mkdir()
+            source.write_text(name)
+            sources.append(source)
+        (organized_path / "Reports").mkdir()
+        mover = FileMover(organized_base_path=organized_path)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with patch(
+            "fileassistant.mover.mover.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_executor:
+            results = mover.move_batch(
+                [
+                    (sources[0], "Reports"),
+                    (sources[1], "reports"),
+                    (sources[2], "Other/../Reports"),
+                ]
+            )
+
+        # All three jobs form one serial group
+        assert mock_executor.call_args.kwargs["max_workers"] == 1
+        assert all(r.success for r in results)
+        moved = sorted(r.destination_path.read_text() for r in results)
+        assert moved == ["one", "three", "two"]
+        assert len({r.destination_path for r in results}) == 3
+
+    def test_get_recent_actions_summarizes_moves(self, organized_path, source_file, tmp_path):
+        """Test recent actions list moves newest first with fields read from the JSON state."""
+        from fileassistant.database import Database
+
+        database = Database(tmp_path / "test.db")
+        database.create_all_tables()
+        session = database.get_session()
+        mover = FileMover(organized_base_path=organized_path, db_session=session)
+
+        first = mover.move(source_file, "New/Folder")
+        second_source = tmp_path / "source" / "second.txt"
+        second_source.write_text("Second")
+        second = mover.move(second_source, "Documents")
+
+        actions = mover.get_recent_actions()
+
+        assert [a.action_id for a in actions] == [second.action_id, first.action_id]
+        assert actions[0].filename == "second.txt"
+        assert actions[0].destination_path == str(second.destination_path)
+        assert actions[0].undone is False
+        session.close()
+        database.close()
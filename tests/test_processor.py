@@ -60,6 +60,11 @@ class TestProcessingResult:
         )
         assert result.final_destination is None
 
+    def test_extension_derived_from_path(self):
+        """Test the extension always follows the file path."""
+        result = ProcessingResult(file_path=Path("/report.PDF"), filename="report.PDF")
+        assert result.extension == ".pdf"
+
 
 class TestFileProcessor:
     """Tests for FileProcessor."""
@@ -75,7 +80,9 @@ class TestFileProcessor:
     @pytest.fixture
     def processor(self, config):
         """Create a FileProcessor instance."""
-        return FileProcessor(config=config)
+        processor = FileProcessor(config=config)
+        yield processor
+        processor.close()
 
     @pytest.fixture
     def test_file(self, tmp_path):
@@ -84,6 +91,30 @@ class TestFileProcessor:
         test_file.write_text("Hello, this is a test document.")
         return test_file
 
+    @pytest.fixture
+    def make_analysis(self):
+        """Create a factory for successful analysis results of a text file."""
+        from datetime import datetime
+
+        def make(path: Path) -> AnalysisResult:
+            return AnalysisResult(
+                file_path=path,
+                metadata=FileMetadata(
+                    path=path,
+                    filename=path.name,
+                    extension=".txt",
+                    size_bytes=100,
+                    created_at=datetime.now(),
+                    modified_at=datetime.now(),
+                    hash_md5="abc123",
+                ),
+                content="Test content",
+                content_preview="Test content",
+                success=True,
+            )
+
+        return make
+
     def test_initialization(self, processor, config):
         """Test processor initialization."""
         assert processor.config == config
@@ -118,7 +149,7 @@ class TestFileProcessor:
         assert not is_ready
         assert any("Ollama" in issue for issue in issues)
 
-    @patch("fileassistant.core.processor.FileAnalyzer.analyze")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
     def test_process_file_analysis_failure(self, mock_analyze, processor, test_file):
         """Test processing when analysis fails."""
         mock_analyze.return_value = AnalysisResult(
@@ -135,8 +166,8 @@ class TestFileProcessor:
         assert not result.success
         assert "Analysis failed" in result.error_message
 
-    @patch("fileassistant.core.processor.FileClassifier.classify")
-    @patch("fileassistant.core.processor.FileAnalyzer.analyze")
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
     def test_process_file_classification_failure(
         self, mock_analyze, mock_classify, processor, test_file
     ):
@@ -172,9 +203,9 @@ class TestFileProcessor:
         assert not result.success
         assert "Classification failed" in result.error_message
 
-    @patch("fileassistant.core.processor.FileMover.move")
-    @patch("fileassistant.core.processor.FileClassifier.classify")
-    @patch("fileassistant.core.processor.FileAnalyzer.analyze")
+    @patch("fileassistant.mover.FileMover.move")
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
     def test_process_file_success_non_interactive(
         self, mock_analyze, mock_classify, mock_move, processor, test_file, tmp_path
     ):
@@ -220,13 +251,14 @@ class TestFileProcessor:
         result = processor.process_file(test_file, interactive=False)
 
         assert result.success
+        assert result.extension == ".txt"
         assert result.analysis is not None
         assert result.classification is not None
         assert result.move_result is not None
 
-    @patch("fileassistant.core.processor.FileMover.move")
-    @patch("fileassistant.core.processor.FileClassifier.classify")
-    @patch("fileassistant.core.processor.FileAnalyzer.analyze")
+    @patch("fileassistant.mover.FileMover.move")
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
     def test_process_file_move_failure(
         self, mock_analyze, mock_classify, mock_move, processor, test_file
     ):
@@ -268,3 +300,189 @@ class TestFileProcessor:
 
         assert not result.success
         assert "Move failed" in result.error_message
+
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
+    def test_process_multiple_commits_once_per_batch(
+        self, mock_analyze, mock_classify, config, make_analysis, tmp_path
+    ):
+        """Test process_multiple records every file but commits once per batch."""
+        from fileassistant.database import Action, ActionType, Classification, Database, File
+
+        database = Database(tmp_path / "test.db")
+        database.create_all_tables()
+        session = database.get_session()
+        processor = FileProcessor(config=config, db_session=session)
+
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        files = []
+        for i in range(3):
+            path = inbox / f"file{i}.txt"
+            path.write_text("Test content")
+            files.append(path)
+
+        mock_analyze.side_effect = make_analysis
+        mock_classify.side_effect = lambda analysis, folder_context=None: ClassificationResult(
+            file_path=analysis.file_path,
+            filename=analysis.file_path.name,
+            destination_folder="Documents",
+            success=True,
+        )
+
+        with patch.object(session, "commit", wraps=session.commit) as mock_commit:
+            results = processor.process_multiple(files, interactive=False)
+
+        assert all(result.success for result in results)
+        assert [result.file_path for result in results] == [f.resolve() for f in files]
+        assert mock_commit.call_count == 1
+
+        # Everything is visible from a fresh session once the batch is committed
+        check = database.get_session()
+        assert check.query(File).count() == 3
+        assert check.query(Classification).count() == 3
+        moves = check.query(Action).filter(Action.action_type == ActionType.MOVE.value)
+        assert moves.count() == 3
+        check.close()
+        session.close()
+        database.close()
+
+    def test_record_classification_upserts_file(self, config, tmp_path):
+        """Test recording the same path twice updates one file row."""
+        from fileassistant.database import Classification, Database, File, FileStatus
+
+        database = Database(tmp_path / "test.db")
+        database.create_all_tables()
+        session = database.get_session()
+        processor = FileProcessor(config=config, db_session=session)
+
+        file_path = tmp_path / "report.PDF"
+        classification = ClassificationResult(
+            file_path=file_path,
+            filename=file_path.name,
+            destination_folder="Documents",
+            success=True,
+        )
+
+        result = ProcessingResult(
+            file_path=file_path,
+            filename=file_path.name,
+            classification=classification,
+            user_decision=UserDecision.SKIP,
+        )
+        processor._record_classification(result, None)
+        result.user_decision = UserDecision.ACCEPT
+        processor._record_classification(result, "Documents")
+
+        record = session.query(File).one()
+        assert record.extension == ".pdf"
+        assert record.status == FileStatus.PROCESSED.value
+        classifications = session.query(Classification).filter_by(file_id=record.id).all()
+        assert len(classifications) == 2
+        assert all(c.suggested_tags is None and c.final_tags is None for c in classifications)
+        session.close()
+        database.close()
+
+    @patch("fileassistant.core.processor.FileProcessor._display_classification")
+    @patch("fileassistant.mover.FileMover.move")
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
+    def test_process_file_quiet_non_interactive_skips_display(
+        self,
+        mock_analyze,
+        mock_classify,
+        mock_move,
+        mock_display,
+        processor,
+        test_file,
+        make_analysis,
+    ):
+        """Test the classification panel is skipped when unattended and INFO is off."""
+        from fileassistant.core import processor as processor_module
+
+        mock_analyze.return_value = make_analysis(test_file)
+        mock_classify.return_value = ClassificationResult(
+            file_path=test_file,
+            filename="test.txt",
+            destination_folder="Documents",
+            success=True,
+        )
+        mock_move.return_value = MoveResult(
+            source_path=test_file,
+            destination_path=test_file,
+            filename="test.txt",
+            success=True,
+        )
+
+        with patch.object(processor_module.logger, "isEnabledFor", return_value=False):
+            result = processor.process_file(test_file, interactive=False)
+
+        assert result.success
+        mock_display.assert_not_called()
+
+    @patch("rich.prompt.Prompt.ask")
+    def test_get_user_decision(self, mock_ask, processor):
+        """Test prompt answers map to decisions and edits retry on empty input."""
+        classification = ClassificationResult(
+            file_path=Path("/test.txt"),
+            filename="test.txt",
+            destination_folder="Documents",
+        )
+
+        mock_ask.side_effect = ["yes"]
+        assert processor._get_user_decision(classification) == (UserDecision.ACCEPT, None)
+
+        mock_ask.side_effect = ["s"]
+        assert processor._get_user_decision(classification) == (UserDecision.SKIP, None)
+
+        mock_ask.side_effect = ["e", "/", "edit", "\\Projects\\Personal/"]
+        assert processor._get_user_decision(classification) == (
+            UserDecision.EDIT,
+            "Projects/Personal",
+        )
+
+    @patch("fileassistant.classifier.FileClassifier.classify")
+    @patch("fileassistant.analyzer.FileAnalyzer.analyze")
+    def test_process_file_refreshes_stale_folder_context(
+        self, mock_analyze, mock_classify, processor, test_file, make_analysis
+    ):
+        """Test a folder context older than the TTL is rescanned."""
+        import time
+        from concurrent.futures import Future
+
+        from fileassistant.utils import FolderScanResult
+
+        mock_analyze.return_value = make_analysis(test_file)
+        mock_classify.return_value = ClassificationResult(
+            file_path=test_file,
+            filename="test.txt",
+            destination_folder="Unsorted",
+            success=False,
+        )
+
+        old_context = FolderScanResult(total_folders=1)
+        new_context = FolderScanResult(total_folders=2)
+        rescan = Future()
+        rescan.set_result(new_context)
+        processor._scan_executor = MagicMock()
+        processor._scan_executor.submit.return_value = rescan
+
+        # A fresh context is reused as is
+        processor._folder_context = old_context
+        processor._folder_context_time = time.monotonic()
+        processor.process_file(test_file, interactive=False)
+        processor._scan_executor.submit.assert_not_called()
+        assert mock_classify.call_args.kwargs["folder_context"] is old_context
+
+        # A stale one is replaced by the rescan
+        processor._folder_context_time -= 3600
+        processor.process_file(test_file, interactive=False)
+        processor._scan_executor.submit.assert_called_once()
+        assert mock_classify.call_args.kwargs["folder_context"] is new_context
+
+    def test_close_shuts_down_scan_thread(self, processor):
+        """Test close() stops the background folder scan executor."""
+        processor.close()
+
+        with pytest.raises(RuntimeError):
+            processor._scan_executor.submit(lambda: None)
@@ -158,6 +158,13 @@ class TestSearchEngineFilters:
 
         assert result == {"extension": {"$in": [".pdf", ".docx", ".txt"]}}
 
+    def test_build_chroma_filter_extension_frozenset(self, mock_engine):
+        """Test building filter from a frozenset of extensions."""
+        filters = {"extension": frozenset({".txt", ".pdf"})}
+        result = mock_engine._build_chroma_filter(filters)
+
+        assert result == {"extension": {"$in": [".pdf", ".txt"]}}
+
     def test_build_chroma_filter_file_type(self, mock_engine):
         """Test building filter with file type."""
         filters = {"file_type": "document"}
@@ -417,6 +424,7 @@ class TestSearchEngineSearch:
 
                 results = engine.search("test query")
                 assert results == []
+                assert engine.last_indexed_count == 0
 
     def test_search_embedding_failure(self):
         """Test search when embedding generation fails."""
@@ -435,6 +443,32 @@ class TestSearchEngineSearch:
 
                 assert results == []
 
+    def test_search_normalizes_query_whitespace(self):
+        """Test that spacing variants of a query embed the same text."""
+        with patch("fileassistant.search.engine.IndexManager") as mock_im:
+            with patch("fileassistant.search.engine.EmbeddingGenerator") as mock_eg:
+                mock_im.return_value.get_indexed_count.return_value = 10
+                mock_im.return_value.search.return_value = []
+
+                engine = SearchEngine()
+                engine.search("  tax \n documents  2024 ")
+
+                mock_eg.return_value.generate.assert_called_once_with("tax documents 2024")
+
+    def test_search_fetch_limit(self):
+        """Test that results are over-fetched only when post-filters apply."""
+        with patch("fileassistant.search.engine.IndexManager") as mock_im:
+            with patch("fileassistant.search.engine.EmbeddingGenerator"):
+                mock_im.return_value.get_indexed_count.return_value = 10
+                mock_im.return_value.search.return_value = []
+                engine = SearchEngine()
+
+                engine.search("test query", limit=10)
+                assert mock_im.return_value.search.call_args.kwargs["n_results"] == 10
+
+                engine.search("test query", filters={"tag": "work"}, limit=10)
+                assert mock_im.return_value.search.call_args.kwargs["n_results"] == 20
+
     def test_search_success(self):
         """Test successful search."""
         with patch("fileassistant.search.engine.IndexManager") as mock_im:
@@ -510,6 +544,17 @@ class TestSearchEngineSearch:
                 mock_im.return_value.get_indexed_count.return_value = 5
                 assert engine.is_index_empty() is False
 
+    def test_warm_up_swallows_model_errors(self):
+        """Test that warm-up failures are logged rather than raised."""
+        with patch("fileassistant.search.engine.IndexManager"):
+            with patch("fileassistant.search.engine.EmbeddingGenerator") as mock_eg:
+                mock_eg.return_value._get_model.side_effect = RuntimeError("no model")
+                engine = SearchEngine()
+
+                engine.warm_up()
+
+                mock_eg.return_value._get_model.assert_called_once()
+
 
 # Skip ChromaDB-dependent integration tests on Python 3.14+
 def check_chromadb_available():
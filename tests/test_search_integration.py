@@ -230,7 +230,7 @@ class TestSearchPipelineIntegration:
         assert result2.success is True
 
         # Embeddings should be identical for same input
-        assert result1.embedding == result2.embedding
+        assert result1.embedding.tolist() == result2.embedding.tolist()
 
     @pytest.mark.slow
     def test_chunking_produces_valid_embeddings(self, embedding_generator):
@@ -61,6 +61,15 @@ class TestDebouncedFileHandler:
         assert handler._is_supported(Path("file.abc"))
         assert not handler._is_supported(Path("file.txt"))
 
+    def test_filters_accept_string_paths(self):
+        """Test filtering event paths given as plain strings."""
+        handler = DebouncedFileHandler(callback=MagicMock())
+        assert handler._is_supported("/inbox/Report.PDF")
+        assert not handler._is_supported("/inbox.d/README")
+        assert handler._should_ignore("/inbox/.hidden.txt")
+        assert handler._should_ignore("/inbox/notes.txt~")
+        assert not handler._should_ignore("/inbox.tmp/notes.txt")
+
     def test_debounce_callback(self, tmp_path):
         """Test that callback is called after debounce period."""
         callback = MagicMock()